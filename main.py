@@ -39,6 +39,7 @@ def main():
     }
 
     running = True
+    last_state = gs.state
     while running:
         dt = clock.tick(FPS) / 1000.0
         current_screen = screens.get(gs.state)
@@ -67,6 +68,11 @@ def main():
                 except TypeError:
                     current_screen.update(dt, gs)
 
+        # ── Leaving combat (won, lost or Escape) stops its hint search worker ──
+        if last_state == STATE_COMBAT and gs.state != STATE_COMBAT:
+            screens[STATE_COMBAT].close()
+        last_state = gs.state
+
         # ── Draw ──
         current_screen = screens.get(gs.state)
         if current_screen:
@@ -81,6 +87,7 @@ def main():
 
         pygame.display.flip()
 
+    screens[STATE_COMBAT].close()
     pygame.quit()
     sys.exit()
 
@@ -45,6 +45,12 @@ CARD_W = 120
 CARD_H = 170
 CARD_HAND_Y = SCREEN_HEIGHT - CARD_H - 20
 
+# Combat hint search (seconds of MCTS per position, in a background worker process)
+HINT_SEARCH_SECONDS = 1.5
+AUTO_PLAY_DELAY = 0.35  # Seconds between plays when the turn solver finishes a turn
+AUTO_SOLVE_SECONDS = 2.0      # Turn solver budget for the AUTO TURN button, in a worker process
+AUTO_SOLVE_POSITIONS = 8_000  # and its position cap; past either the plan is best-effort
+
 # Game settings
 STARTING_HP = 80
 STARTING_ENERGY = 3
@@ -54,6 +60,8 @@ STARTING_GOLD = 0
 # Floor settings
 BOSS_EVERY = 5       # Boss appears every N floors
 ELITE_FLOOR_MIN = 3  # Elites don't appear before this floor
+ENDLESS_LOOKAHEAD = 3    # Endless mode: floors generated ahead of the player
+ENDLESS_KEEP_BEHIND = 2  # Endless mode: completed floors kept below the player
 
 # Merchant prices
 CARD_PRICE_MIN = 50
@@ -62,11 +70,14 @@ RELIC_PRICE = 200
 REMOVE_PRICE = 75
 
 # Difficulty scaling per floor
+ENEMY_HP_SCALE_PER_FLOOR  = 0.15
+ENEMY_DMG_SCALE_PER_FLOOR = 0.12
+
 def enemy_hp_scale(floor: int) -> float:
-    return 1.0 + (floor - 1) * 0.15
+    return 1.0 + (floor - 1) * ENEMY_HP_SCALE_PER_FLOOR
 
 def enemy_dmg_scale(floor: int) -> float:
-    return 1.0 + (floor - 1) * 0.12
+    return 1.0 + (floor - 1) * ENEMY_DMG_SCALE_PER_FLOOR
 
 # Node type weights (floor-dependent)
 def get_node_weights(floor: int) -> dict:
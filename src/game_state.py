@@ -7,10 +7,13 @@ from src.models.hero import Hero
 from src.models.card import get_starter_deck
 from src.models.relic import get_starter_relic
 from src.systems.dungeon import Dungeon, NODE_ENEMY, NODE_ELITE, NODE_BOSS, NODE_CHEST, NODE_MERCHANT, NODE_EVENT
+from src.systems.rng import GameRng
 
 
 class GameState:
-    def __init__(self):
+    def __init__(self, seed: int = None):
+        self.seed = seed          # None: every new run is seeded from the OS
+        self.rng = GameRng(seed)
         self.state = STATE_MAIN_MENU
         self.hero: Hero = None
         self.dungeon: Dungeon = None
@@ -20,13 +23,15 @@ class GameState:
         self.chest_reward = None
         self.current_event = None
         self.previous_state = None
+        self.record_events = True  # Combat event log; headless runs switch it off
 
-    def new_game(self):
-        """Initialize a fresh run."""
-        self.hero = Hero()
+    def new_game(self, seed: int = None, endless: bool = False):
+        """Initialize a fresh run. Endless runs generate floors as the player climbs."""
+        self.rng = GameRng(seed if seed is not None else self.seed)
+        self.hero = Hero(rng=self.rng)
         self.hero.deck = get_starter_deck()
         self.hero.add_relic(get_starter_relic())
-        self.dungeon = Dungeon()
+        self.dungeon = Dungeon(rng=self.rng.map, endless=endless)
         self.combat_state = None
         self.card_reward_pool = []
         self.go_to(STATE_MAP)
@@ -61,37 +66,36 @@ class GameState:
         from src.systems.combat import CombatState
         floor = node.floor
         if node.node_type == NODE_ELITE:
-            enemies = [get_elite_for_floor(floor)]
+            enemies = [get_elite_for_floor(floor, rng=self.rng.combat)]
         else:
-            enemies = [get_enemy_for_floor(floor)]
-        self.combat_state = CombatState(self.hero, enemies)
+            enemies = [get_enemy_for_floor(floor, rng=self.rng.combat)]
+        self.combat_state = CombatState(self.hero, enemies, record_events=self.record_events)
         self.combat_state.start_combat()
         self.go_to(STATE_COMBAT)
 
     def _open_chest(self):
         from src.models.relic import get_chest_reward
-        import random
         # Chest gives gold + sometimes a relic
-        gold = random.randint(25, 60)
+        gold = self.rng.rewards.randint(25, 60)
         self.hero.gold += gold
-        relic = get_chest_reward()
+        relic = get_chest_reward(self.hero.relic_names, rng=self.rng.rewards)
         self.chest_reward = {"gold": gold, "relic": relic}
         self.go_to(STATE_CHEST)
 
     def _open_merchant(self):
         from src.models.card import get_merchant_cards
-        self.merchant_cards = get_merchant_cards(5)
+        self.merchant_cards = get_merchant_cards(5, rng=self.rng.rewards)
         self.go_to(STATE_MERCHANT)
 
     def _trigger_event(self):
         from src.systems.dungeon import get_random_event
-        self.current_event = get_random_event()
+        self.current_event = get_random_event(rng=self.rng.events)
         self.go_to(STATE_EVENT)
 
     def combat_won(self):
         """Called after combat victory."""
         from src.models.card import get_reward_cards
-        self.card_reward_pool = get_reward_cards(n=3)
+        self.card_reward_pool = get_reward_cards(n=3, rng=self.rng.rewards)
         self.dungeon.complete_current_node()
         self.go_to(STATE_CARD_REWARD)
 
@@ -111,11 +115,35 @@ class GameState:
         self.dungeon.complete_current_node()
         self.go_to(STATE_MAP)
 
+    def buy_merchant_card(self, index: int):
+        """Buy the card at `index` in the merchant stock. Returns it, or None if too poor."""
+        card, price = self.merchant_cards[index]
+        if self.hero.gold < price:
+            return None
+        self.hero.gold -= price
+        self.hero.add_card_to_deck(card)
+        self.merchant_cards.pop(index)
+        return card
+
+    def buy_card_removal(self):
+        """Pay the merchant to remove a random card. Returns it, or None if not allowed."""
+        if self.hero.gold < REMOVE_PRICE or len(self.hero.deck) <= 1:
+            return None
+        card = self.rng.rewards.choice(self.hero.deck)
+        self.hero.remove_card_from_deck(card)
+        self.hero.gold -= REMOVE_PRICE
+        return card
+
     def complete_merchant(self):
         self.merchant_cards = []
         self.dungeon.complete_current_node()
         self.go_to(STATE_MAP)
 
+    def choose_event_option(self, index: int) -> str:
+        """Apply an event choice to the hero. Returns the result message."""
+        result = self.current_event.choices[index].effect_fn(self.hero)
+        return str(result) if result else "Done."
+
     def complete_event(self):
         self.current_event = None
         self.dungeon.complete_current_node()
@@ -59,6 +59,7 @@ STRINGS = {
         "map.current":        "► CURRENT",
         "map.done":           "✓ Done",
         "map.enter":          "Enter",
+        "map.suggested":      "Suggested path",
 
         # ── Node types ──
         "node.enemy":         "ENEMY",
@@ -77,6 +78,28 @@ STRINGS = {
         "combat.target_hint": "Click an enemy to target",
         "combat.played":      "Played:",
         "combat.log_title":   "Combat Log",
+        "combat.hint":        "Hint:",
+        "combat.hint_wait":   "Hint: thinking...",
+        "combat.hint_key":    "[H] Hint",
+        "combat.playouts":    "playouts/s",
+        "combat.auto_turn":   "AUTO TURN",
+        "combat.solving":     "Planning the turn...",
+
+        # ── Combat log ──
+        "log.card_played":         "Played: {card}",
+        "log.damage.attack":       "{source} attacks for {amount} damage!",
+        "log.damage.Juggernaut":   "Juggernaut deals {amount} damage to {target}!",
+        "log.damage.Burn":         "{target} burns for {amount} damage!",
+        "log.damage.Poison":       "{target} is poisoned for {amount} damage!",
+        "log.damage.Brutality":    "Brutality: lost {amount} HP, drew 1 card.",
+        "log.damage.Combust":      "Combust: lost {amount} HP.",
+        "log.block.defend":        "{target} gains {amount} Block.",
+        "log.block.Metallicize":   "Metallicize: gained {amount} Block.",
+        "log.status.buff":         "{source} buffs itself! ({status} {stacks:+d})",
+        "log.status.debuff":       "{source} debuffs you! ({status} {stacks:+d})",
+        "log.status.Ritual":       "{target} performs a ritual, gaining {stacks} Strength!",
+        "log.heal.heal":           "{target} heals {amount} HP.",
+        "log.heal.Regeneration":   "{target} regenerates {amount} HP!",
 
         # ── Card types ──
         "card.attack":        "Attack",
@@ -368,6 +391,7 @@ STRINGS = {
         "map.current":        "► ACTUEL",
         "map.done":           "✓ Fait",
         "map.enter":          "Entrer",
+        "map.suggested":      "Chemin conseillé",
 
         # ── Node types ──
         "node.enemy":         "ENNEMI",
@@ -386,6 +410,28 @@ STRINGS = {
         "combat.target_hint": "Cliquez sur un ennemi pour cibler",
         "combat.played":      "Joué :",
         "combat.log_title":   "Journal de Combat",
+        "combat.hint":        "Conseil :",
+        "combat.hint_wait":   "Conseil : réflexion...",
+        "combat.hint_key":    "[H] Conseil",
+        "combat.playouts":    "simulations/s",
+        "combat.auto_turn":   "TOUR AUTO",
+        "combat.solving":     "Planification du tour...",
+
+        # ── Combat log ──
+        "log.card_played":         "Jouée : {card}",
+        "log.damage.attack":       "{source} attaque pour {amount} dégâts !",
+        "log.damage.Juggernaut":   "Juggernaut inflige {amount} dégâts à {target} !",
+        "log.damage.Burn":         "{target} brûle et subit {amount} dégâts !",
+        "log.damage.Poison":       "{target} est empoisonné : {amount} dégâts !",
+        "log.damage.Brutality":    "Brutalité : -{amount} PV, 1 carte piochée.",
+        "log.damage.Combust":      "Combustion : -{amount} PV.",
+        "log.block.defend":        "{target} gagne {amount} Bouclier.",
+        "log.block.Metallicize":   "Plastron de Métal : +{amount} Bouclier.",
+        "log.status.buff":         "{source} se renforce ! ({status} {stacks:+d})",
+        "log.status.debuff":       "{source} vous affaiblit ! ({status} {stacks:+d})",
+        "log.status.Ritual":       "{target} accomplit un rituel : +{stacks} Force !",
+        "log.heal.heal":           "{target} récupère {amount} PV.",
+        "log.heal.Regeneration":   "{target} régénère {amount} PV !",
 
         # ── Card types ──
         "card.attack":        "Attaque",
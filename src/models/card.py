@@ -5,6 +5,9 @@ from __future__ import annotations
 import random
 from typing import TYPE_CHECKING, Callable, Optional
 
+from src.models.power import make_power
+from src.systems.sampling import AliasTable, TableCache
+
 if TYPE_CHECKING:
     from src.models.hero import Hero
     from src.models.enemy import Enemy
@@ -22,6 +25,14 @@ STARTER  = "Starter"
 
 
 class Card:
+    """Shared, immutable card definition.
+
+    There is exactly one instance per name (see ALL_CARDS): decks and piles hold
+    references to it, so a pile entry is identified by its index, not the object.
+    """
+    __slots__ = ("id", "name", "cost", "card_type", "rarity", "description",
+                 "effect_fn", "targeted", "exhausts")
+
     def __init__(
         self,
         name: str,
@@ -33,24 +44,38 @@ class Card:
         targeted: bool = True,
         exhausts: bool = False,
     ):
-        self.name = name
-        self.cost = cost
-        self.card_type = card_type
-        self.rarity = rarity
-        self.description = description
-        self.effect_fn = effect_fn
-        self.targeted = targeted   # Does it need an enemy target?
-        self.exhausts = exhausts   # Removed from deck after use
+        init = object.__setattr__
+        init(self, "id", -1)            # Index into CARDS_BY_ID once registered
+        init(self, "name", name)
+        init(self, "cost", cost)
+        init(self, "card_type", card_type)
+        init(self, "rarity", rarity)
+        init(self, "description", description)
+        init(self, "effect_fn", effect_fn)
+        init(self, "targeted", targeted)   # Does it need an enemy target?
+        init(self, "exhausts", exhausts)   # Removed from deck after use
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"Card definitions are immutable: {self.name}.{name}")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"Card definitions are immutable: {self.name}.{name}")
 
     def play(self, hero: "Hero", target: Optional["Enemy"] = None, enemies: list = None):
         """Execute this card's effect."""
         self.effect_fn(hero, target, enemies or [])
 
     def copy(self) -> "Card":
-        return Card(
-            self.name, self.cost, self.card_type, self.rarity,
-            self.description, self.effect_fn, self.targeted, self.exhausts
-        )
+        return self
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __reduce__(self):
+        return make_card, (self.name,)
 
     def __repr__(self):
         return f"Card({self.name}, cost={self.cost})"
@@ -60,8 +85,8 @@ class Card:
 # Helper imports (deferred to avoid circular)
 # ─────────────────────────────────────────────
 def _apply_status(target, name: str, stacks: int):
-    from src.models.status import make_status
-    target.apply_status(make_status(name, stacks))
+    from src.models.status import status_id
+    target.add_status(status_id(name), stacks)
 
 
 # ─────────────────────────────────────────────
@@ -74,7 +99,7 @@ def _strike(hero, target, enemies):
         target.take_damage(dmg, attacker=hero)
 
 def _defend(hero, target, enemies):
-    hero.gain_block(5 + hero.get_dexterity())
+    hero.gain_block(hero.calc_block(5))
 
 def _bash(hero, target, enemies):
     dmg = hero.calc_damage(8)
@@ -88,8 +113,8 @@ def _heavy_blade(hero, target, enemies):
         target.take_damage(dmg, attacker=hero)
 
 def _twin_strike(hero, target, enemies):
+    dmg = hero.calc_damage(5)
     for _ in range(2):
-        dmg = hero.calc_damage(5)
         if target:
             target.take_damage(dmg, attacker=hero)
 
@@ -108,7 +133,7 @@ def _iron_wave(hero, target, enemies):
     dmg = hero.calc_damage(5)
     if target:
         target.take_damage(dmg, attacker=hero)
-    hero.gain_block(5 + hero.get_dexterity())
+    hero.gain_block(hero.calc_block(5))
 
 def _cleave(hero, target, enemies):
     dmg = hero.calc_damage(8)
@@ -116,8 +141,8 @@ def _cleave(hero, target, enemies):
         e.take_damage(dmg, attacker=hero)
 
 def _whirlwind(hero, target, enemies):
+    dmg = hero.calc_damage(5)
     for _ in range(hero.energy):
-        dmg = hero.calc_damage(5)
         for e in enemies:
             e.take_damage(dmg, attacker=hero)
     hero.energy = 0
@@ -130,10 +155,11 @@ def _perfected_strike(hero, target, enemies):
         target.take_damage(dmg, attacker=hero)
 
 def _sword_boomerang(hero, target, enemies):
+    dmg = hero.calc_damage(3)
     for _ in range(3):
         if enemies:
-            e = random.choice(enemies)
-            e.take_damage(hero.calc_damage(3), attacker=hero)
+            e = hero.rng.combat.choice(enemies)
+            e.take_damage(dmg, attacker=hero)
 
 def _thunderclap(hero, target, enemies):
     dmg = hero.calc_damage(4)
@@ -146,23 +172,21 @@ def _headbutt(hero, target, enemies):
     if target:
         target.take_damage(dmg, attacker=hero)
     if hero.discard_pile:
-        card = random.choice(hero.discard_pile)
-        hero.discard_pile.remove(card)
-        hero.draw_pile.insert(0, card)
+        i = hero.rng.combat.randrange(len(hero.discard_pile))
+        hero.draw_pile.insert(0, hero.discard_pile.pop(i))
 
 def _shrug_it_off(hero, target, enemies):
-    hero.gain_block(8 + hero.get_dexterity())
+    hero.gain_block(hero.calc_block(8))
     hero.draw_cards(1)
 
 def _true_grit(hero, target, enemies):
-    hero.gain_block(7 + hero.get_dexterity())
+    hero.gain_block(hero.calc_block(7))
     if hero.hand:
-        card = random.choice(hero.hand)
-        hero.hand.remove(card)
-        hero.exhaust_pile.append(card)
+        i = hero.rng.combat.randrange(len(hero.hand))
+        hero.exhaust_card(hero.hand.pop(i))
 
 def _armaments(hero, target, enemies):
-    hero.gain_block(5 + hero.get_dexterity())
+    hero.gain_block(hero.calc_block(5))
     # Upgrade a random card in hand (simplified: give +1 damage description)
     hero.draw_cards(1)
 
@@ -177,25 +201,22 @@ def _bloodletting(hero, target, enemies):
 
 def _second_wind(hero, target, enemies):
     non_attacks = [c for c in hero.hand if c.card_type != ATTACK]
-    block_gained = 0
-    for c in non_attacks:
-        hero.hand.remove(c)
-        hero.exhaust_pile.append(c)
-        block_gained += 5
-    hero.gain_block(block_gained)
+    hero.hand[:] = [c for c in hero.hand if c.card_type == ATTACK]
+    for card in non_attacks:
+        hero.exhaust_card(card)
+    hero.gain_block(5 * len(non_attacks))
 
 def _entrench(hero, target, enemies):
     hero.gain_block(hero.block)
 
 def _flame_barrier(hero, target, enemies):
-    hero.gain_block(12 + hero.get_dexterity())
+    hero.gain_block(hero.calc_block(12))
     _apply_status(hero, "Thorns", 4)
 
 def _burning_pact(hero, target, enemies):
     if hero.hand:
-        card = random.choice(hero.hand)
-        hero.hand.remove(card)
-        hero.exhaust_pile.append(card)
+        i = hero.rng.combat.randrange(len(hero.hand))
+        hero.exhaust_card(hero.hand.pop(i))
         hero.draw_cards(2)
 
 def _offering(hero, target, enemies):
@@ -215,7 +236,7 @@ def _limit_break(hero, target, enemies):
     _apply_status(hero, "Strength", str_val)
 
 def _spot_weakness(hero, target, enemies):
-    if target and target.next_action and target.next_action.get("type") == "attack":
+    if target and target.next_action and target.next_action.type == "attack":
         _apply_status(hero, "Strength", 3)
 
 def _impervious(hero, target, enemies):
@@ -225,7 +246,7 @@ def _barricade(hero, target, enemies):
     hero.barricade = True  # Block no longer resets
 
 def _juggernaut(hero, target, enemies):
-    hero.juggernaut = True  # Gaining block deals damage
+    hero.add_power(make_power("Juggernaut"))
 
 def _corruption(hero, target, enemies):
     hero.corruption = True  # Skills cost 0 but exhaust
@@ -240,23 +261,24 @@ def _feed(hero, target, enemies):
 
 def _reaper(hero, target, enemies):
     total = 0
+    dmg = hero.calc_damage(4)
     for e in enemies:
-        dmg = hero.calc_damage(4)
         e.take_damage(dmg, attacker=hero)
         total += dmg
     hero.heal(total)
 
 def _fiend_fire(hero, target, enemies):
-    n = len(hero.hand)
-    for c in list(hero.hand):
-        hero.hand.remove(c)
-        hero.exhaust_pile.append(c)
+    burned = list(hero.hand)
+    n = len(burned)
+    hero.hand.clear()
+    for card in burned:
+        hero.exhaust_card(card)
     dmg = hero.calc_damage(7 * n)
     if target:
         target.take_damage(dmg, attacker=hero)
 
 def _sentinel(hero, target, enemies):
-    hero.gain_block(13 + hero.get_dexterity())
+    hero.gain_block(hero.calc_block(13))
     # If exhausted, gain 2 energy — simplified: just block
 
 def _seeing_red(hero, target, enemies):
@@ -267,32 +289,32 @@ def _wild_strike(hero, target, enemies):
     if target:
         target.take_damage(dmg, attacker=hero)
     # Add a wound to draw pile
-    hero.draw_pile.append(make_card("Wound"))
+    hero.add_status_card(make_card("Wound"))
 
 def _wound_effect(hero, target, enemies):
     pass  # Wound does nothing, just clogs hand
 
 def _dark_embrace(hero, target, enemies):
-    hero.dark_embrace = True  # Draw a card whenever you exhaust
+    hero.add_power(make_power("Dark Embrace"))
 
 def _evolve(hero, target, enemies):
-    hero.evolve = True  # Draw a card when you receive a status card
+    hero.add_power(make_power("Evolve"))
 
 def _feel_no_pain(hero, target, enemies):
-    hero.feel_no_pain = True  # Gain block whenever you exhaust
+    hero.add_power(make_power("Feel No Pain"))
 
 def _metallicize(hero, target, enemies):
-    hero.metallicize = (hero.metallicize or 0) + 3  # Gain 3 block at end of turn
+    hero.add_power(make_power("Metallicize", 3))
 
 def _combust(hero, target, enemies):
-    hero.combust = (hero.combust or 0) + 1  # Lose 1 HP, deal 5 damage to all at end of turn
+    hero.add_power(make_power("Combust", 1))
 
 def _brutality(hero, target, enemies):
-    hero.brutality = True  # Lose 1 HP, draw 1 card at start of turn
+    hero.add_power(make_power("Brutality"))
 
 def _berserk(hero, target, enemies):
     _apply_status(hero, "Vulnerable", 2)
-    hero.berserk = True  # Gain 1 energy at start of turn
+    hero.add_power(make_power("Berserk"))
 
 
 # ─────────────────────────────────────────────
@@ -300,9 +322,12 @@ def _berserk(hero, target, enemies):
 # ─────────────────────────────────────────────
 
 ALL_CARDS: dict[str, Card] = {}
+CARDS_BY_ID: list[Card] = []
 
 
 def _register(card: Card):
+    object.__setattr__(card, "id", len(CARDS_BY_ID))
+    CARDS_BY_ID.append(card)
     ALL_CARDS[card.name] = card
     return card
 
@@ -381,10 +406,11 @@ _build_card_pool()
 
 
 def make_card(name: str) -> Card:
-    """Return a fresh copy of a named card."""
-    if name not in ALL_CARDS:
+    """Return the shared definition of a named card."""
+    card = ALL_CARDS.get(name)
+    if card is None:
         raise ValueError(f"Unknown card: {name}")
-    return ALL_CARDS[name].copy()
+    return card
 
 
 def get_starter_deck() -> list[Card]:
@@ -397,40 +423,34 @@ def get_starter_deck() -> list[Card]:
     return deck
 
 
-def get_reward_cards(rarity_weights=None, n=3) -> list[Card]:
-    """Return N random cards suitable as combat rewards."""
-    if rarity_weights is None:
-        rarity_weights = {COMMON: 60, UNCOMMON: 30, RARE: 10}
+# Alias tables over the registry; len(CARDS_BY_ID) is the pool version
+_REWARD_TABLES = TableCache()
 
-    pool = [c for c in ALL_CARDS.values()
-            if c.rarity in rarity_weights and c.name not in ("Wound",)]
 
-    # Weighted sample
-    weighted = []
-    for c in pool:
-        weighted.extend([c] * rarity_weights.get(c.rarity, 0))
+def _reward_table(rarity_weights: dict) -> AliasTable:
+    def build():
+        pool = [c for c in CARDS_BY_ID
+                if c.rarity in rarity_weights and c.name not in ("Wound",)]
+        return AliasTable(pool, [rarity_weights[c.rarity] for c in pool])
+    return _REWARD_TABLES.get(tuple(rarity_weights.items()), build, len(CARDS_BY_ID))
 
-    chosen = []
-    seen = set()
-    random.shuffle(weighted)
-    for c in weighted:
-        if c.name not in seen:
-            chosen.append(c.copy())
-            seen.add(c.name)
-        if len(chosen) == n:
-            break
-    return chosen
+
+def get_reward_cards(rarity_weights=None, n=3, rng=None) -> list[Card]:
+    """Return N random cards suitable as combat rewards."""
+    rng = rng or random
+    if rarity_weights is None:
+        rarity_weights = {COMMON: 60, UNCOMMON: 30, RARE: 10}
+    return _reward_table(rarity_weights).sample_distinct(rng, n)
 
 
-def get_merchant_cards(n=5) -> list[tuple[Card, int]]:
+def get_merchant_cards(n=5, rng=None) -> list[tuple[Card, int]]:
     """Return N cards with prices for the merchant."""
-    import random as _r
     from src.constants import CARD_PRICE_MIN, CARD_PRICE_MAX
-    pool = [c for c in ALL_CARDS.values()
-            if c.rarity not in (STARTER,) and c.name not in ("Wound",)]
-    chosen = _r.sample(pool, min(n, len(pool)))
-    result = []
-    for c in chosen:
-        price = _r.randint(CARD_PRICE_MIN, CARD_PRICE_MAX)
-        result.append((c.copy(), price))
-    return result
+    rng = rng or random
+
+    def build():
+        pool = [c for c in CARDS_BY_ID
+                if c.rarity not in (STARTER,) and c.name not in ("Wound",)]
+        return AliasTable(pool, [1] * len(pool))
+    chosen = _REWARD_TABLES.get("merchant", build, len(CARDS_BY_ID)).sample_distinct(rng, n)
+    return [(c, rng.randint(CARD_PRICE_MIN, CARD_PRICE_MAX)) for c in chosen]
@@ -0,0 +1,107 @@
+"""
+Combatant — the HP, block and status core shared by Hero and Enemy.
+"""
+from __future__ import annotations
+from typing import Optional
+
+from src.models.status import StatusEffect, StatusSet, THORNS
+from src.systems.modifiers import Modifiers, NO_MODIFIERS, compose
+
+
+class Combatant:
+    __slots__ = ("name", "max_hp", "current_hp", "block", "statuses", "_mods", "_mods_version")
+
+    def __init__(self, name: str, max_hp: int):
+        self.name = name
+        self.max_hp = max_hp
+        self.current_hp = max_hp
+        self.block = 0
+        self.statuses = StatusSet()
+        self._mods = NO_MODIFIERS  # Composed from the statuses at _mods_version
+        self._mods_version = 0
+
+    def _copy_core(self, new: "Combatant"):
+        """Copy the shared fields onto `new` (a clone), with its own statuses."""
+        new.name = self.name
+        new.max_hp = self.max_hp
+        new.current_hp = self.current_hp
+        new.block = self.block
+        new.statuses = self.statuses.clone()
+        new._mods = self._mods
+        new._mods_version = self._mods_version
+
+    # ── HP ──────────────────────────────────────────────────────────────────
+
+    def take_damage(self, amount: int, ignore_block: bool = False, attacker=None):
+        """`ignore_block` marks HP loss (Burn, card costs) rather than an attack:
+        it skips block, Vulnerable and Thorns."""
+        if amount <= 0:
+            return
+        if not ignore_block:
+            amount = self.modifiers().taken(amount)
+            thorns = self.statuses.counts[THORNS]
+            if attacker and thorns > 0:
+                attacker.take_damage(thorns, ignore_block=True)
+            absorbed = min(self.block, amount)
+            self.block -= absorbed
+            amount -= absorbed
+        if amount > 0:
+            self.current_hp = max(0, self.current_hp - self._hp_lost(amount))
+
+    def _hp_lost(self, amount: int) -> int:
+        """HP actually lost when `amount` gets past block. Hero relics adjust it."""
+        return amount
+
+    def heal(self, amount: int):
+        self.current_hp = min(self.max_hp, self.current_hp + amount)
+
+    def is_dead(self) -> bool:
+        return self.current_hp <= 0
+
+    # ── Block ────────────────────────────────────────────────────────────────
+
+    def gain_block(self, amount: int):
+        if amount > 0:
+            self.block += amount
+            self._block_gained(amount)
+
+    def _block_gained(self, amount: int):
+        pass
+
+    def reset_block(self):
+        self.block = 0
+
+    # ── Statuses ─────────────────────────────────────────────────────────────
+
+    def apply_status(self, status: StatusEffect):
+        self.statuses.apply(status)
+
+    def add_status(self, status_id: int, stacks: int):
+        self.statuses.add(status_id, stacks)
+
+    def _get_status(self, name: str) -> Optional[StatusEffect]:
+        return self.statuses.get_named(name)
+
+    def tick_statuses(self):
+        self.statuses.tick(self)
+
+    # ── Damage / Block Modifiers ─────────────────────────────────────────────
+
+    def modifiers(self) -> Modifiers:
+        """Damage / block modifiers, recomposed only after the statuses change
+        (the hero also invalidates them when it gains a relic or power)."""
+        version = self.statuses.version
+        if version != self._mods_version:
+            self._mods = compose(self.statuses, self._modifier_sources())
+            self._mods_version = version
+        return self._mods
+
+    def _modifier_sources(self) -> tuple:
+        """Non-status contributors to modifiers() (the hero's relics and powers)."""
+        return ()
+
+    def calc_damage(self, base: int) -> int:
+        return self.modifiers().attack(base)
+
+    def calc_block(self, base: int) -> int:
+        return self.modifiers().block(base)
@@ -3,24 +3,34 @@ Enemy model and enemy pool.
 """
 from __future__ import annotations
 import random
+from dataclasses import dataclass
+from functools import lru_cache
 from typing import Optional
-from src.models.status import StatusEffect, make_status
+from src.models.combatant import Combatant
+from src.models.status import status_id
+from src.systems.events import NO_EVENTS, DamageDealt, BlockGained, StatusApplied
+from src.systems.sampling import AliasTable, TableCache
+from src.systems.zobrist import zkey, fold_statuses, ENEMY_HP, ENEMY_BLOCK, ENEMY_ACTION, ENEMY_STATUS
 
 
+@dataclass(frozen=True, slots=True)
 class Action:
-    """Represents an enemy's intended action."""
+    """An enemy's intended action. Immutable: one instance is shared by every
+    enemy spawned from the same template at the same scaling (see scaled_stats)."""
     ATTACK  = "attack"
     DEFEND  = "defend"
     BUFF    = "buff"
     DEBUFF  = "debuff"
 
-    def __init__(self, action_type: str, value: int = 0, status_name: str = "",
-                 status_stacks: int = 0, description: str = ""):
-        self.type = action_type
-        self.value = value                 # Damage or block amount
-        self.status_name = status_name
-        self.status_stacks = status_stacks
-        self.description = description or self._default_desc()
+    type: str
+    value: int = 0                 # Damage or block amount
+    status_name: str = ""
+    status_stacks: int = 0
+    description: str = ""
+
+    def __post_init__(self):
+        if not self.description:
+            object.__setattr__(self, "description", self._default_desc())
 
     def _default_desc(self) -> str:
         if self.type == Action.ATTACK:
@@ -33,134 +43,136 @@ class Action:
             return f"Debuff ({self.status_name} {self.status_stacks})"
         return "???"
 
+    def scaled(self, dmg_mult: float) -> "Action":
+        """This action with attack damage scaled by `dmg_mult`; itself when unchanged."""
+        if self.type != Action.ATTACK:
+            return self
+        value = max(1, int(self.value * dmg_mult))
+        if value == self.value:
+            return self
+        return Action(Action.ATTACK, value, description=self.description)
+
 
-class Enemy:
-    def __init__(self, name: str, max_hp: int, action_pattern: list[Action],
+class Enemy(Combatant):
+    __slots__ = ("action_pattern", "action_index", "tier", "is_boss", "next_action", "events")
+
+    def __init__(self, name: str, max_hp: int, action_pattern: tuple[Action, ...],
                  tier: int = 1, is_boss: bool = False):
-        self.name = name
-        self.max_hp = max_hp
-        self.current_hp = max_hp
-        self.block = 0
-        self.statuses: list[StatusEffect] = []
+        super().__init__(name, max_hp)
         self.action_pattern = action_pattern
         self.action_index = 0
         self.tier = tier
         self.is_boss = is_boss
         self.next_action: Optional[Action] = action_pattern[0] if action_pattern else None
-
-    def take_damage(self, amount: int, ignore_block: bool = False, attacker=None):
-        if amount <= 0:
-            return
-        # Vulnerable modifier
-        vuln = self._get_status("Vulnerable")
-        if vuln and not ignore_block:
-            amount = int(amount * 1.5)
-
-        # Thorns
-        if attacker and not ignore_block:
-            thorns = self._get_status("Thorns")
-            if thorns:
-                attacker.take_damage(thorns.stacks, ignore_block=True)
-
-        if not ignore_block:
-            absorbed = min(self.block, amount)
-            self.block -= absorbed
-            amount -= absorbed
-        if amount > 0:
-            self.current_hp = max(0, self.current_hp - amount)
-
-    def heal(self, amount: int):
-        self.current_hp = min(self.max_hp, self.current_hp + amount)
-
-    def gain_block(self, amount: int):
-        self.block = max(0, self.block + amount)
-
-    def reset_block(self):
-        self.block = 0
-
-    def is_dead(self) -> bool:
-        return self.current_hp <= 0
-
-    def apply_status(self, status: StatusEffect):
-        existing = self._get_status(status.name)
-        if existing:
-            existing.stacks += status.stacks
-        else:
-            self.statuses.append(status)
-
-    def _get_status(self, name: str) -> Optional[StatusEffect]:
-        for s in self.statuses:
-            if s.name == name:
-                return s
-        return None
-
-    def tick_statuses(self) -> list[str]:
-        messages = []
-        for s in list(self.statuses):
-            messages.extend(s.tick(self))
-        self.statuses = [s for s in self.statuses if not s.is_expired()]
-        return messages
-
-    def calc_damage(self, base: int) -> int:
-        dmg = base
-        strength = self._get_status("Strength")
-        if strength:
-            dmg += strength.stacks
-        weak = self._get_status("Weak")
-        if weak:
-            dmg = int(dmg * 0.75)
-        return max(0, dmg)
+        self.events = NO_EVENTS  # The fight's EventLog while in combat
+
+    def clone(self) -> "Enemy":
+        """Copy with its own HP, block, statuses and intent. The action pattern is shared."""
+        new = object.__new__(Enemy)
+        self._copy_core(new)
+        new.action_pattern = self.action_pattern
+        new.action_index = self.action_index
+        new.tier = self.tier
+        new.is_boss = self.is_boss
+        new.next_action = self.next_action
+        new.events = self.events
+        return new
+
+    def zobrist_hash(self, slot: int) -> int:
+        """64-bit hash of HP, block, intent and statuses for the enemy in `slot`."""
+        return (zkey(ENEMY_HP, slot, self.current_hp) ^ zkey(ENEMY_BLOCK, slot, self.block)
+                ^ zkey(ENEMY_ACTION, slot, self.action_index)
+                ^ fold_statuses(self.statuses, ENEMY_STATUS, slot))
 
     def advance_action(self):
         self.action_index = (self.action_index + 1) % len(self.action_pattern)
         self.next_action = self.action_pattern[self.action_index]
 
-    def execute_action(self, hero) -> list[str]:
-        """Execute current action against the hero. Returns log messages."""
-        messages = []
+    def execute_action(self, hero):
+        """Execute current action against the hero."""
         action = self.next_action
         if action is None:
-            return messages
+            return
 
         if action.type == Action.ATTACK:
             dmg = self.calc_damage(action.value)
-            # Apply hero's Vulnerable
-            vuln = hero._get_status("Vulnerable")
-            if vuln:
-                dmg = int(dmg * 1.5)
-            hero.take_damage(dmg, attacker=self)
-            messages.append(f"{self.name} attacks for {dmg} damage!")
+            hero.take_damage(dmg, attacker=self)  # Vulnerable applies on the hero's side
+            if self.events.enabled:
+                self.events.emit(DamageDealt, self, hero, hero.modifiers().taken(dmg))
 
         elif action.type == Action.DEFEND:
             self.gain_block(action.value)
-            messages.append(f"{self.name} gains {action.value} Block.")
+            self.events.emit(BlockGained, self, action.value)
 
         elif action.type == Action.BUFF:
             if action.status_name:
-                self.apply_status(make_status(action.status_name, action.status_stacks))
-            messages.append(f"{self.name} buffs itself! ({action.description})")
+                self.add_status(status_id(action.status_name), action.status_stacks)
+                self.events.emit(StatusApplied, self, self, action.status_name,
+                                 action.status_stacks, "buff")
 
         elif action.type == Action.DEBUFF:
             if action.status_name:
-                hero.apply_status(make_status(action.status_name, action.status_stacks))
-            messages.append(f"{self.name} debuffs you! ({action.description})")
+                hero.add_status(status_id(action.status_name), action.status_stacks)
+                self.events.emit(StatusApplied, self, hero, action.status_name,
+                                 action.status_stacks, "debuff")
 
         self.advance_action()
-        return messages
 
-    def start_of_turn(self) -> list[str]:
+    def start_of_turn(self):
         self.reset_block()
-        return self.tick_statuses()
+        self.tick_statuses()
 
     def scale(self, hp_mult: float, dmg_mult: float):
-        """Scale this enemy's stats for difficulty."""
+        """Scale this enemy's stats for difficulty. The shared actions are left
+        alone: the enemy gets its own scaled pattern."""
         self.max_hp = max(1, int(self.max_hp * hp_mult))
         self.current_hp = self.max_hp
-        for action in self.action_pattern:
-            if action.type == Action.ATTACK:
-                action.value = max(1, int(action.value * dmg_mult))
-        if self.next_action and self.next_action.type == Action.ATTACK:
-            self.next_action.value = self.action_pattern[0].value
+        self.action_pattern = tuple(a.scaled(dmg_mult) for a in self.action_pattern)
+        if self.action_pattern:
+            self.next_action = self.action_pattern[self.action_index]
+
+
+# ─────────────────────────────────────────────
+# Templates
+# ─────────────────────────────────────────────
+
+@dataclass(frozen=True, slots=True, eq=False)
+class EnemyTemplate:
+    """Immutable enemy definition. Templates compare and hash by identity, so
+    they can key the scaled-stats cache cheaply."""
+    name: str
+    max_hp: int
+    actions: tuple[Action, ...]
+    tier: int = 1
+    is_boss: bool = False
+
+    def spawn(self, floor: int = 1, elite: bool = False) -> Enemy:
+        """A fresh enemy scaled like the dungeon scales it on `floor`. Only HP,
+        block, statuses and the intent are per-instance; the actions are shared."""
+        max_hp, actions = scaled_stats(self, floor, elite)
+        return Enemy(self.name, max_hp, actions, self.tier, self.is_boss)
+
+
+SCALED_STATS_CACHE_SIZE = 1024  # Every template at every floor of a normal act, with room to spare
+
+
+@lru_cache(maxsize=SCALED_STATS_CACHE_SIZE)
+def _scaled(template: EnemyTemplate, hp_mult: float, dmg_mult: float) -> tuple[int, tuple[Action, ...]]:
+    return (max(1, int(template.max_hp * hp_mult)),
+            tuple(a.scaled(dmg_mult) for a in template.actions))
+
+
+def scaled_stats(template: EnemyTemplate, floor: int, elite: bool = False) -> tuple[int, tuple[Action, ...]]:
+    """Max HP and attack-scaled actions of `template` on `floor`. Elites get 30%
+    more HP and 20% more damage. Cached by the resulting multipliers rather than
+    the floor, so a change to the per-floor scaling constants (see
+    src.sim.runs --hp-step) is never served stale stats. The cache is bounded,
+    since endless runs keep reaching new floors."""
+    from src.constants import enemy_hp_scale, enemy_dmg_scale
+    hp_mult, dmg_mult = enemy_hp_scale(floor), enemy_dmg_scale(floor)
+    if elite:
+        hp_mult, dmg_mult = hp_mult * 1.3, dmg_mult * 1.2
+    return _scaled(template, hp_mult, dmg_mult)
 
 
 # ─────────────────────────────────────────────
@@ -182,183 +194,186 @@ def _debuff(name, stacks, desc="") -> Action:
                   description=desc or f"{name} +{stacks}")
 
 
+# The guaranteed first fight, also in the tier 1 pool
+SLIME = EnemyTemplate("Slime", 35, (
+    _atk(5),
+    _atk(5),
+    _def(8),
+), tier=1)
+
 # Tier 1 enemies (floors 1-3)
 TIER1_ENEMIES = [
-    lambda: Enemy("Cultist", 48, [
+    EnemyTemplate("Cultist", 48, (
         _buff("Ritual", 1, "Ritual +1"),
         _atk(6),
         _atk(6),
-    ], tier=1),
+    ), tier=1),
 
-    lambda: Enemy("Jaw Worm", 42, [
+    EnemyTemplate("Jaw Worm", 42, (
         _atk(11),
         _def(6),
         _atk(7),
         _def(6),
-    ], tier=1),
+    ), tier=1),
 
-    lambda: Enemy("Louse", 10, [
+    EnemyTemplate("Louse", 10, (
         _atk(5),
         _atk(7),
         _debuff("Weak", 1),
         _atk(5),
-    ], tier=1),
+    ), tier=1),
 
-    lambda: Enemy("Fungal Spore", 22, [
+    EnemyTemplate("Fungal Spore", 22, (
         _atk(6),
         _debuff("Vulnerable", 1),
         _atk(6),
         _debuff("Weak", 1),
-    ], tier=1),
+    ), tier=1),
 
-    lambda: Enemy("Slime", 35, [
-        _atk(5),
-        _atk(5),
-        _def(8),
-    ], tier=1),
+    SLIME,
 ]
 
 # Tier 2 enemies (floors 4-6)
 TIER2_ENEMIES = [
-    lambda: Enemy("Gremlin Nob", 82, [
+    EnemyTemplate("Gremlin Nob", 82, (
         _buff("Strength", 3, "Enrage +3 Str"),
         _atk(14),
         _atk(16),
         _debuff("Vulnerable", 2),
-    ], tier=2),
+    ), tier=2),
 
-    lambda: Enemy("Lagavulin", 112, [
+    EnemyTemplate("Lagavulin", 112, (
         _def(8),
         _def(8),
         _debuff("Strength", -1, "Siphon Soul -1 Str"),
         _debuff("Dexterity", -1, "Siphon Soul -1 Dex"),
         _atk(18),
-    ], tier=2),
+    ), tier=2),
 
-    lambda: Enemy("Sentry", 38, [
+    EnemyTemplate("Sentry", 38, (
         _atk(9),
         _debuff("Burn", 2, "Beam +2 Burn"),
         _atk(9),
         _debuff("Burn", 2, "Beam +2 Burn"),
-    ], tier=2),
+    ), tier=2),
 
-    lambda: Enemy("Blue Slaver", 46, [
+    EnemyTemplate("Blue Slaver", 46, (
         _atk(12),
         _debuff("Weak", 1),
         _atk(12),
-    ], tier=2),
+    ), tier=2),
 
-    lambda: Enemy("Red Slaver", 46, [
+    EnemyTemplate("Red Slaver", 46, (
         _atk(13),
         _debuff("Vulnerable", 1),
         _atk(13),
-    ], tier=2),
+    ), tier=2),
 ]
 
 # Tier 3 enemies (floors 7+)
 TIER3_ENEMIES = [
-    lambda: Enemy("Writhing Mass", 160, [
+    EnemyTemplate("Writhing Mass", 160, (
         _atk(15),
         _debuff("Vulnerable", 2),
         _atk(20),
         _buff("Strength", 2),
-    ], tier=3),
+    ), tier=3),
 
-    lambda: Enemy("Repulsor", 29, [
+    EnemyTemplate("Repulsor", 29, (
         _atk(8),
         _atk(8),
         _debuff("Weak", 2),
         _debuff("Vulnerable", 2),
-    ], tier=3),
+    ), tier=3),
 
-    lambda: Enemy("Nemesis", 185, [
+    EnemyTemplate("Nemesis", 185, (
         _atk(45),
         _debuff("Burn", 3),
         _atk(45),
         _buff("Strength", 3),
-    ], tier=3),
+    ), tier=3),
 
-    lambda: Enemy("Deca", 265, [
+    EnemyTemplate("Deca", 265, (
         _buff("Strength", 4),
         _atk(30),
         _atk(30),
         _def(20),
-    ], tier=3),
+    ), tier=3),
 ]
 
 # Bosses (every 5 floors)
 BOSSES = [
     # Floor 5 boss
-    lambda: Enemy("The Guardian", 240, [
+    EnemyTemplate("The Guardian", 240, (
         _atk(32),
         _def(20),
         _atk(32),
         _buff("Strength", 3, "Defensive Mode"),
         _atk(32),
-    ], tier=4, is_boss=True),
+    ), tier=4, is_boss=True),
 
     # Floor 10 boss
-    lambda: Enemy("Hexaghost", 250, [
+    EnemyTemplate("Hexaghost", 250, (
         _atk(6),
         _atk(6),
         _debuff("Burn", 3),
         _atk(20),
         _buff("Strength", 2),
         _atk(20),
-    ], tier=4, is_boss=True),
+    ), tier=4, is_boss=True),
 
     # Floor 15 boss
-    lambda: Enemy("Slime Boss", 140, [
+    EnemyTemplate("Slime Boss", 140, (
         _atk(35),
         _debuff("Vulnerable", 3),
         _atk(35),
         _buff("Strength", 4, "Corrosive Slime"),
-    ], tier=4, is_boss=True),
+    ), tier=4, is_boss=True),
 
     # Floor 20+ boss (repeating)
-    lambda: Enemy("Time Eater", 456, [
+    EnemyTemplate("Time Eater", 456, (
         _atk(32),
         _atk(32),
         _buff("Strength", 4, "Reverberate"),
         _debuff("Vulnerable", 2),
         _atk(32),
-    ], tier=4, is_boss=True),
+    ), tier=4, is_boss=True),
 ]
 
 
-def get_enemy_for_floor(floor: int) -> Enemy:
+# Encounter odds per tier list (uniform today); a list's length is its version
+_ENCOUNTER_TABLES = TableCache()
+
+
+def _encounter_table(pool: list) -> AliasTable:
+    return _ENCOUNTER_TABLES.get(id(pool), lambda: AliasTable(pool, [1] * len(pool)), len(pool))
+
+
+def get_enemy_for_floor(floor: int, rng=None) -> Enemy:
     """Return a scaled enemy appropriate for the given floor."""
-    from src.constants import enemy_hp_scale, enemy_dmg_scale, BOSS_EVERY
+    from src.constants import BOSS_EVERY
+    rng = rng or random
 
     if floor == 1:
         # Guarantee Slime for the first fight as requested
-        enemy = Enemy("Slime", 35, [
-            _atk(5),
-            _atk(5),
-            _def(8),
-        ], tier=1)
+        template = SLIME
     elif floor % BOSS_EVERY == 0:
         boss_index = (floor // BOSS_EVERY - 1) % len(BOSSES)
-        enemy = BOSSES[boss_index]()
+        template = BOSSES[boss_index]
     elif floor <= 3:
-        enemy = random.choice(TIER1_ENEMIES)()
+        template = _encounter_table(TIER1_ENEMIES).sample(rng)
     elif floor <= 6:
-        enemy = random.choice(TIER2_ENEMIES)()
+        template = _encounter_table(TIER2_ENEMIES).sample(rng)
     else:
-        enemy = random.choice(TIER3_ENEMIES)()
-
-    enemy.scale(enemy_hp_scale(floor), enemy_dmg_scale(floor))
-    return enemy
+        template = _encounter_table(TIER3_ENEMIES).sample(rng)
+    return template.spawn(floor)
 
 
-def get_elite_for_floor(floor: int) -> Enemy:
+def get_elite_for_floor(floor: int, rng=None) -> Enemy:
     """Return a scaled elite enemy."""
-    from src.constants import enemy_hp_scale, enemy_dmg_scale
+    rng = rng or random
     if floor <= 5:
         pool = TIER2_ENEMIES
     else:
         pool = TIER3_ENEMIES
-    enemy = random.choice(pool)()
-    # Elites are stronger
-    enemy.scale(enemy_hp_scale(floor) * 1.3, enemy_dmg_scale(floor) * 1.2)
-    return enemy
+    return _encounter_table(pool).sample(rng).spawn(floor, elite=True)
@@ -2,89 +2,100 @@
 Hero model.
 """
 from __future__ import annotations
-import random
 from typing import Optional, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from src.models.card import Card
+    from src.models.power import Power
     from src.models.relic import Relic
 
-from src.models.status import StatusEffect, Strength, Dexterity
+from src.models.combatant import Combatant
+from src.models.status import STRENGTH, DEXTERITY
+from src.systems.bus import EventBus, Listener
+from src.systems.events import NO_EVENTS, EventLog
+from src.systems.rng import GameRng
+from src.systems.zobrist import (Pile, zkey, fold_statuses, HERO_HP, HERO_BLOCK, HERO_ENERGY,
+                                 HERO_STATUS, PILE_DRAW, PILE_HAND, PILE_DISCARD, PILE_EXHAUST)
 
 
-class Hero:
-    def __init__(self):
-        self.name = "Iron Clad"
-        self.max_hp = 80
-        self.current_hp = 80
-        self.block = 0
+class Hero(Combatant):
+    """The player. Core fields are Combatant slots; the rest live in __dict__,
+    so relics can still attach ad-hoc attributes."""
+
+    def __init__(self, rng: Optional[GameRng] = None):
+        super().__init__("Iron Clad", 80)
         self.energy = 3
         self.max_energy = 3
         self.gold = 99
         self.combat_state = None  # Reference for relic triggers
+        self.rng = rng or GameRng()  # Normally the owning GameState's streams
 
         # Deck management
-        self.deck: list[Card] = []       # Full deck (all owned cards)
-        self.draw_pile: list[Card] = []  # Cards to draw from
-        self.hand: list[Card] = []       # Cards in hand
-        self.discard_pile: list[Card] = []
-        self.exhaust_pile: list[Card] = []
-
-        # Statuses
-        self.statuses: list[StatusEffect] = []
-
-        # Relics
+        # Combat piles keep a multiset hash and are only ever mutated in place
+        self.deck: list[Card] = []             # Full deck (all owned cards)
+        self.draw_pile = Pile(PILE_DRAW)       # Cards to draw from
+        self.hand = Pile(PILE_HAND)            # Cards in hand
+        self.discard_pile = Pile(PILE_DISCARD)
+        self.exhaust_pile = Pile(PILE_EXHAUST)
+
+        # Relics and powers react to combat through the bus they subscribe to
         self.relics: list[Relic] = []
+        self.relic_names: set[str] = set()
+        self.powers: dict[str, Power] = {}
+        self.bus = EventBus()
 
-        # Power flags
+        # Rule-changing powers, checked where the rule applies
         self.barricade = False
-        self.juggernaut = False
         self.corruption = False
-        self.dark_embrace = False
-        self.feel_no_pain = False
-        self.evolve = False
-        self.brutality = False
-        self.berserk = False
-        self.metallicize = 0
-        self.combust = 0
         self._battle_trance_active = False
 
         # Stats tracking
         self.floor = 0
         self.kills = 0
 
-    # ── HP ──────────────────────────────────────────────────────────────────
-
-    def take_damage(self, amount: int, ignore_block: bool = False, attacker=None):
-        if amount <= 0:
-            return
-        # Thorns retaliation
-        if attacker and not ignore_block:
-            thorns = self._get_status("Thorns")
-            if thorns:
-                attacker.take_damage(thorns.stacks, ignore_block=True)
-
-        if not ignore_block:
-            absorbed = min(self.block, amount)
-            self.block -= absorbed
-            amount -= absorbed
-        if amount > 0:
-            self.current_hp = max(0, self.current_hp - amount)
-
-    def heal(self, amount: int):
-        self.current_hp = min(self.max_hp, self.current_hp + amount)
-
-    def is_dead(self) -> bool:
-        return self.current_hp <= 0
-
-    # ── Block ────────────────────────────────────────────────────────────────
-
-    def gain_block(self, amount: int):
-        amount = max(0, amount)
-        self.block += amount
-        # Juggernaut: deal damage to random enemy when gaining block
-        if self.juggernaut and amount > 0:
-            self._juggernaut_trigger = amount  # handled by combat system
+    # ── Cloning ─────────────────────────────────────────────────────────────
+
+    def clone(self, rng: Optional[GameRng] = None) -> "Hero":
+        """Copy for search and what-if play. Piles, statuses and relics are copied;
+        cards are shared (they are immutable). Without `rng` the clone gets a copy
+        of this hero's streams, so it replays the same draws independently.
+        The clone is detached from any combat (see CombatState.clone)."""
+        new = object.__new__(Hero)
+        self._copy_core(new)
+        new.__dict__.update(self.__dict__)  # Scalars and power flags, incl. ad-hoc ones
+        new.rng = rng if rng is not None else self.rng.clone()
+        new.combat_state = None
+        new.deck = self.deck[:]
+        new.draw_pile = self.draw_pile.copy()
+        new.hand = self.hand.copy()
+        new.discard_pile = self.discard_pile.copy()
+        new.exhaust_pile = self.exhaust_pile.copy()
+        new.relics = [r.clone() for r in self.relics]
+        new.relic_names = set(self.relic_names)
+        new.powers = {name: p.clone() for name, p in self.powers.items()}
+        listeners = {id(old): copy for old, copy in zip(self.relics, new.relics)}
+        listeners.update((id(p), new.powers[name]) for name, p in self.powers.items())
+        new.bus = self.bus.rebind(listeners)
+        return new
+
+    def zobrist_hash(self) -> int:
+        """64-bit hash of HP, block, energy, statuses and the four combat piles."""
+        return (zkey(HERO_HP, self.current_hp) ^ zkey(HERO_BLOCK, self.block)
+                ^ zkey(HERO_ENERGY, self.energy) ^ fold_statuses(self.statuses, HERO_STATUS)
+                ^ self.draw_pile.zhash ^ self.hand.zhash
+                ^ self.discard_pile.zhash ^ self.exhaust_pile.zhash)
+
+    # ── Combatant hooks ──────────────────────────────────────────────────────
+
+    def _hp_lost(self, amount: int) -> int:
+        return self.bus.filter("on_damage_taken", self, amount)
+
+    def _block_gained(self, amount: int):
+        self.bus.emit("on_block_gained", self, amount)
+
+    def _modifier_sources(self) -> list:
+        return [l for l in (*self.relics, *self.powers.values())
+                if type(l).modify is not Listener.modify]
 
     def reset_block(self):
         if not self.barricade:
@@ -94,138 +105,105 @@ class Hero:
 
     def restore_energy(self):
         self.energy = self.max_energy
-        if self.berserk:
-            self.energy += 1
 
-    # ── Damage Calculation ───────────────────────────────────────────────────
-
-    def calc_damage(self, base: int) -> int:
-        dmg = base + self.get_strength()
-        # Apply Weak status
-        weak = self._get_status("Weak")
-        if weak:
-            dmg = int(dmg * 0.75)
-        return max(0, dmg)
+    # ── Stats ────────────────────────────────────────────────────────────────
 
     def get_strength(self) -> int:
-        s = self._get_status("Strength")
-        return s.stacks if s else 0
+        return self.statuses.stacks(STRENGTH)
 
     def get_dexterity(self) -> int:
-        d = self._get_status("Dexterity")
-        return d.stacks if d else 0
-
-    # ── Status Effects ────────────────────────────────────────────────────────
-
-    def apply_status(self, status: StatusEffect):
-        existing = self._get_status(status.name)
-        if existing:
-            existing.stacks += status.stacks
-        else:
-            self.statuses.append(status)
-
-    def _get_status(self, name: str) -> Optional[StatusEffect]:
-        for s in self.statuses:
-            if s.name == name:
-                return s
-        return None
-
-    def tick_statuses(self) -> list[str]:
-        messages = []
-        for s in list(self.statuses):
-            messages.extend(s.tick(self))
-        self.statuses = [s for s in self.statuses if not s.is_expired()]
-        return messages
+        return self.statuses.stacks(DEXTERITY)
 
     def clear_combat_statuses(self):
         """Remove per-combat statuses (Weak, Vulnerable, etc.) after combat."""
-        keep = {"Strength", "Dexterity"}
-        self.statuses = [s for s in self.statuses if s.name in keep]
+        self.statuses.retain(lambda status_id, stacks: status_id in (STRENGTH, DEXTERITY))
 
     # ── Card / Deck Management ────────────────────────────────────────────────
 
     def prepare_deck(self):
-        """Shuffle deck into draw pile at start of combat."""
-        self.draw_pile = [c.copy() for c in self.deck]
-        random.shuffle(self.draw_pile)
-        self.hand = []
-        self.discard_pile = []
-        self.exhaust_pile = []
+        """Shuffle deck into draw pile at start of combat. Cards are shared, so no copies."""
+        self.draw_pile.reset(self.deck)
+        self.draw_pile.shuffle(self.rng.combat)
+        self.hand.clear()
+        self.discard_pile.clear()
+        self.exhaust_pile.clear()
 
     def draw_cards(self, n: int = 1):
         for _ in range(n):
             if not self.draw_pile:
                 if not self.discard_pile:
                     return
-                self.draw_pile = self.discard_pile[:]
-                random.shuffle(self.draw_pile)
-                self.discard_pile = []
+                self.draw_pile.extend(self.discard_pile)
+                self.draw_pile.shuffle(self.rng.combat)
+                self.discard_pile.clear()
             if self.draw_pile:
                 card = self.draw_pile.pop()
                 self.hand.append(card)
 
     def discard_hand(self):
         self.discard_pile.extend(self.hand)
-        self.hand = []
+        self.hand.clear()
 
     def exhaust_card(self, card: "Card"):
-        if card in self.hand:
-            self.hand.remove(card)
+        """Put `card`, already taken out of its pile, into the exhaust pile."""
         self.exhaust_pile.append(card)
-        if self.dark_embrace:
-            self.draw_cards(1)
-        if self.feel_no_pain:
-            self.gain_block(3)
+        self.bus.emit("on_exhaust", self, card)
+
+    def add_status_card(self, card: "Card"):
+        """Put a status card (Wound) on top of the draw pile."""
+        self.draw_pile.append(card)
+        self.bus.emit("on_status_card", self, card)
 
     def add_card_to_deck(self, card: "Card"):
         self.deck.append(card)
 
     def remove_card_from_deck(self, card: "Card"):
-        for c in self.deck:
+        for i, c in enumerate(self.deck):
             if c.name == card.name:
-                self.deck.remove(c)
+                del self.deck[i]
                 return True
         return False
 
-    # ── Relics ────────────────────────────────────────────────────────────────
+    # ── Relics / Powers ───────────────────────────────────────────────────────
 
     def add_relic(self, relic: "Relic"):
         self.relics.append(relic)
+        self.relic_names.add(relic.name)
+        self.bus.subscribe(relic)
+        self._mods_version = -1
         relic.on_obtain(self)
 
-    def trigger_relics(self, event: str, **kwargs):
-        for r in self.relics:
-            getattr(r, event, lambda *a, **kw: None)(self, **kwargs)
+    def add_power(self, power: "Power"):
+        """Gain a power, or add to the amount of the one already held."""
+        held = self.powers.get(power.name)
+        if held is not None:
+            held.amount += power.amount
+        else:
+            self.powers[power.name] = power
+            self.bus.subscribe(power)
+        self._mods_version = -1
+
+    def notify(self, hook: str, *args):
+        """Dispatch a bus hook to the relics and powers subscribed to it."""
+        self.bus.emit(hook, self, *args)
 
     # ── Turn Hooks ────────────────────────────────────────────────────────────
 
-    def start_of_turn(self) -> list[str]:
-        messages = []
+    @property
+    def events(self) -> EventLog:
+        """The current fight's event log, or a disabled sink outside combat."""
+        combat = self.combat_state
+        return combat.events if combat is not None else NO_EVENTS
+
+    def start_of_turn(self):
         self.reset_block()
         self.restore_energy()
         self._battle_trance_active = False
-        self._juggernaut_trigger = 0
-
-        # Brutality
-        if self.brutality:
-            self.take_damage(1, ignore_block=True)
-            self.draw_cards(1)
-            messages.append("Brutality: lost 1 HP, drew 1 card.")
-
-        messages.extend(self.tick_statuses())
+        self.notify("on_turn_begin")
+        self.tick_statuses()
         self.draw_cards(5)
-        self.trigger_relics("on_turn_start")
-        return messages
-
-    def end_of_turn(self) -> list[str]:
-        messages = []
-        # Metallicize
-        if self.metallicize > 0:
-            self.gain_block(self.metallicize)
-            messages.append(f"Metallicize: gained {self.metallicize} Block.")
-        # Combust
-        if self.combust > 0:
-            self.take_damage(self.combust, ignore_block=True)
-            messages.append(f"Combust: lost {self.combust} HP.")
+        self.notify("on_turn_start")
+
+    def end_of_turn(self):
+        self.notify("on_turn_end")
         self.discard_hand()
-        return messages
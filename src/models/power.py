@@ -0,0 +1,130 @@
+"""
+Power model — lasting effects of Power cards, driven by the hero's event bus.
+"""
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+from src.systems.bus import Listener
+from src.systems.events import DamageDealt, BlockGained
+
+if TYPE_CHECKING:
+    from src.models.card import Card
+    from src.models.hero import Hero
+
+
+class Power(Listener):
+    """Base power. Playing a power the hero already has adds its `amount`;
+    powers without an amount do not stack."""
+    name = ""
+
+    def __init__(self, amount: int = 0):
+        self.amount = amount
+
+    def __repr__(self):
+        return f"Power({self.name}, {self.amount})"
+
+
+# ─────────────────────────────────────────────
+# Registry
+# ─────────────────────────────────────────────
+
+POWERS: dict[str, type[Power]] = {}
+
+
+def _register(cls: type[Power]) -> type[Power]:
+    POWERS[cls.name] = cls
+    return cls
+
+
+def make_power(name: str, amount: int = 0) -> Power:
+    cls = POWERS.get(name)
+    if cls is None:
+        raise ValueError(f"Unknown power: {name}")
+    return cls(amount)
+
+
+# ─────────────────────────────────────────────
+# Power Definitions
+# ─────────────────────────────────────────────
+
+@_register
+class Berserk(Power):
+    """Gain 1 Energy at the start of each turn."""
+    name = "Berserk"
+
+    def on_turn_begin(self, hero: "Hero"):
+        hero.energy += 1
+
+
+@_register
+class Brutality(Power):
+    """Lose 1 HP and draw 1 card at the start of each turn."""
+    name = "Brutality"
+
+    def on_turn_begin(self, hero: "Hero"):
+        hero.take_damage(1, ignore_block=True)
+        hero.draw_cards(1)
+        hero.events.emit(DamageDealt, None, hero, 1, "Brutality")
+
+
+@_register
+class Metallicize(Power):
+    """Gain `amount` Block at the end of each turn."""
+    name = "Metallicize"
+
+    def on_turn_end(self, hero: "Hero"):
+        hero.gain_block(self.amount)
+        hero.events.emit(BlockGained, hero, self.amount, "Metallicize")
+
+
+@_register
+class Combust(Power):
+    """Lose `amount` HP at the end of each turn."""
+    name = "Combust"
+
+    def on_turn_end(self, hero: "Hero"):
+        hero.take_damage(self.amount, ignore_block=True)
+        hero.events.emit(DamageDealt, None, hero, self.amount, "Combust")
+
+
+@_register
+class Juggernaut(Power):
+    """Whenever the hero gains Block, deal 5 damage to a random enemy."""
+    name = "Juggernaut"
+
+    def on_block_gained(self, hero: "Hero", amount: int):
+        combat = hero.combat_state
+        if combat is None:
+            return
+        living = [e for e in combat.enemies if e.current_hp > 0]
+        if living:
+            hit = hero.rng.combat.choice(living)
+            hit.take_damage(5, attacker=hero)
+            hero.events.emit(DamageDealt, hero, hit, 5, "Juggernaut")
+
+
+@_register
+class DarkEmbrace(Power):
+    """Draw 1 card whenever a card is exhausted."""
+    name = "Dark Embrace"
+
+    def on_exhaust(self, hero: "Hero", card: "Card"):
+        hero.draw_cards(1)
+
+
+@_register
+class FeelNoPain(Power):
+    """Gain 3 Block whenever a card is exhausted."""
+    name = "Feel No Pain"
+
+    def on_exhaust(self, hero: "Hero", card: "Card"):
+        hero.gain_block(3)
+
+
+@_register
+class Evolve(Power):
+    """Draw 1 card whenever a status card is added to the hero's piles."""
+    name = "Evolve"
+
+    def on_status_card(self, hero: "Hero", card: "Card"):
+        hero.draw_cards(1)
@@ -2,69 +2,78 @@
 Relic model and relic pool.
 """
 from __future__ import annotations
-from typing import TYPE_CHECKING
+import random
+from bisect import bisect
+from itertools import accumulate
+from typing import TYPE_CHECKING, Collection
+
+from src.models.card import COMMON, UNCOMMON, RARE, STARTER
+from src.systems.bus import Listener
 
 if TYPE_CHECKING:
     from src.models.hero import Hero
 
 
-class Relic:
-    def __init__(self, name: str, description: str, rarity: str = "Common"):
-        self.name = name
-        self.description = description
-        self.rarity = rarity
+class Relic(Listener):
+    """Base relic. Subclasses declare name/description/rarity on the class and
+    override the bus hooks they react to (see src.systems.bus.Listener)."""
+    name = ""
+    description = ""
+    rarity = COMMON
 
     def on_obtain(self, hero: "Hero"):
         pass
 
-    def on_combat_start(self, hero: "Hero"):
-        pass
-
-    def on_turn_start(self, hero: "Hero"):
-        pass
+    def __repr__(self):
+        return f"Relic({self.name})"
 
-    def on_turn_end(self, hero: "Hero"):
-        pass
 
-    def on_card_played(self, hero: "Hero", card):
-        pass
+# ─────────────────────────────────────────────
+# Registry
+# ─────────────────────────────────────────────
 
-    def on_damage_taken(self, hero: "Hero", amount: int) -> int:
-        return amount
+RELICS: dict[str, type[Relic]] = {}
 
-    def on_combat_end(self, hero: "Hero"):
-        pass
 
-    def __repr__(self):
-        return f"Relic({self.name})"
+def _register(cls: type[Relic]) -> type[Relic]:
+    RELICS[cls.name] = cls
+    return cls
 
 
 # ─────────────────────────────────────────────
 # Relic Definitions
 # ─────────────────────────────────────────────
 
+@_register
 class BurningBlood(Relic):
     """Heal 6 HP at end of combat."""
-    def __init__(self):
-        super().__init__("Burning Blood", "Heal 6 HP at end of each combat.", "Starter")
+    name = "Burning Blood"
+    description = "Heal 6 HP at end of each combat."
+    rarity = STARTER
 
     def on_combat_end(self, hero):
         hero.heal(6)
 
 
+@_register
 class Anchor(Relic):
     """Start each combat with 10 Block."""
-    def __init__(self):
-        super().__init__("Anchor", "Start each combat with 10 Block.", "Common")
+    name = "Anchor"
+    description = "Start each combat with 10 Block."
+    rarity = COMMON
 
     def on_combat_start(self, hero):
         hero.gain_block(10)
 
 
+@_register
 class BagOfPreparation(Relic):
     """Draw 2 extra cards on the first turn of combat."""
+    name = "Bag of Preparation"
+    description = "Draw 2 extra cards at the start of combat."
+    rarity = COMMON
+
     def __init__(self):
-        super().__init__("Bag of Preparation", "Draw 2 extra cards at the start of combat.", "Common")
         self._first_turn = False
 
     def on_combat_start(self, hero):
@@ -76,10 +85,14 @@ class BagOfPreparation(Relic):
             self._first_turn = False
 
 
+@_register
 class RedSkull(Relic):
     """While at or below 50% HP, gain 3 Strength."""
+    name = "Red Skull"
+    description = "While at or below 50% HP, gain 3 Strength."
+    rarity = COMMON
+
     def __init__(self):
-        super().__init__("Red Skull", "While at or below 50% HP, gain 3 Strength.", "Common")
         self._active = False
 
     def on_turn_start(self, hero):
@@ -92,26 +105,34 @@ class RedSkull(Relic):
             self._active = False
 
 
+@_register
 class Vajra(Relic):
     """Gain 1 Strength at the start of each combat."""
-    def __init__(self):
-        super().__init__("Vajra", "Gain 1 Strength at the start of each combat.", "Common")
+    name = "Vajra"
+    description = "Gain 1 Strength at the start of each combat."
+    rarity = COMMON
 
     def on_combat_start(self, hero):
         from src.models.status import make_status
         hero.apply_status(make_status("Strength", 1))
 
 
+@_register
 class OddMushroom(Relic):
     """When you receive Weak, gain 3 Max HP."""
-    def __init__(self):
-        super().__init__("Odd Mushroom", "When Weakened, gain 3 Max HP.", "Common")
+    name = "Odd Mushroom"
+    description = "When Weakened, gain 3 Max HP."
+    rarity = COMMON
 
 
+@_register
 class Lantern(Relic):
     """Gain 1 extra Energy on the first turn of each combat."""
+    name = "Lantern"
+    description = "Gain 1 Energy on the first turn of combat."
+    rarity = COMMON
+
     def __init__(self):
-        super().__init__("Lantern", "Gain 1 Energy on the first turn of combat.", "Common")
         self._first_turn = False
 
     def on_combat_start(self, hero):
@@ -123,34 +144,44 @@ class Lantern(Relic):
             self._first_turn = False
 
 
+@_register
 class TinyChest(Relic):
     """Every 4th room is a Chest."""
-    def __init__(self):
-        super().__init__("Tiny Chest", "Every 4th room is a Chest.", "Common")
+    name = "Tiny Chest"
+    description = "Every 4th room is a Chest."
+    rarity = COMMON
 
 
+@_register
 class CoffeeDripper(Relic):
     """Gain 1 Energy each turn. You can no longer rest at campsites."""
-    def __init__(self):
-        super().__init__("Coffee Dripper", "Gain 1 Energy each turn.", "Rare")
+    name = "Coffee Dripper"
+    description = "Gain 1 Energy each turn."
+    rarity = RARE
 
     def on_turn_start(self, hero):
         hero.energy += 1
 
 
+@_register
 class PhilosophersStone(Relic):
     """Gain 1 Energy each turn. Enemies start with 1 Strength."""
-    def __init__(self):
-        super().__init__("Philosopher's Stone", "Gain 1 Energy each turn. Enemies gain 1 Strength.", "Rare")
+    name = "Philosopher's Stone"
+    description = "Gain 1 Energy each turn. Enemies gain 1 Strength."
+    rarity = RARE
 
     def on_turn_start(self, hero):
         hero.energy += 1
 
 
+@_register
 class Akabeko(Relic):
     """Your first Attack each combat deals 8 extra damage."""
+    name = "Akabeko"
+    description = "First Attack each combat deals 8 extra damage."
+    rarity = COMMON
+
     def __init__(self):
-        super().__init__("Akabeko", "First Attack each combat deals 8 extra damage.", "Common")
         self._used = False
 
     def on_combat_start(self, hero):
@@ -166,15 +197,22 @@ class Akabeko(Relic):
             # Remove after one attack — handled by combat system tracking
 
 
+@_register
 class Centennial_Puzzle(Relic):
     """The first time you lose HP each combat, draw 3 cards."""
+    name = "Centennial Puzzle"
+    description = "First time you lose HP each combat, draw 3 cards."
+    rarity = COMMON
+
     def __init__(self):
-        super().__init__("Centennial Puzzle", "First time you lose HP each combat, draw 3 cards.", "Common")
-        self._triggered = False
+        self._triggered = True  # Armed only while in combat
 
     def on_combat_start(self, hero):
         self._triggered = False
 
+    def on_combat_end(self, hero):
+        self._triggered = True
+
     def on_damage_taken(self, hero, amount):
         if not self._triggered and amount > 0:
             hero.draw_cards(3)
@@ -182,19 +220,23 @@ class Centennial_Puzzle(Relic):
         return amount
 
 
+@_register
 class MagicFlower(Relic):
     """Healing is 50% more effective."""
-    def __init__(self):
-        super().__init__("Magic Flower", "Healing is 50% more effective.", "Rare")
+    name = "Magic Flower"
+    description = "Healing is 50% more effective."
+    rarity = RARE
 
     def on_obtain(self, hero):
         hero._healing_multiplier = 1.5
 
 
+@_register
 class Kryptonite(Relic):
     """On boss entry, deal 10% of boss max HP."""
-    def __init__(self):
-        super().__init__("Kryptonite", "Deal 10% Boss HP on entry.", "Uncommon")
+    name = "Kryptonite"
+    description = "Deal 10% Boss HP on entry."
+    rarity = UNCOMMON
 
     def on_combat_start(self, hero):
         from src.systems.combat import CombatState
@@ -205,10 +247,12 @@ class Kryptonite(Relic):
                 enemy.take_damage(dmg, ignore_block=True)
 
 
+@_register
 class FirePendant(Relic):
     """Heal 6 HP at end of combat."""
-    def __init__(self):
-        super().__init__("Fire Pendant", "Heal 6 HP at end of each combat.", "Starter")
+    name = "Fire Pendant"
+    description = "Heal 6 HP at end of each combat."
+    rarity = STARTER
 
     def on_combat_end(self, hero):
         hero.heal(6)
@@ -232,18 +276,57 @@ RELIC_POOL = [
 ]
 
 
-def get_starter_relic() -> Relic:
-    return FirePendant()
+# Prebuilt pools, read by the samplers below
+RELIC_POOL_NAMES = frozenset(r.name for r in RELIC_POOL)
+RELICS_BY_RARITY: dict[str, tuple[type[Relic], ...]] = {
+    rarity: tuple(r for r in RELIC_POOL if r.rarity == rarity)
+    for rarity in (COMMON, UNCOMMON, RARE, STARTER)
+}
+_NAMES_BY_RARITY = {rarity: frozenset(r.name for r in pool)
+                    for rarity, pool in RELICS_BY_RARITY.items()}
+
+# Odds by rarity for get_random_relic(weighted=True)
+RELIC_RARITY_WEIGHTS = {COMMON: 50, UNCOMMON: 33, RARE: 17}
+_WEIGHTED_RARITIES = tuple(r for r, w in RELIC_RARITY_WEIGHTS.items() if w > 0)
+_CUM_WEIGHTS = tuple(accumulate(RELIC_RARITY_WEIGHTS[r] for r in _WEIGHTED_RARITIES))
+_WEIGHTED_NAMES = frozenset().union(*(_NAMES_BY_RARITY[r] for r in _WEIGHTED_RARITIES))
 
 
-def get_random_relic(exclude_names: list[str] = None) -> Relic:
-    import random
-    exclude_names = exclude_names or []
-    pool = [r for r in RELIC_POOL if r().name not in exclude_names]
-    if not pool:
-        pool = RELIC_POOL
-    return random.choice(pool)()
+def make_relic(name: str) -> Relic:
+    cls = RELICS.get(name)
+    if cls is None:
+        raise ValueError(f"Unknown relic: {name}")
+    return cls()
+
+
+def get_starter_relic() -> Relic:
+    return FirePendant()
 
 
-def get_chest_reward() -> Relic:
-    return get_random_relic()
+def get_random_relic(exclude_names: Collection[str] = (), rng=None,
+                     weighted: bool = False) -> Relic:
+    """Random relic from the pool, skipping `exclude_names` (ideally a set).
+
+    Uniform over the pool, or rarity first (RELIC_RARITY_WEIGHTS) when `weighted`.
+    If every candidate is excluded, falls back to uniform and then to duplicates.
+    """
+    rng = rng or random
+    if exclude_names and RELIC_POOL_NAMES.issubset(exclude_names):
+        exclude_names = ()
+    if weighted and not _WEIGHTED_NAMES.issubset(exclude_names):
+        total = _CUM_WEIGHTS[-1]
+        while True:
+            rarity = _WEIGHTED_RARITIES[bisect(_CUM_WEIGHTS, rng.random() * total)]
+            pool = RELICS_BY_RARITY[rarity]
+            if pool:
+                cls = rng.choice(pool)
+                if cls.name not in exclude_names:
+                    return cls()
+    while True:  # Rejection sampling: no filtered copy of the pool per call
+        cls = rng.choice(RELIC_POOL)
+        if cls.name not in exclude_names:
+            return cls()
+
+
+def get_chest_reward(owned_names: Collection[str] = (), rng=None) -> Relic:
+    return get_random_relic(owned_names, rng=rng)
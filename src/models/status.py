@@ -1,129 +1,115 @@
 """
 Status Effects System
+
+A combatant's statuses are stack counts in a fixed-length list indexed by
+status id (see StatusSet). What each status does when it ticks or how it
+modifies damage is a per-id table entry; StatusEffect objects carry only the
+name, colour and description and are built for display and for applying.
 """
 from __future__ import annotations
-from dataclasses import dataclass, field
-from typing import TYPE_CHECKING
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Callable, ClassVar, Iterator, Optional
+
+from src.systems.events import DamageDealt, Healed, StatusApplied
 
 if TYPE_CHECKING:
-    from src.models.hero import Hero
-    from src.models.enemy import Enemy
+    from src.models.combatant import Combatant
+    from src.systems.modifiers import Modifiers
+
+# Interned status ids: each is a slot in StatusSet's stack counts
+STRENGTH, DEXTERITY, WEAK, VULNERABLE, BURN, POISON, REGENERATION, RITUAL, THORNS = range(9)
+NUM_STATUSES = 9
 
 
-@dataclass
+@dataclass(slots=True)
 class StatusEffect:
+    status_id: ClassVar[int] = -1
     name: str
     stacks: int
     color: tuple = (200, 200, 200)
     description: str = ""
 
-    def tick(self, target) -> list[str]:
-        """Called at the start of the target's turn. Returns log messages."""
-        return []
-
-    def on_attack(self, base_damage: int, attacker) -> int:
-        """Modify outgoing damage."""
-        return base_damage
-
-    def on_receive_damage(self, base_damage: int, target) -> int:
-        """Modify incoming damage."""
-        return base_damage
-
-    def is_expired(self) -> bool:
-        return self.stacks <= 0
-
     def __repr__(self):
         return f"{self.name}({self.stacks})"
 
 
 class Strength(StatusEffect):
+    __slots__ = ()
+    status_id = STRENGTH
+
     def __init__(self, stacks: int):
         super().__init__("Strength", stacks, (220, 80, 80),
                          "Increases attack damage by 1 per stack.")
 
-    def on_attack(self, base_damage: int, attacker) -> int:
-        return base_damage + self.stacks
-
 
 class Dexterity(StatusEffect):
+    __slots__ = ()
+    status_id = DEXTERITY
+
     def __init__(self, stacks: int):
         super().__init__("Dexterity", stacks, (80, 140, 220),
                          "Increases block gained by 1 per stack.")
 
 
 class Weak(StatusEffect):
+    __slots__ = ()
+    status_id = WEAK
+
     def __init__(self, stacks: int):
         super().__init__("Weak", stacks, (180, 180, 60),
                          "Reduces attack damage by 25%.")
 
-    def on_attack(self, base_damage: int, attacker) -> int:
-        return int(base_damage * 0.75)
-
-    def tick(self, target) -> list[str]:
-        self.stacks -= 1
-        return []
-
 
 class Vulnerable(StatusEffect):
+    __slots__ = ()
+    status_id = VULNERABLE
+
     def __init__(self, stacks: int):
         super().__init__("Vulnerable", stacks, (220, 120, 60),
                          "Increases damage taken by 50%.")
 
-    def on_receive_damage(self, base_damage: int, target) -> int:
-        return int(base_damage * 1.5)
-
-    def tick(self, target) -> list[str]:
-        self.stacks -= 1
-        return []
-
 
 class Burn(StatusEffect):
+    __slots__ = ()
+    status_id = BURN
+
     def __init__(self, stacks: int):
         super().__init__("Burn", stacks, (255, 140, 30),
                          "At end of turn, take stacks damage.")
 
-    def tick(self, target) -> list[str]:
-        dmg = self.stacks
-        target.take_damage(dmg, ignore_block=True)
-        return [f"{target.name} burns for {dmg} damage!"]
-
 
 class Poison(StatusEffect):
+    __slots__ = ()
+    status_id = POISON
+
     def __init__(self, stacks: int):
         super().__init__("Poison", stacks, (100, 220, 80),
                          "At start of turn, take stacks damage, then reduce by 1.")
 
-    def tick(self, target) -> list[str]:
-        dmg = self.stacks
-        target.take_damage(dmg, ignore_block=True)
-        self.stacks -= 1
-        return [f"{target.name} is poisoned for {dmg} damage!"]
-
 
 class Regeneration(StatusEffect):
+    __slots__ = ()
+    status_id = REGENERATION
+
     def __init__(self, stacks: int):
         super().__init__("Regeneration", stacks, (60, 220, 140),
                          "At start of turn, heal stacks HP, then reduce by 1.")
 
-    def tick(self, target) -> list[str]:
-        heal = self.stacks
-        target.heal(heal)
-        self.stacks -= 1
-        return [f"{target.name} regenerates {heal} HP!"]
-
 
 class Ritual(StatusEffect):
     """Enemy-specific: gains strength each turn."""
+    __slots__ = ()
+    status_id = RITUAL
+
     def __init__(self, stacks: int):
         super().__init__("Ritual", stacks, (200, 60, 200),
                          "Gains stacks Strength at end of turn.")
 
-    def tick(self, target) -> list[str]:
-        target.apply_status(Strength(self.stacks))
-        return [f"{target.name} performs a ritual, gaining {self.stacks} Strength!"]
-
 
 class Thorns(StatusEffect):
+    __slots__ = ()
+    status_id = THORNS
+
     def __init__(self, stacks: int):
         super().__init__("Thorns", stacks, (180, 60, 60),
                          "When attacked, deals stacks damage back to attacker.")
@@ -142,8 +128,187 @@ STATUS_CLASSES = {
 }
 
 
+STATUS_IDS = {name: cls.status_id for name, cls in STATUS_CLASSES.items()}
+_CLASSES_BY_ID = sorted(STATUS_CLASSES.values(), key=lambda cls: cls.status_id)
+
+
 def make_status(name: str, stacks: int) -> StatusEffect:
     cls = STATUS_CLASSES.get(name)
     if cls is None:
         raise ValueError(f"Unknown status: {name}")
     return cls(stacks)
+
+
+def status_id(name: str) -> int:
+    sid = STATUS_IDS.get(name)
+    if sid is None:
+        raise ValueError(f"Unknown status: {name}")
+    return sid
+
+
+# ─────────────────────────────────────────────
+# Behaviour tables
+# ─────────────────────────────────────────────
+# Tick: called at the start of the owner's turn with the current stacks,
+# returns the new stacks and reports through target.events.
+
+def _tick_decay(target: "Combatant", stacks: int) -> int:
+    return stacks - 1
+
+def _tick_burn(target, stacks):
+    target.take_damage(stacks, ignore_block=True)
+    target.events.emit(DamageDealt, None, target, stacks, "Burn")
+    return stacks
+
+def _tick_poison(target, stacks):
+    target.take_damage(stacks, ignore_block=True)
+    target.events.emit(DamageDealt, None, target, stacks, "Poison")
+    return stacks - 1
+
+def _tick_regeneration(target, stacks):
+    target.heal(stacks)
+    target.events.emit(Healed, target, stacks, "Regeneration")
+    return stacks - 1
+
+def _tick_ritual(target, stacks):
+    target.add_status(STRENGTH, stacks)
+    target.events.emit(StatusApplied, target, target, "Strength", stacks, "Ritual")
+    return stacks
+
+
+_TICKS: list[Optional[Callable[["Combatant", int], int]]] = [None] * NUM_STATUSES
+_TICKS[WEAK] = _TICKS[VULNERABLE] = _tick_decay
+_TICKS[BURN] = _tick_burn
+_TICKS[POISON] = _tick_poison
+_TICKS[REGENERATION] = _tick_regeneration
+_TICKS[RITUAL] = _tick_ritual
+
+# Modify: add a present status's terms to its owner's damage / block modifiers.
+
+def _modify_strength(mods: "Modifiers", stacks: int):
+    mods.attack_add += stacks
+
+def _modify_dexterity(mods, stacks):
+    mods.block_add += stacks
+
+def _modify_weak(mods, stacks):
+    mods.attack_mult *= 0.75
+
+def _modify_vulnerable(mods, stacks):
+    mods.taken_mult *= 1.5
+
+
+_MODIFIES: list[Optional[Callable[["Modifiers", int], None]]] = [None] * NUM_STATUSES
+_MODIFIES[STRENGTH] = _modify_strength
+_MODIFIES[DEXTERITY] = _modify_dexterity
+_MODIFIES[WEAK] = _modify_weak
+_MODIFIES[VULNERABLE] = _modify_vulnerable
+
+
+# ─────────────────────────────────────────────
+# Status set
+# ─────────────────────────────────────────────
+
+class StatusSet:
+    """A combatant's statuses: stack counts indexed by status id, plus the ids
+    present in application order (the tick and display order). A status stays
+    present at zero or negative stacks until the next tick drops it.
+
+    `version` changes whenever a count or the set itself may have changed, so
+    derived values (see src.systems.modifiers) can be cached against it.
+    Statuses must therefore only be changed through add / apply / tick / retain.
+    """
+    __slots__ = ("counts", "order", "version")
+
+    def __init__(self, statuses=()):
+        self.counts: list[int] = [0] * NUM_STATUSES
+        self.order: list[int] = []
+        self.version = 0
+        for s in statuses:
+            self.apply(s)
+
+    def has(self, status_id: int) -> bool:
+        return status_id in self.order
+
+    def stacks(self, status_id: int) -> int:
+        return self.counts[status_id]
+
+    def get(self, status_id: int) -> Optional[StatusEffect]:
+        """Display copy of a present status, or None."""
+        if status_id not in self.order:
+            return None
+        return _CLASSES_BY_ID[status_id](self.counts[status_id])
+
+    def get_named(self, name: str) -> Optional[StatusEffect]:
+        sid = STATUS_IDS.get(name)
+        return None if sid is None else self.get(sid)
+
+    def add(self, status_id: int, stacks: int):
+        """Add stacks to a status, starting to track it if it is not present."""
+        self.version += 1
+        if status_id not in self.order:
+            self.order.append(status_id)
+        self.counts[status_id] += stacks
+
+    def apply(self, status: StatusEffect):
+        if status.status_id < 0:
+            raise ValueError(f"Unknown status: {status.name}")
+        self.add(status.status_id, status.stacks)
+
+    def tick(self, target: "Combatant"):
+        """Tick every status present at the start, then drop the expired ones in place."""
+        order = self.order
+        if not order:
+            return
+        counts = self.counts
+        for i in range(len(order)):  # Statuses applied while ticking wait a turn
+            sid = order[i]
+            tick = _TICKS[sid]
+            if tick is not None:
+                counts[sid] = tick(target, counts[sid])
+        self.retain(None)
+
+    def retain(self, keep: Optional[Callable[[int, int], bool]]):
+        """Keep the statuses for which keep(status_id, stacks) holds; with None,
+        those with positive stacks. Dropped counts are reset to zero."""
+        order, counts = self.order, self.counts
+        self.version += 1
+        n = 0
+        for sid in order:
+            if (counts[sid] > 0) if keep is None else keep(sid, counts[sid]):
+                order[n] = sid
+                n += 1
+            else:
+                counts[sid] = 0
+        del order[n:]
+
+    def modify(self, mods: "Modifiers"):
+        """Add every present status's terms to `mods`."""
+        counts = self.counts
+        for sid in self.order:
+            modify = _MODIFIES[sid]
+            if modify is not None:
+                modify(mods, counts[sid])
+
+    def items(self) -> list[tuple[int, int]]:
+        """(status id, stacks) of the present statuses, in application order."""
+        counts = self.counts
+        return [(sid, counts[sid]) for sid in self.order]
+
+    def clone(self) -> "StatusSet":
+        new = object.__new__(StatusSet)
+        new.counts = self.counts[:]
+        new.order = self.order[:]
+        new.version = self.version
+        return new
+
+    def __iter__(self) -> Iterator[StatusEffect]:
+        """Display copies of the present statuses, in application order."""
+        counts = self.counts
+        return (_CLASSES_BY_ID[sid](counts[sid]) for sid in self.order)
+
+    def __len__(self) -> int:
+        return len(self.order)
+
+    def __repr__(self):
+        return f"StatusSet({list(self)})"
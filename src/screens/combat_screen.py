@@ -7,6 +7,9 @@ from src.constants import *
 from src.screens.ui_utils import (draw_text, draw_button, draw_panel, draw_bar,
                                    draw_status_icons, get_font, wrap_text)
 from src.systems.combat import CombatPhase
+from src.systems.events import describe
+from src.systems.mcts import BackgroundSearch, END_TURN
+from src.systems.turn_solver import BackgroundSolve
 from src.models.card import ATTACK, SKILL, POWER
 from src.localization import t
 
@@ -27,12 +30,23 @@ class CombatScreen:
         self.hovered_card_idx = -1
         self.selected_card_idx = -1
         self.hovered_enemy_idx = -1
-        self.log_messages: list[str] = []
         self.damage_numbers: list[dict] = []  # floating damage numbers
         self.time = 0.0
         self.enemy_turn_timer = 0.0
         self.enemy_turn_pending = False
 
+        # Hint search: toggled with H, playouts/s overlay with F3
+        self.search = BackgroundSearch(budget=HINT_SEARCH_SECONDS)
+        self.hint_enabled = False
+        self.show_debug = False
+
+        # Auto-finish turn: the solver plans in a worker process, then its plan
+        # is played one move per AUTO_PLAY_DELAY
+        self.solver = BackgroundSolve(AUTO_SOLVE_POSITIONS, AUTO_SOLVE_SECONDS)
+        self.auto_solving = False
+        self.auto_moves = []
+        self.auto_timer = 0.0
+
         # ── Asset Loading ──
         self.enemy_images = {}
         try:
@@ -40,6 +54,13 @@ class CombatScreen:
         except:
             pass
 
+    def close(self):
+        """Release the hint search and solver workers (combat over or screen left)."""
+        self.search.close()
+        self.solver.close()
+        self.auto_solving = False
+        self.auto_moves = []
+
     # ── Card Layout ────────────────────────────────────────────────────────────
 
     def _card_rects(self, hand_size: int) -> list[pygame.Rect]:
@@ -63,6 +84,12 @@ class CombatScreen:
             rects.append(pygame.Rect(x, 80, ew, eh))
         return rects
 
+    def _end_turn_rect(self) -> pygame.Rect:
+        return pygame.Rect(SCREEN_WIDTH - 160, SCREEN_HEIGHT - 80, 140, 50)
+
+    def _auto_turn_rect(self) -> pygame.Rect:
+        return pygame.Rect(SCREEN_WIDTH - 310, SCREEN_HEIGHT - 80, 140, 50)
+
     # ── Events ────────────────────────────────────────────────────────────────
 
     def handle_event(self, event, game_state) -> bool:
@@ -76,6 +103,16 @@ class CombatScreen:
         card_rects = self._card_rects(len(hand))
         enemy_rects = self._enemy_rects(len(cs.enemies))
 
+        if event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_h:
+                self.hint_enabled = not self.hint_enabled
+                if not self.hint_enabled:
+                    self.search.stop()
+                return True
+            if event.key == pygame.K_F3:
+                self.show_debug = not self.show_debug
+                return True
+
         if event.type == pygame.MOUSEMOTION:
             self.hovered_card_idx = -1
             self.hovered_enemy_idx = -1
@@ -89,13 +126,18 @@ class CombatScreen:
                     self.hovered_enemy_idx = i
 
         if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+            if self.auto_solving or self.auto_moves:  # The solver is finishing the turn
+                return False
+
             # End turn button
-            end_rect = pygame.Rect(SCREEN_WIDTH - 160, SCREEN_HEIGHT - 80, 140, 50)
-            if end_rect.collidepoint(mx, my) and cs.phase == CombatPhase.PLAYER_TURN:
-                msgs = cs.end_player_turn()
-                self._add_log(msgs)
-                self.enemy_turn_pending = True
-                self.enemy_turn_timer = 0.8
+            if self._end_turn_rect().collidepoint(mx, my) and cs.phase == CombatPhase.PLAYER_TURN:
+                self._end_turn(cs)
+                return True
+
+            # Auto-finish turn button
+            if self._auto_turn_rect().collidepoint(mx, my) and cs.phase == CombatPhase.PLAYER_TURN:
+                self.solver.request(cs)
+                self.auto_solving = True
                 self.selected_card_idx = -1
                 return True
 
@@ -111,8 +153,8 @@ class CombatScreen:
                         # Select card, then click enemy
                         self.selected_card_idx = i
                     else:
-                        msgs = cs.play_card(card, None)
-                        self._add_log(msgs)
+                        cs.play_card(card, None, i)
+                        self._on_player_move((card.name, -1))
                         self.selected_card_idx = -1
                         self.hovered_card_idx = -1
                     return True
@@ -125,8 +167,8 @@ class CombatScreen:
                         if not enemy.is_dead():
                             card = hand[self.selected_card_idx] if self.selected_card_idx < len(hand) else None
                             if card:
-                                msgs = cs.play_card(card, enemy)
-                                self._add_log(msgs)
+                                cs.play_card(card, enemy, self.selected_card_idx)
+                                self._on_player_move((card.name, i))
                             self.selected_card_idx = -1
                         return True
 
@@ -135,10 +177,31 @@ class CombatScreen:
 
         return False
 
-    def _add_log(self, msgs: list[str]):
-        self.log_messages.extend(msgs)
-        if len(self.log_messages) > 8:
-            self.log_messages = self.log_messages[-8:]
+    def _end_turn(self, cs):
+        cs.end_player_turn()
+        self._on_player_move(END_TURN)
+        self.enemy_turn_pending = True
+        self.enemy_turn_timer = 0.8
+        self.selected_card_idx = -1
+
+    def _play_move(self, cs, move):
+        """Play a solver move (card name, target slot) or end the turn."""
+        if move == END_TURN:
+            self._end_turn(cs)
+            return
+        name, slot = move
+        for i, card in enumerate(cs.hero.hand):
+            if card.name == name and cs.can_play_card(card):
+                target = cs.enemies[slot] if slot >= 0 else None
+                cs.play_card(card, target, i)
+                self._on_player_move(move)
+                return
+        self.auto_moves = []  # The plan no longer fits the hand: hand control back
+
+    def _on_player_move(self, move):
+        # Keep the searched subtree for the move just made
+        if self.hint_enabled:
+            self.search.advance(move)
 
     # ── Update ────────────────────────────────────────────────────────────────
 
@@ -160,8 +223,33 @@ class CombatScreen:
             self.enemy_turn_timer -= dt
             if self.enemy_turn_timer <= 0:
                 self.enemy_turn_pending = False
-                msgs = cs.execute_enemy_turn()
-                self._add_log(msgs)
+                cs.execute_enemy_turn()
+
+        # Auto-finish turn: wait for the plan, then play it
+        if self.auto_solving:
+            plan = self.solver.result(cs)
+            if plan is not None:
+                self.auto_solving = False
+                self.auto_moves = plan.moves
+                self.auto_timer = AUTO_PLAY_DELAY
+            elif not self.solver.pending:  # Lost with the worker: hand control back
+                self.auto_solving = False
+        if self.auto_moves:
+            if cs.is_over or cs.phase != CombatPhase.PLAYER_TURN:
+                self.auto_moves = []
+            else:
+                self.auto_timer -= dt
+                if self.auto_timer <= 0:
+                    self.auto_timer = AUTO_PLAY_DELAY
+                    self._play_move(cs, self.auto_moves.pop(0))
+
+        # Hint search: one budget per position, reusing the tree between moves
+        if cs.is_over:
+            self.search.stop()
+        elif (self.hint_enabled and cs.phase == CombatPhase.PLAYER_TURN
+              and not self.enemy_turn_pending and not self.search.running
+              and not self.search.is_current(cs)):
+            self.search.start(cs)
 
         # Transition after combat ends
         if cs.is_over and not self.enemy_turn_pending:
@@ -201,6 +289,16 @@ class CombatScreen:
             selected = (i == self.selected_card_idx)
             self._draw_card(surface, card, rect, hovered, selected, cs.can_play_card(card))
 
+        # ── Hint ──
+        if self.hint_enabled and cs.phase == CombatPhase.PLAYER_TURN and not self.enemy_turn_pending:
+            self._draw_hint(surface, cs, card_rects, enemy_rects)
+        draw_text(surface, t("combat.hint_key"), SCREEN_WIDTH - 320, SCREEN_HEIGHT - 270,
+                  self.font_tiny, CYAN if self.hint_enabled else GREY)
+        if self.show_debug:
+            playouts, rate = self.search.stats()
+            draw_text(surface, f"MCTS {rate:,.0f} {t('combat.playouts')} | {playouts:,}",
+                      10, 10, self.font_tiny, CYAN)
+
         # ── Energy ──
         self._draw_energy(surface, hero)
 
@@ -210,14 +308,18 @@ class CombatScreen:
         draw_text(surface, f"{t('combat.discard')} {len(hero.discard_pile)}",
                   SCREEN_WIDTH - 150, SCREEN_HEIGHT - 30, self.font_small, LIGHT_GREY)
 
-        # ── End Turn button ──
-        end_rect = pygame.Rect(SCREEN_WIDTH - 160, SCREEN_HEIGHT - 80, 140, 50)
-        can_end = cs.phase == CombatPhase.PLAYER_TURN and not self.enemy_turn_pending
+        # ── End Turn / Auto Turn buttons ──
+        can_end = (cs.phase == CombatPhase.PLAYER_TURN and not self.enemy_turn_pending
+                   and not self.auto_solving and not self.auto_moves)
         btn_color = (40, 80, 40) if can_end else (50, 50, 50)
         btn_hover = (60, 120, 60) if can_end else (50, 50, 50)
-        draw_button(surface, end_rect, t("combat.end_turn"), self.font_btn,
+        draw_button(surface, self._end_turn_rect(), t("combat.end_turn"), self.font_btn,
                     color=btn_color, hover_color=btn_hover,
                     border_color=GREEN if can_end else GREY, mouse_pos=(mx, my))
+        draw_button(surface, self._auto_turn_rect(), t("combat.auto_turn"), self.font_btn,
+                    color=(30, 60, 80) if can_end else (50, 50, 50),
+                    hover_color=(45, 90, 120) if can_end else (50, 50, 50),
+                    border_color=CYAN if can_end else GREY, mouse_pos=(mx, my))
 
         # ── Turn indicator ──
         phase_text = t("combat.your_turn") if cs.phase == CombatPhase.PLAYER_TURN else t("combat.enemy_turn")
@@ -226,7 +328,11 @@ class CombatScreen:
                   self.font_btn, phase_col, center=True)
 
         # ── Combat log ──
-        self._draw_log(surface)
+        self._draw_log(surface, cs)
+
+        if self.auto_solving:
+            draw_text(surface, t("combat.solving"), SCREEN_WIDTH // 2, CARD_HAND_Y - 30,
+                      self.font_small, CYAN, center=True)
 
         # ── Selected card indicator ──
         if self.selected_card_idx >= 0:
@@ -234,6 +340,30 @@ class CombatScreen:
                       SCREEN_WIDTH // 2, CARD_HAND_Y - 30,
                       self.font_small, GOLD, center=True)
 
+    def _draw_hint(self, surface, cs, card_rects, enemy_rects):
+        move = self.search.best_move() if self.search.is_current(cs) else None
+        if move is None:
+            draw_text(surface, t("combat.hint_wait"), SCREEN_WIDTH // 2, CARD_HAND_Y - 55,
+                      self.font_small, CYAN, center=True)
+            return
+        if move == END_TURN:
+            label = t("combat.end_turn")
+            pygame.draw.rect(surface, CYAN, self._end_turn_rect().inflate(6, 6), 3, border_radius=8)
+        else:
+            name, slot = move
+            label = t("card.name." + name)
+            for i, (card, rect) in enumerate(zip(cs.hero.hand, card_rects)):
+                if card.name == name and cs.can_play_card(card):
+                    draw_y = rect.y - (30 if i == self.hovered_card_idx else 0)
+                    pygame.draw.rect(surface, CYAN, (rect.x - 3, draw_y - 3, CARD_W + 6, CARD_H + 6),
+                                     3, border_radius=10)
+                    break
+            if slot >= 0:
+                label += f" ({t('enemy.name.' + cs.enemies[slot].name)})"
+                pygame.draw.rect(surface, CYAN, enemy_rects[slot].inflate(8, 8), 3, border_radius=12)
+        draw_text(surface, f"{t('combat.hint')} {label}", SCREEN_WIDTH // 2, CARD_HAND_Y - 55,
+                  self.font_small, CYAN, center=True)
+
     def _draw_bg(self, surface):
         # Subtle vignette
         for i in range(8):
@@ -368,13 +498,13 @@ class CombatScreen:
         draw_text(surface, str(hero.energy), cx, cy, self.font_title, BLACK, center=True, shadow=False)
         draw_text(surface, f"/{hero.max_energy}", cx + 18, cy + 10, self.font_tiny, (80, 60, 0), shadow=False)
 
-    def _draw_log(self, surface):
+    def _draw_log(self, surface, cs):
         log_x = SCREEN_WIDTH - 320
         log_y = SCREEN_HEIGHT - 250
         draw_panel(surface, log_x, log_y, 300, 160, color=(15, 12, 25, 180))
         draw_text(surface, t("combat.log_title"), log_x + 10, log_y + 5, self.font_tiny, GREY)
-        for i, msg in enumerate(self.log_messages[-7:]):
+        for i, event in enumerate(cs.events.latest(7)):  # Only what is on screen gets formatted
             alpha = 100 + int(155 * (i + 1) / 7)
             col = (alpha, alpha, alpha)
-            draw_text(surface, msg[:38], log_x + 8, log_y + 22 + i * 19,
+            draw_text(surface, describe(event)[:38], log_x + 8, log_y + 22 + i * 19,
                       self.font_tiny, col, shadow=False)
@@ -36,8 +36,7 @@ class EventScreen:
             for i, choice in enumerate(ev.choices):
                 btn_rect = self._choice_rect(i)
                 if btn_rect.collidepoint(mx, my):
-                    result = choice.effect_fn(game_state.hero)
-                    self.result_msg = str(result) if result else "Done."
+                    self.result_msg = game_state.choose_event_option(i)
                     self.choice_made = True
                     return True
         return False
@@ -6,9 +6,15 @@ import math
 from src.constants import *
 from src.screens.ui_utils import draw_text, draw_button, draw_panel, draw_bar, get_font
 from src.systems.dungeon import *
+from src.systems.route_planner import RoutePlanner
 from src.localization import t
 
 
+PATH_HIGHLIGHT   = (240, 220, 140)  # Paths to the hovered node
+SUGGESTED_PATH   = (110, 210, 255)  # Route planner overlay
+UNREACHABLE_GREY = (70, 70, 80)     # Nodes the player can no longer reach
+
+
 class MapScreen:
     def __init__(self):
         self.font_title = get_font(36, bold=True)
@@ -33,6 +39,13 @@ class MapScreen:
                 self.icons[ntype] = pygame.transform.scale(img, (32, 32))
             except:
                 self.icons[ntype] = None
+        # Faded copies for nodes that can no longer be reached
+        self.dim_icons = {}
+        for ntype, img in self.icons.items():
+            if img:
+                dim = img.copy()
+                dim.set_alpha(70)
+                self.dim_icons[ntype] = dim
 
         # Specific assets
         try:
@@ -54,6 +67,8 @@ class MapScreen:
         self.scroll_y = 0.0
         self.target_scroll_y = 0.0
         self.scroll_speed = 10.0
+        self.max_floor = 15  # Refreshed from the dungeon on every draw
+        self.planner = RoutePlanner()
 
     def handle_event(self, event, game_state) -> bool:
         if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
@@ -103,9 +118,9 @@ class MapScreen:
         self.scroll_y += (self.target_scroll_y - self.scroll_y) * 0.1
         
         # ── Clamping ──
-        # Act length is 15. Floor height is 100.
-        # Max scroll should be around (15 * 100) - window_height
-        max_scroll = 15 * 100 - 400 
+        # Floor height is 100; the map grows as endless floors are generated.
+        # Max scroll should be around (max_floor * 100) - window_height
+        max_scroll = max(0, self.max_floor * 100 - 400)
         self.target_scroll_y = max(0, min(self.target_scroll_y, max_scroll))
         self.scroll_y = max(0, min(self.scroll_y, max_scroll))
 
@@ -121,6 +136,7 @@ class MapScreen:
 
         hero = game_state.hero
         dungeon = game_state.dungeon
+        self.max_floor = dungeon.max_floor
 
         # ── Title ──
         draw_text(surface, t("map.title"), SCREEN_WIDTH // 2, 30,
@@ -174,30 +190,58 @@ class MapScreen:
         scroll_offset = self._get_scroll_offset(dungeon)
         nodes_by_floor = dungeon.get_nodes_by_floor()
         
+        # Reachability: fade what is already out of reach, trace paths to the hovered node
+        mx, my = pygame.mouse.get_pos()
+        future = dungeon.reach_mask()
+        path = 0
+        for node in dungeon.nodes.values():
+            if dungeon.in_mask(node, future) and \
+                    self._get_node_rect(node, scroll_offset).collidepoint(mx, my):
+                path = dungeon.path_mask(node.id)
+                break
+
         # Draw connections first (behind nodes)
         for node in dungeon.nodes.values():
             start_rect = self._get_node_rect(node, scroll_offset)
+            node_ahead = dungeon.in_mask(node, future)
             for child_id in node.children_ids:
                 child = dungeon.nodes.get(child_id)
                 if child:
                     end_rect = self._get_node_rect(child, scroll_offset)
                     # Color based on reachability/completion
                     line_col = GREY
-                    if node.completed and child.reachable:
+                    if dungeon.in_mask(child, path) and (node.completed or dungeon.in_mask(node, path)):
+                        line_col = PATH_HIGHLIGHT
+                    elif node.completed and child.reachable:
                         line_col = GOLD
                     elif node.completed and child.completed:
                         line_col = WHITE
-                    
+                    elif not node_ahead and not node.completed:
+                        line_col = UNREACHABLE_GREY
+
                     pygame.draw.line(surface, line_col, start_rect.center, end_rect.center, 3)
 
+        # Suggested route (cached by the planner until the map or hero changes)
+        route = self.planner.plan(dungeon, hero).node_ids
+        for a, b in zip(route, route[1:]):
+            start = self._get_node_rect(dungeon.nodes[a], scroll_offset).center
+            end = self._get_node_rect(dungeon.nodes[b], scroll_offset).center
+            pygame.draw.line(surface, SUGGESTED_PATH, start, end, 2)
+        if route:
+            draw_text(surface, f"— {t('map.suggested')}", 35, SCREEN_HEIGHT - 40,
+                      self.font_small, SUGGESTED_PATH)
+
         # Draw nodes
-        mx, my = pygame.mouse.get_pos()
         for floor, nodes in nodes_by_floor.items():
             for node in nodes:
                 rect = self._get_node_rect(node, scroll_offset)
                 color = NODE_COLORS.get(node.node_type, GREY)
                 icon_img = self.icons.get(node.node_type)
-                
+                lost = not node.completed and not node.current and not dungeon.in_mask(node, future)
+                if lost:
+                    color = UNREACHABLE_GREY
+                    icon_img = self.dim_icons.get(node.node_type)
+
                 # Highlight current/selected
                 if node.current:
                     pygame.draw.circle(surface, GOLD, rect.center, 32, 3)
@@ -206,7 +250,11 @@ class MapScreen:
                     # Pulsing highlight for reachable
                     pulse = int(5 * math.sin(pygame.time.get_ticks() * 0.005))
                     pygame.draw.circle(surface, (200, 200, 200), rect.center, 28 + pulse, 2)
-                
+                if dungeon.in_mask(node, path):
+                    pygame.draw.circle(surface, PATH_HIGHLIGHT, rect.center, 30, 2)
+                elif route and node.id == route[0]:
+                    pygame.draw.circle(surface, SUGGESTED_PATH, rect.center, 30, 2)
+
                 # Draw node base
                 base_col = (30, 30, 40)
                 if node.completed:
@@ -224,7 +272,8 @@ class MapScreen:
                         surface.blit(icon_img, icon_rect)
                 else:
                     icon = NODE_ICONS.get(node.node_type, "?")
-                    draw_text(surface, icon, rect.centerx, rect.centery - 10, self.font, WHITE, center=True)
+                    draw_text(surface, icon, rect.centerx, rect.centery - 10, self.font,
+                              UNREACHABLE_GREY if lost else WHITE, center=True)
 
                 # Label (Floor)
                 # draw_text(surface, str(node.floor), rect.centerx, rect.centery + 15, self.font_small, LIGHT_GREY, center=True)
@@ -30,10 +30,7 @@ class MerchantScreen:
             for i, (card, price) in enumerate(cards):
                 btn_rect = self._card_buy_rect(i)
                 if btn_rect.collidepoint(mx, my):
-                    if hero.gold >= price:
-                        hero.gold -= price
-                        hero.add_card_to_deck(card)
-                        game_state.merchant_cards.pop(i)
+                    if game_state.buy_merchant_card(i):
                         self._show_msg(f"{t('merchant.bought')} {t('card.name.' + card.name)}!")
                     else:
                         self._show_msg(t('merchant.no_gold'))
@@ -42,12 +39,8 @@ class MerchantScreen:
             # Remove card button
             remove_rect = pygame.Rect(SCREEN_WIDTH - 220, 200, 180, 45)
             if remove_rect.collidepoint(mx, my):
-                from src.constants import REMOVE_PRICE
-                if hero.gold >= REMOVE_PRICE and len(hero.deck) > 1:
-                    import random
-                    card = random.choice(hero.deck)
-                    hero.remove_card_from_deck(card)
-                    hero.gold -= REMOVE_PRICE
+                card = game_state.buy_card_removal()
+                if card:
                     self._show_msg(f"{t('merchant.removed')} {t('card.name.' + card.name)}!")
                 elif hero.gold < REMOVE_PRICE:
                     self._show_msg(t('merchant.no_gold'))
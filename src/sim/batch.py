@@ -0,0 +1,533 @@
+"""
+Batch combat kernel — thousands of identical-setup fights advanced in lockstep with NumPy.
+
+State is stored struct-of-arrays: every hero/enemy stat, status stack and pile is an
+array indexed by simulation. Each step, every unfinished simulation either plays its
+leftmost playable card (FirstPlayablePolicy) or ends its turn, and card effects run
+once per card type over all simulations that played it.
+
+Only one enemy and a deterministic subset of the card pool are supported. With
+`seeds`, deck shuffles replay the scalar engine's RNG exactly, so results match
+`run_combat(..., FirstPlayablePolicy())` fight for fight (see `verify`).
+
+    python -m src.sim.batch --enemy "Jaw Worm" --floor 3 --sims 20000 --hp-scales 1.0 1.3 1.6
+    python -m src.sim.batch --verify
+"""
+from __future__ import annotations
+import argparse
+import time
+from dataclasses import dataclass
+from typing import Callable, Optional, Sequence
+
+import numpy as np
+
+from src.models.card import ALL_CARDS
+from src.models.enemy import Action, Enemy
+from src.models.hero import Hero
+from src.systems.rng import GameRng
+
+MAX_TURNS = 100
+
+# Relics that do nothing during the fight itself: name -> HP healed on a win
+END_OF_COMBAT_HEAL = {"Fire Pendant": 6, "Burning Blood": 6}
+INERT_RELICS = {"Odd Mushroom", "Tiny Chest"}
+
+HERO_STATUSES  = ("Strength", "Dexterity", "Weak", "Vulnerable", "Thorns", "Burn")
+ENEMY_STATUSES = ("Strength", "Weak", "Vulnerable", "Ritual")
+
+_ACTION_CODES = {Action.ATTACK: 0, Action.DEFEND: 1, Action.BUFF: 2, Action.DEBUFF: 3}
+
+
+@dataclass
+class BatchResult:
+    won: np.ndarray
+    turns: np.ndarray
+    cards_played: np.ndarray
+    hero_hp: np.ndarray
+    timed_out: np.ndarray
+    seconds: float = 0.0
+
+    @property
+    def sims(self) -> int:
+        return len(self.won)
+
+    @property
+    def win_rate(self) -> float:
+        return float(self.won.mean()) if self.sims else 0.0
+
+    def format(self) -> str:
+        rate = self.sims / self.seconds if self.seconds > 0 else 0.0
+        return (f"{self.sims} fights in {self.seconds:.2f}s ({rate:,.0f} fights/s) | "
+                f"win rate {self.win_rate:.1%} | avg turns {self.turns.mean():.1f} | "
+                f"avg HP left {self.hero_hp.mean():.1f} | timeouts {int(self.timed_out.sum())}")
+
+
+class BatchCombat:
+    """`n` copies of one fight (hero template vs. enemy template) advanced together."""
+
+    def __init__(self, hero: Hero, enemy: Enemy, n: int = 0,
+                 seeds: Optional[Sequence[int]] = None, seed: Optional[int] = None,
+                 max_turns: int = MAX_TURNS):
+        if seeds is not None:
+            n = len(seeds)
+        self.n = n
+        self.max_turns = max_turns
+        self._check_supported(hero)
+
+        # ── Card table ──
+        names = sorted({c.name for c in hero.deck})
+        self.card_names = names
+        self.effects = [CARD_EFFECTS[name] for name in names]
+        self.cost = np.array([ALL_CARDS[name].cost for name in names])
+        self.exhausts = np.array([ALL_CARDS[name].exhausts for name in names])
+        self.is_strike = np.array(["strike" in name.lower() for name in names])
+        code = {name: i for i, name in enumerate(names)}
+        self.deck = np.array([code[c.name] for c in hero.deck], dtype=np.int16)
+        self.deck_strikes = int(self.is_strike[self.deck].sum())
+        self.heal_on_win = sum(END_OF_COMBAT_HEAL.get(r.name, 0) for r in hero.relics)
+
+        # ── Enemy action pattern ──
+        pattern = enemy.action_pattern
+        self.act_type = np.array([_ACTION_CODES[a.type] for a in pattern])
+        self.act_value = np.array([a.value for a in pattern])
+        self.act_status = [a.status_name for a in pattern]
+        self.act_stacks = np.array([a.status_stacks for a in pattern])
+
+        # ── Per-simulation state ──
+        D = len(self.deck)
+        self.D = D
+        self._cols = np.arange(D)
+        self.h_hp = np.full(n, hero.current_hp)
+        self.h_max_hp = np.full(n, hero.max_hp)
+        self.h_block = np.zeros(n, dtype=np.int64)
+        self.h_energy = np.zeros(n, dtype=np.int64)
+        self.max_energy = hero.max_energy
+        metallicize = hero.powers.get("Metallicize")
+        self.h_metallicize = np.full(n, metallicize.amount if metallicize else 0, dtype=np.int64)
+        self.h_status = {name: np.zeros(n, dtype=np.int64) for name in HERO_STATUSES}
+        for s in hero.statuses:
+            self.h_status[s.name][:] = s.stacks
+
+        self.e_hp = np.full(n, enemy.current_hp)
+        self.e_block = np.full(n, enemy.block, dtype=np.int64)
+        self.e_action = np.full(n, enemy.action_index)
+        self.e_status = {name: np.zeros(n, dtype=np.int64) for name in ENEMY_STATUSES}
+        for s in enemy.statuses:
+            self.e_status[s.name][:] = s.stacks
+
+        self.draw = np.zeros((n, D), dtype=np.int16)
+        self.hand = np.zeros((n, D), dtype=np.int16)
+        self.disc = np.zeros((n, D), dtype=np.int16)
+        self.draw_n = np.zeros(n, dtype=np.int64)
+        self.hand_n = np.zeros(n, dtype=np.int64)
+        self.disc_n = np.zeros(n, dtype=np.int64)
+
+        self.turn = np.zeros(n, dtype=np.int64)
+        self.played = np.zeros(n, dtype=np.int64)
+        self.done = np.zeros(n, dtype=bool)
+        self.won = np.zeros(n, dtype=bool)
+        self.timed_out = np.zeros(n, dtype=bool)
+
+        # Exact mode replays each fight's combat stream; otherwise shuffle with NumPy
+        self._rngs = [GameRng(s).combat for s in seeds] if seeds is not None else None
+        self._np_rng = np.random.default_rng(seed)
+
+    @staticmethod
+    def _check_supported(hero: Hero):
+        for c in hero.deck:
+            if c.name not in CARD_EFFECTS:
+                raise ValueError(f"Card not supported by the batch kernel: {c.name}")
+        for r in hero.relics:
+            if r.name not in END_OF_COMBAT_HEAL and r.name not in INERT_RELICS:
+                raise ValueError(f"Relic not supported by the batch kernel: {r.name}")
+        for s in hero.statuses:
+            if s.name not in HERO_STATUSES:
+                raise ValueError(f"Status not supported by the batch kernel: {s.name}")
+        for name in hero.powers:
+            if name != "Metallicize":
+                raise ValueError(f"Power not supported by the batch kernel: {name}")
+
+    # ── Piles ────────────────────────────────────────────────────────────────
+
+    def _shuffled(self, rows: np.ndarray, piles: np.ndarray, counts: np.ndarray) -> np.ndarray:
+        """Return piles[rows] with the first counts[i] entries of each row shuffled."""
+        if self._rngs is not None:
+            out = piles.copy()
+            for i, r in enumerate(rows):
+                m = int(counts[i])
+                perm = list(range(m))
+                self._rngs[r].shuffle(perm)  # Same draws as shuffling the Card list
+                out[i, :m] = piles[i, perm]
+            return out
+        keys = self._np_rng.random((len(rows), self.D))
+        keys[self._cols >= counts[:, None]] = 2.0
+        return np.take_along_axis(piles, np.argsort(keys, axis=1), axis=1)
+
+    def draw_cards(self, rows: np.ndarray, n: int):
+        for _ in range(n):
+            empty = self.draw_n[rows] == 0
+            if empty.any():
+                refill = rows[empty & (self.disc_n[rows] > 0)]
+                if refill.size:
+                    self.draw[refill] = self._shuffled(refill, self.disc[refill], self.disc_n[refill])
+                    self.draw_n[refill] = self.disc_n[refill]
+                    self.disc_n[refill] = 0
+                rows = rows[self.draw_n[rows] > 0]
+                if not rows.size:
+                    return
+            top = self.draw_n[rows] - 1
+            self.hand[rows, self.hand_n[rows]] = self.draw[rows, top]
+            self.hand_n[rows] += 1
+            self.draw_n[rows] = top
+
+    def _remove_from_hand(self, rows: np.ndarray, idx: np.ndarray):
+        src = self._cols + (self._cols >= idx[:, None])
+        np.minimum(src, self.D - 1, out=src)
+        self.hand[rows] = np.take_along_axis(self.hand[rows], src, axis=1)
+        self.hand_n[rows] -= 1
+
+    def _discard_hand(self, rows: np.ndarray):
+        valid = self._cols < self.hand_n[rows, None]
+        r = np.broadcast_to(rows[:, None], valid.shape)[valid]
+        pos = (self.disc_n[rows, None] + self._cols)[valid]
+        self.disc[r, pos] = self.hand[rows][valid]
+        self.disc_n[rows] += self.hand_n[rows]
+        self.hand_n[rows] = 0
+
+    # ── Hero ─────────────────────────────────────────────────────────────────
+
+    def calc_damage(self, rows: np.ndarray, base) -> np.ndarray:
+        dmg = base + self.h_status["Strength"][rows]
+        dmg = np.where(self.h_status["Weak"][rows] > 0, dmg * 3 // 4, dmg)
+        return np.maximum(dmg, 0)
+
+    def gain_block(self, rows: np.ndarray, amount):
+        self.h_block[rows] += np.maximum(amount, 0)
+
+    def lose_hp(self, rows: np.ndarray, amount):
+        self.h_hp[rows] = np.maximum(self.h_hp[rows] - amount, 0)
+
+    def heal(self, rows: np.ndarray, amount):
+        self.h_hp[rows] = np.minimum(self.h_hp[rows] + amount, self.h_max_hp[rows])
+
+    def dexterity(self, rows: np.ndarray) -> np.ndarray:
+        return self.h_status["Dexterity"][rows]
+
+    def hit_enemy(self, rows: np.ndarray, dmg: np.ndarray):
+        """Enemy.take_damage(dmg, attacker=hero)."""
+        dmg = np.where(self.e_status["Vulnerable"][rows] > 0, dmg * 3 // 2, dmg)
+        absorbed = np.minimum(self.e_block[rows], dmg)
+        self.e_block[rows] -= absorbed
+        self.e_hp[rows] = np.maximum(self.e_hp[rows] - (dmg - absorbed), 0)
+
+    # ── Turn structure ───────────────────────────────────────────────────────
+
+    def _begin_player_turn(self, rows: np.ndarray):
+        self.turn[rows] += 1
+        self.h_block[rows] = 0
+        self.h_energy[rows] = self.max_energy
+        st = self.h_status
+        self.lose_hp(rows, st["Burn"][rows])
+        st["Weak"][rows] -= 1
+        st["Vulnerable"][rows] -= 1
+        for stacks in st.values():  # Expired statuses (stacks <= 0) are removed
+            stacks[rows] = np.maximum(stacks[rows], 0)
+        self.draw_cards(rows, 5)
+        self._check_death(rows)
+
+        late = rows[~self.done[rows] & (self.turn[rows] > self.max_turns)]
+        self.timed_out[late] = True
+        self.done[late] = True
+
+    def _play(self, rows: np.ndarray, idx: np.ndarray):
+        codes = self.hand[rows, idx]
+        self._remove_from_hand(rows, idx)
+        self.h_energy[rows] -= self.cost[codes]
+        for code in np.unique(codes):
+            self.effects[code](self, rows[codes == code])
+
+        keep = ~self.exhausts[codes]
+        kept = rows[keep]
+        self.disc[kept, self.disc_n[kept]] = codes[keep]
+        self.disc_n[kept] += 1
+        self.played[rows] += 1
+        self._check_death(rows)
+
+    def _end_turn(self, rows: np.ndarray):
+        # Hero end of turn
+        met = self.h_metallicize[rows]
+        self.gain_block(rows, met)
+        self._discard_hand(rows)
+
+        # Enemy start of turn
+        es = self.e_status
+        self.e_block[rows] = 0
+        es["Strength"][rows] += es["Ritual"][rows]
+        es["Weak"][rows] -= 1
+        es["Vulnerable"][rows] -= 1
+        for stacks in es.values():
+            stacks[rows] = np.maximum(stacks[rows], 0)
+
+        # Enemy action
+        act = self.e_action[rows]
+        for a in np.unique(act):
+            self._enemy_action(rows[act == a], int(a))
+        self.e_action[rows] = (act + 1) % len(self.act_type)
+
+        self._check_death(rows)
+        self._begin_player_turn(rows[~self.done[rows]])
+
+    def _enemy_action(self, rows: np.ndarray, a: int):
+        kind, value = self.act_type[a], self.act_value[a]
+        if kind == 0:  # Attack
+            es, hs = self.e_status, self.h_status
+            dmg = value + es["Strength"][rows]
+            dmg = np.maximum(np.where(es["Weak"][rows] > 0, dmg * 3 // 4, dmg), 0)
+            dmg = np.where(hs["Vulnerable"][rows] > 0, dmg * 3 // 2, dmg)
+            hit = dmg > 0
+            thorns = np.where(hit, hs["Thorns"][rows], 0)
+            self.e_hp[rows] = np.maximum(self.e_hp[rows] - np.maximum(thorns, 0), 0)
+            absorbed = np.minimum(self.h_block[rows], dmg)
+            self.h_block[rows] -= absorbed
+            self.lose_hp(rows, dmg - absorbed)
+        elif kind == 1:  # Defend
+            self.e_block[rows] = np.maximum(self.e_block[rows] + value, 0)
+        elif kind == 2:  # Buff self
+            self.e_status[self.act_status[a]][rows] += self.act_stacks[a]
+        else:            # Debuff hero
+            self.h_status[self.act_status[a]][rows] += self.act_stacks[a]
+
+    def _check_death(self, rows: np.ndarray):
+        lost = self.h_hp[rows] <= 0
+        won = ~lost & (self.e_hp[rows] <= 0)
+        winners = rows[won]
+        self.heal(winners, self.heal_on_win)
+        self.won[winners] = True
+        self.done[rows[lost | won]] = True
+
+    # ── Driver ───────────────────────────────────────────────────────────────
+
+    def run(self) -> BatchResult:
+        start = time.perf_counter()
+        rows = np.arange(self.n)
+        self.draw[:] = self._shuffled(rows, np.broadcast_to(self.deck, (self.n, self.D)),
+                                      np.full(self.n, self.D))
+        self.draw_n[:] = self.D
+        self._begin_player_turn(rows)
+
+        while True:
+            rows = np.flatnonzero(~self.done)
+            if not rows.size:
+                break
+            hand = self.hand[rows]
+            playable = (self._cols < self.hand_n[rows, None]) & \
+                       (self.cost[hand] <= self.h_energy[rows, None]) & (self.cost[hand] >= 0)
+            has = playable.any(axis=1)
+            if has.any():
+                self._play(rows[has], playable[has].argmax(axis=1))
+            if not has.all():
+                self._end_turn(rows[~has])
+
+        return BatchResult(self.won.copy(), self.turn.copy(), self.played.copy(),
+                           self.h_hp.copy(), self.timed_out.copy(),
+                           time.perf_counter() - start)
+
+
+# ─────────────────────────────────────────────
+# Card effects (array form of src.models.card)
+# ─────────────────────────────────────────────
+
+def _attack(base: int, hits: int = 1, vulnerable: int = 0) -> Callable:
+    def effect(b: BatchCombat, rows):
+        dmg = b.calc_damage(rows, base)
+        for _ in range(hits):
+            b.hit_enemy(rows, dmg)
+        if vulnerable:
+            b.e_status["Vulnerable"][rows] += vulnerable
+    return effect
+
+def _block(base: int, draw: int = 0, dex: bool = True) -> Callable:
+    def effect(b: BatchCombat, rows):
+        b.gain_block(rows, base + (b.dexterity(rows) if dex else 0))
+        if draw:
+            b.draw_cards(rows, draw)
+    return effect
+
+def _strength(stacks: int) -> Callable:
+    def effect(b: BatchCombat, rows):
+        b.h_status["Strength"][rows] += stacks
+    return effect
+
+def _pommel_strike(b, rows):
+    b.hit_enemy(rows, b.calc_damage(rows, 9))
+    b.draw_cards(rows, 1)
+
+def _iron_wave(b, rows):
+    b.hit_enemy(rows, b.calc_damage(rows, 5))
+    b.gain_block(rows, 5 + b.dexterity(rows))
+
+def _body_slam(b, rows):
+    b.hit_enemy(rows, b.calc_damage(rows, b.h_block[rows]))
+
+def _perfected_strike(b, rows):
+    in_hand = b.is_strike[b.hand[rows]] & (b._cols < b.hand_n[rows, None])
+    in_disc = b.is_strike[b.disc[rows]] & (b._cols < b.disc_n[rows, None])
+    strikes = b.deck_strikes + in_hand.sum(axis=1) + in_disc.sum(axis=1)
+    b.hit_enemy(rows, b.calc_damage(rows, 6 + strikes * 2))
+
+def _feed(b, rows):
+    b.hit_enemy(rows, b.calc_damage(rows, 10))
+    fatal = rows[b.e_hp[rows] <= 0]
+    b.h_max_hp[fatal] += 3
+    b.heal(fatal, 3)
+
+def _reaper(b, rows):
+    dmg = b.calc_damage(rows, 4)
+    b.hit_enemy(rows, dmg)
+    b.heal(rows, dmg)
+
+def _entrench(b, rows):
+    b.gain_block(rows, b.h_block[rows])
+
+def _flame_barrier(b, rows):
+    b.gain_block(rows, 12 + b.dexterity(rows))
+    b.h_status["Thorns"][rows] += 4
+
+def _limit_break(b, rows):
+    b.h_status["Strength"][rows] *= 2
+
+def _seeing_red(b, rows):
+    b.h_energy[rows] += 2
+
+def _bloodletting(b, rows):
+    b.lose_hp(rows, 3)
+    b.h_energy[rows] += 2
+
+def _offering(b, rows):
+    b.lose_hp(rows, 6)
+    b.h_energy[rows] += 2
+    b.draw_cards(rows, 3)
+
+def _battle_trance(b, rows):
+    b.draw_cards(rows, 3)
+
+def _spot_weakness(b, rows):
+    attacking = b.act_type[b.e_action[rows]] == 0
+    b.h_status["Strength"][rows[attacking]] += 3
+
+def _metallicize(b, rows):
+    b.h_metallicize[rows] += 3
+
+
+CARD_EFFECTS: dict[str, Callable] = {
+    "Strike":           _attack(6),
+    "Bash":             _attack(8, vulnerable=2),
+    "Heavy Blade":      _attack(14),
+    "Twin Strike":      _attack(5, hits=2),
+    "Cleave":           _attack(8),
+    "Thunderclap":      _attack(4, vulnerable=1),
+    "Pommel Strike":    _pommel_strike,
+    "Iron Wave":        _iron_wave,
+    "Body Slam":        _body_slam,
+    "Perfected Strike": _perfected_strike,
+    "Feed":             _feed,
+    "Reaper":           _reaper,
+    "Defend":           _block(5),
+    "Shrug It Off":     _block(8, draw=1),
+    "Armaments":        _block(5, draw=1),
+    "Sentinel":         _block(13),
+    "Impervious":       _block(30, dex=False),
+    "Entrench":         _entrench,
+    "Flame Barrier":    _flame_barrier,
+    "Inflame":          _strength(2),
+    "Flex":             _strength(2),
+    "Limit Break":      _limit_break,
+    "Seeing Red":       _seeing_red,
+    "Bloodletting":     _bloodletting,
+    "Offering":         _offering,
+    "Battle Trance":    _battle_trance,
+    "Spot Weakness":    _spot_weakness,
+    "Metallicize":      _metallicize,
+}
+
+
+# ─────────────────────────────────────────────
+# Verification against the scalar engine
+# ─────────────────────────────────────────────
+
+STARTER = ["Strike"] * 5 + ["Defend"] * 4 + ["Bash"]
+
+# (deck, enemy, floor, elite)
+VERIFY_CORPUS = [
+    (STARTER, "Jaw Worm", 1, False),
+    (STARTER, "Cultist", 2, False),
+    (STARTER, "Louse", 3, False),
+    (STARTER, "Fungal Spore", 3, False),
+    (STARTER, "Gremlin Nob", 4, False),
+    (STARTER, "Lagavulin", 5, True),
+    (STARTER, "Sentry", 6, False),
+    (STARTER, "The Guardian", 5, False),
+    (STARTER + ["Pommel Strike", "Shrug It Off", "Twin Strike"], "Red Slaver", 4, False),
+    (STARTER + ["Inflame", "Limit Break", "Heavy Blade"], "Blue Slaver", 6, True),
+    (STARTER + ["Flame Barrier", "Metallicize", "Body Slam", "Entrench"], "Repulsor", 7, False),
+    (STARTER + ["Offering", "Seeing Red", "Bloodletting", "Battle Trance"], "Writhing Mass", 8, False),
+    (STARTER + ["Perfected Strike", "Feed", "Reaper", "Thunderclap"], "Hexaghost", 10, False),
+    (STARTER + ["Spot Weakness", "Iron Wave", "Armaments", "Sentinel"], "Deca", 9, False),
+    (STARTER + ["Impervious", "Cleave", "Flex"], "Slime Boss", 15, False),
+]
+
+
+def verify(corpus=VERIFY_CORPUS, fights: int = 200, seed: int = 0) -> int:
+    """Replay every corpus entry in both engines with the same seeds. Returns mismatches."""
+    from src.sim.combat_runner import make_hero, make_enemy, run_combat
+    from src.sim.policy import FirstPlayablePolicy
+
+    policy = FirstPlayablePolicy()
+    mismatches = 0
+    for deck, enemy_name, floor, elite in corpus:
+        seeds = list(range(seed, seed + fights))
+        batch = BatchCombat(make_hero(deck), make_enemy(enemy_name, floor, elite), seeds=seeds).run()
+        bad = 0
+        for i, s in enumerate(seeds):
+            r = run_combat(make_hero(deck, seed=s), [make_enemy(enemy_name, floor, elite)], policy)
+            scalar = (r.won, r.turns, r.cards_played, r.hero_hp, r.timed_out)
+            vector = (bool(batch.won[i]), int(batch.turns[i]), int(batch.cards_played[i]),
+                      int(batch.hero_hp[i]), bool(batch.timed_out[i]))
+            if scalar != vector:
+                bad += 1
+                if bad == 1:
+                    print(f"  seed {s}: scalar {scalar} != batch {vector}")
+        mismatches += bad
+        print(f"{enemy_name:>14} floor {floor:>2}{' elite' if elite else '      '} "
+              f"deck {len(deck):>2}: {fights - bad}/{fights} match, "
+              f"win rate {batch.win_rate:.1%}")
+    return mismatches
+
+
+def main(argv=None):
+    from src.constants import enemy_dmg_scale
+    from src.sim.combat_runner import ENEMY_TEMPLATES, make_hero
+
+    parser = argparse.ArgumentParser(description="NumPy batch combat sweeps.")
+    parser.add_argument("--verify", action="store_true", help="Check against the scalar engine")
+    parser.add_argument("--enemy", default="Jaw Worm", choices=sorted(ENEMY_TEMPLATES))
+    parser.add_argument("--floor", type=int, default=1)
+    parser.add_argument("--deck", nargs="*", help="Card names (default: starter deck)")
+    parser.add_argument("--sims", type=int, default=10000)
+    parser.add_argument("--hp-scales", type=float, nargs="*", default=[1.0],
+                        help="Enemy HP multipliers to sweep")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    if args.verify:
+        raise SystemExit(1 if verify(seed=args.seed) else 0)
+
+    for hp_scale in args.hp_scales:
+        enemy = ENEMY_TEMPLATES[args.enemy].spawn()
+        enemy.scale(hp_scale, enemy_dmg_scale(args.floor))
+        result = BatchCombat(make_hero(args.deck), enemy, args.sims, seed=args.seed).run()
+        print(f"{args.enemy} hp x{hp_scale:.2f} ({enemy.max_hp} HP): {result.format()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+"""
+Micro-benchmarks — memory per run, attribute-access throughput, map generation,
+combat cloning and hint search.
+
+    python -m src.sim.bench              # every benchmark
+    python -m src.sim.bench memory attrs
+    python -m src.sim.bench dungeon clone mcts
+"""
+from __future__ import annotations
+import argparse
+import copy
+import gc
+import random
+import time
+import tracemalloc
+from typing import Callable
+
+from src.models.relic import make_relic
+from src.models.status import Strength
+from src.sim.combat_runner import make_enemy, make_hero
+from src.sim.policy import ScriptedRunPolicy
+from src.sim.runs import play_run
+from src.systems.combat import CombatState
+from src.systems.dungeon import Dungeon
+from src.systems.mcts import CombatSearch
+from src.systems.rng import GameRng
+
+
+def _traced(fn: Callable[[], object]) -> tuple[int, int, object]:
+    """Run fn under tracemalloc. Returns (bytes still held, peak bytes, fn's result)."""
+    gc.collect()
+    tracemalloc.start()
+    result = fn()
+    gc.collect()
+    held, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return held, peak, result
+
+
+def bench_memory(runs: int = 20, combats: int = 2000):
+    """Peak memory of a full simulated run, and bytes held per live combat."""
+    policy = ScriptedRunPolicy()
+    peaks = []
+    for seed in range(runs):
+        _, peak, _ = _traced(lambda: play_run(seed, policy))
+        peaks.append(peak)
+    print(f"  run peak       {sum(peaks) / len(peaks) / 1024:8.1f} KiB/run  ({runs} runs)")
+
+    def live_combats():
+        fights = []
+        for seed in range(combats):
+            combat = CombatState(make_hero(seed=seed), [make_enemy("Jaw Worm"), make_enemy("Louse")])
+            combat.start_combat()
+            fights.append(combat)
+        return fights
+
+    held, _, fights = _traced(live_combats)
+    print(f"  live combat    {held / combats / 1024:8.2f} KiB/combat ({combats} held)")
+    del fights
+
+
+def bench_attrs(reads: int = 2_000_000):
+    """Attribute reads per second on the hot model objects."""
+    combat = CombatState(make_hero(seed=0), [make_enemy("Jaw Worm")])
+    combat.start_combat()
+    hero, enemy = combat.hero, combat.enemies[0]
+    card, action, status = hero.hand[0], enemy.next_action, Strength(1)
+    node = next(iter(Dungeon(rng=GameRng(0).map).nodes.values()))
+
+    probes = {
+        "Card.cost":           lambda n: [card.cost for _ in range(n)],
+        "Enemy.current_hp":    lambda n: [enemy.current_hp for _ in range(n)],
+        "Action.value":        lambda n: [action.value for _ in range(n)],
+        "StatusEffect.stacks": lambda n: [status.stacks for _ in range(n)],
+        "DungeonNode.floor":   lambda n: [node.floor for _ in range(n)],
+    }
+    for label, probe in probes.items():
+        start = time.perf_counter()
+        probe(reads)
+        elapsed = time.perf_counter() - start
+        print(f"  {label:<20} {reads / elapsed / 1e6:7.1f} M reads/s")
+
+
+def bench_dungeon(sizes=((15, 5), (100, 20), (1000, 50)), repeat: int = 3):
+    """Map generation time for (floors, lanes) sizes, best of `repeat`."""
+    for floors, lanes in sizes:
+        best = float("inf")
+        for seed in range(repeat):
+            start = time.perf_counter()
+            dungeon = Dungeon(rng=GameRng(seed).map, width=lanes, act_length=floors)
+            best = min(best, time.perf_counter() - start)
+        edges = sum(len(n.children_ids) for n in dungeon.nodes.values())
+        print(f"  {floors:>5} floors x {lanes:>3} lanes  {best * 1000:9.2f} ms  "
+              f"({len(dungeon.nodes)} nodes, {edges} edges)")
+
+
+def bench_clone(clones: int = 20_000):
+    """CombatState clones per second, against copy.deepcopy, on a mid-fight state."""
+    hero = make_hero(seed=0)
+    for name in ("Anchor", "Bag of Preparation", "Red Skull", "Centennial Puzzle"):
+        hero.add_relic(make_relic(name))
+    combat = CombatState(hero, [make_enemy("Jaw Worm"), make_enemy("Cultist"), make_enemy("Louse")])
+    combat.start_combat()
+    hero.apply_status(Strength(2))
+
+    rng = GameRng(0)
+    probes = {
+        "clone()":          lambda: combat.clone(),
+        "clone(rng)":       lambda: combat.clone(rng),  # Search supplies its own streams
+        "copy.deepcopy":    lambda: copy.deepcopy(combat),
+    }
+    for label, probe in probes.items():
+        n = clones if label != "copy.deepcopy" else clones // 10
+        start = time.perf_counter()
+        for _ in range(n):
+            probe()
+        elapsed = time.perf_counter() - start
+        print(f"  {label:<16} {n / elapsed / 1000:8.1f} k clones/s")
+
+
+def bench_mcts(seconds: float = 2.0):
+    """Hint-search playouts per second from the opening position of a fight."""
+    combat = CombatState(make_hero(seed=0), [make_enemy("Jaw Worm"), make_enemy("Cultist")])
+    combat.start_combat()
+    search = CombatSearch(rng=random.Random(0))
+    search.reset(combat)
+    search.run(seconds)
+    print(f"  playouts       {search.playouts_per_second:8.0f} /s  "
+          f"({search.playouts} in {search.search_time:.1f}s, best {search.best_move()})")
+
+
+BENCHMARKS = {
+    "memory":  bench_memory,
+    "attrs":   bench_attrs,
+    "dungeon": bench_dungeon,
+    "clone":   bench_clone,
+    "mcts":    bench_mcts,
+}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Model-layer micro-benchmarks.")
+    parser.add_argument("names", nargs="*", help=f"Any of {', '.join(BENCHMARKS)} (default: all)")
+    args = parser.parse_args(argv)
+    for name in args.names:
+        if name not in BENCHMARKS:
+            parser.error(f"Unknown benchmark: {name}")
+    for name in args.names or BENCHMARKS:
+        print(f"{name}:")
+        BENCHMARKS[name]()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,162 @@
+"""
+Headless combat runner — drives CombatState at full speed without pygame.
+
+    python -m src.sim.combat_runner --enemy "Jaw Worm" --floor 3 --fights 20000
+"""
+from __future__ import annotations
+import argparse
+import itertools
+import time
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+from src.models.hero import Hero
+from src.models.card import get_starter_deck, make_card
+from src.models.enemy import Enemy, EnemyTemplate, TIER1_ENEMIES, TIER2_ENEMIES, TIER3_ENEMIES, BOSSES
+from src.models.relic import get_starter_relic
+from src.systems.combat import CombatState, CombatPhase
+from src.systems.rng import GameRng
+from src.sim.policy import CombatPolicy, POLICIES, make_policy
+
+MAX_TURNS = 100
+
+
+@dataclass
+class CombatResult:
+    won: bool
+    turns: int
+    cards_played: int
+    hero_hp: int
+    timed_out: bool = False
+
+
+@dataclass
+class ThroughputReport:
+    fights: int
+    seconds: float
+    wins: int
+    turns: int
+    timeouts: int
+
+    @property
+    def fights_per_second(self) -> float:
+        return self.fights / self.seconds if self.seconds > 0 else 0.0
+
+    @property
+    def win_rate(self) -> float:
+        return self.wins / self.fights if self.fights else 0.0
+
+    @property
+    def avg_turns(self) -> float:
+        return self.turns / self.fights if self.fights else 0.0
+
+    def format(self) -> str:
+        return (f"{self.fights} fights in {self.seconds:.2f}s "
+                f"({self.fights_per_second:,.0f} fights/s) | "
+                f"win rate {self.win_rate:.1%} | avg turns {self.avg_turns:.1f} | "
+                f"timeouts {self.timeouts}")
+
+
+# ─────────────────────────────────────────────
+# Fight setup
+# ─────────────────────────────────────────────
+
+ENEMY_TEMPLATES: dict[str, EnemyTemplate] = {
+    t.name: t for t in TIER1_ENEMIES + TIER2_ENEMIES + TIER3_ENEMIES + BOSSES}
+
+
+def make_enemy(name: str, floor: int = 1, elite: bool = False) -> Enemy:
+    """Spawn a named enemy scaled like the dungeon would scale it on `floor`."""
+    template = ENEMY_TEMPLATES.get(name)
+    if template is None:
+        raise ValueError(f"Unknown enemy: {name}")
+    return template.spawn(floor, elite)
+
+
+def make_hero(deck: Optional[list[str]] = None, relics: bool = True,
+              seed: Optional[int] = None) -> Hero:
+    """Fresh hero with the starter deck (or the named cards) and starter relic."""
+    hero = Hero(rng=GameRng(seed))
+    hero.deck = [make_card(n) for n in deck] if deck else get_starter_deck()
+    if relics:
+        hero.add_relic(get_starter_relic())
+    return hero
+
+
+# ─────────────────────────────────────────────
+# Runner
+# ─────────────────────────────────────────────
+
+def run_combat(hero: Hero, enemies: list[Enemy], policy: CombatPolicy,
+               max_turns: int = MAX_TURNS) -> CombatResult:
+    """Play one fight to completion. Mutates `hero` exactly like the game would."""
+    combat = CombatState(hero, enemies, record_events=False)
+    combat.start_combat()
+    return drive_combat(combat, policy, max_turns)
+
+
+def drive_combat(combat: CombatState, policy: CombatPolicy,
+                 max_turns: int = MAX_TURNS) -> CombatResult:
+    """Play an already started CombatState until it is won, lost or times out."""
+    hero = combat.hero
+    played = 0
+    while not combat.is_over:
+        if combat.turn_number > max_turns:
+            return CombatResult(False, combat.turn_number, played, hero.current_hp, timed_out=True)
+
+        if combat.phase == CombatPhase.PLAYER_TURN:
+            action = policy.choose_action(combat)
+            if action is not None and combat.play_fast(*action):
+                played += 1
+                continue
+            # Nothing to play (or the policy picked an illegal move): end turn
+            combat.end_player_turn()
+
+        if combat.phase == CombatPhase.ENEMY_TURN:
+            combat.execute_enemy_turn()
+
+    return CombatResult(combat.player_won, combat.turn_number, played, hero.current_hp)
+
+
+def benchmark(make_fight: Callable[[], tuple[Hero, list[Enemy]]], policy: CombatPolicy,
+              fights: int, max_turns: int = MAX_TURNS) -> ThroughputReport:
+    """Run `fights` independent fights and report throughput."""
+    wins = turns = timeouts = 0
+    start = time.perf_counter()
+    for _ in range(fights):
+        hero, enemies = make_fight()
+        result = run_combat(hero, enemies, policy, max_turns)
+        wins += result.won
+        turns += result.turns
+        timeouts += result.timed_out
+    elapsed = time.perf_counter() - start
+    return ThroughputReport(fights, elapsed, wins, turns, timeouts)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Headless combat throughput report.")
+    parser.add_argument("--enemy", default="Jaw Worm", choices=sorted(ENEMY_TEMPLATES))
+    parser.add_argument("--floor", type=int, default=1)
+    parser.add_argument("--elite", action="store_true")
+    parser.add_argument("--policy", default="greedy", choices=sorted(POLICIES))
+    parser.add_argument("--deck", nargs="*", help="Card names (default: starter deck)")
+    parser.add_argument("--fights", type=int, default=10000)
+    parser.add_argument("--max-turns", type=int, default=MAX_TURNS)
+    parser.add_argument("--seed", type=int, default=None,
+                        help="Seed of the first fight; fight i uses seed + i")
+    args = parser.parse_args(argv)
+
+    seeds = itertools.count(args.seed) if args.seed is not None else itertools.repeat(None)
+
+    def make_fight():
+        hero = make_hero(args.deck, seed=next(seeds))
+        return hero, [make_enemy(args.enemy, args.floor, args.elite)]
+
+    policy = make_policy(args.policy)
+    report = benchmark(make_fight, policy, args.fights, args.max_turns)
+    print(f"{args.enemy} (floor {args.floor}{', elite' if args.elite else ''}) vs {policy.name}:")
+    print(report.format())
+
+
+if __name__ == "__main__":
+    main()
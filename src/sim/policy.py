@@ -0,0 +1,183 @@
+"""
+Combat policies — decide what the hero does during a headless fight.
+"""
+from __future__ import annotations
+import random
+from typing import Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from src.systems.combat import CombatState
+
+# (hand_index, target_index). Target index is into CombatState.enemies.
+Action = tuple[int, int]
+
+
+class CombatPolicy:
+    """Base policy. Return an action to play a card, or None to end the turn."""
+    name = "base"
+
+    def choose_action(self, combat: "CombatState") -> Optional[Action]:
+        raise NotImplementedError
+
+    def __repr__(self):
+        return f"{type(self).__name__}()"
+
+
+def playable_indices(combat: "CombatState") -> list[int]:
+    return [i for i, c in enumerate(combat.hero.hand) if combat.can_play_card(c)]
+
+
+def first_living_target(combat: "CombatState") -> int:
+    for i, e in enumerate(combat.enemies):
+        if not e.is_dead():
+            return i
+    return 0
+
+
+class EndTurnPolicy(CombatPolicy):
+    """Never plays a card. Useful as a baseline for enemy damage output."""
+    name = "end_turn"
+
+    def choose_action(self, combat):
+        return None
+
+
+class FirstPlayablePolicy(CombatPolicy):
+    """Plays the leftmost playable card at the first living enemy."""
+    name = "first"
+
+    def choose_action(self, combat):
+        for i, card in enumerate(combat.hero.hand):
+            if combat.can_play_card(card):
+                return i, first_living_target(combat)
+        return None
+
+
+class RandomPolicy(CombatPolicy):
+    """Plays a random playable card at a random living enemy."""
+    name = "random"
+
+    def __init__(self, rng=None, end_turn_chance: float = 0.0):
+        self.rng = rng or random.Random()
+        self.end_turn_chance = end_turn_chance
+
+    def choose_action(self, combat):
+        options = playable_indices(combat)
+        if not options or self.rng.random() < self.end_turn_chance:
+            return None
+        targets = [i for i, e in enumerate(combat.enemies) if not e.is_dead()]
+        return self.rng.choice(options), self.rng.choice(targets) if targets else 0
+
+
+class GreedyPolicy(CombatPolicy):
+    """Plays the most expensive playable card first, attacks before skills."""
+    name = "greedy"
+
+    def choose_action(self, combat):
+        from src.models.card import ATTACK
+        best, best_key = None, None
+        for i, card in enumerate(combat.hero.hand):
+            if not combat.can_play_card(card):
+                continue
+            key = (card.card_type == ATTACK, card.cost)
+            if best_key is None or key > best_key:
+                best, best_key = i, key
+        if best is None:
+            return None
+        return best, first_living_target(combat)
+
+
+class SolverPolicy(CombatPolicy):
+    """Plays each turn as planned by the turn solver (src.systems.turn_solver),
+    which plans on a sampled draw order, never the real one."""
+    name = "solver"
+
+    def __init__(self, solver=None, rng=None):
+        from src.systems.turn_solver import TurnSolver
+        self.solver = solver or TurnSolver(rng=rng)
+        self._plan: list = []
+        self._turn = None  # (combat, turn number) the plan was made for
+
+    def choose_action(self, combat):
+        turn = (combat, combat.turn_number)
+        if self._turn is None or turn[0] is not self._turn[0] or turn[1] != self._turn[1]:
+            self._plan = self.solver.solve(combat).moves
+            self._turn = turn
+        for _ in range(2):  # Re-plan once if the fight has left the plan
+            if not self._plan:
+                return None
+            name, slot = self._plan.pop(0)
+            if not name:  # END_TURN
+                return None
+            for i, card in enumerate(combat.hero.hand):
+                if card.name == name and combat.can_play_card(card):
+                    return i, slot if slot >= 0 else first_living_target(combat)
+            self._plan = self.solver.solve(combat).moves
+        return None
+
+
+POLICIES = {
+    EndTurnPolicy.name:       EndTurnPolicy,
+    FirstPlayablePolicy.name: FirstPlayablePolicy,
+    RandomPolicy.name:        RandomPolicy,
+    GreedyPolicy.name:        GreedyPolicy,
+    SolverPolicy.name:        SolverPolicy,
+}
+
+
+def make_policy(name: str) -> CombatPolicy:
+    cls = POLICIES.get(name)
+    if cls is None:
+        raise ValueError(f"Unknown policy: {name}")
+    return cls()
+
+
+# ─────────────────────────────────────────────
+# Run policies (map, rewards, shops, events)
+# ─────────────────────────────────────────────
+
+# Cards worth taking, best first. Anything else is skipped.
+CARD_PRIORITY = [
+    "Offering", "Impervious", "Limit Break", "Inflame", "Shrug It Off",
+    "Pommel Strike", "Heavy Blade", "Twin Strike", "Flame Barrier", "Reaper",
+    "Iron Wave", "Feed", "Thunderclap", "Cleave", "Seeing Red", "Metallicize",
+    "Wild Strike", "Headbutt", "Sentinel", "Battle Trance", "Armaments",
+]
+_CARD_RANK = {name: i for i, name in enumerate(CARD_PRIORITY)}
+
+
+class ScriptedRunPolicy:
+    """Fixed heuristics for every out-of-combat decision in a run."""
+
+    def __init__(self, combat_policy: Optional[CombatPolicy] = None, planner=None):
+        from src.systems.route_planner import RoutePlanner
+        self.combat_policy = combat_policy or GreedyPolicy()
+        self.planner = planner or RoutePlanner()
+
+    def choose_node(self, game_state, reachable: list) -> str:
+        """Follow the planner's best route to the end of the map."""
+        next_id = self.planner.plan(game_state.dungeon, game_state.hero).next_id
+        return next_id if next_id is not None else reachable[0].id
+
+    def choose_card_reward(self, game_state, cards: list) -> Optional[int]:
+        ranked = [(_CARD_RANK[c.name], i) for i, c in enumerate(cards) if c.name in _CARD_RANK]
+        return min(ranked)[1] if ranked else None
+
+    def choose_purchases(self, game_state) -> list[int]:
+        """Indices into merchant_cards to buy, highest index first so pops stay valid."""
+        gold = game_state.hero.gold
+        wanted = sorted((_CARD_RANK[c.name], i, price)
+                        for i, (c, price) in enumerate(game_state.merchant_cards)
+                        if c.name in _CARD_RANK)
+        picks = []
+        for _, i, price in wanted:
+            if price <= gold:
+                gold -= price
+                picks.append(i)
+        return sorted(picks, reverse=True)
+
+    def take_chest_relic(self, game_state) -> bool:
+        return True
+
+    def choose_event_option(self, game_state, event) -> int:
+        return 0
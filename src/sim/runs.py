@@ -0,0 +1,231 @@
+"""
+Monte Carlo run simulator — plays complete runs through GameState across all cores.
+
+    python -m src.sim.runs --runs 20000
+    python -m src.sim.runs --runs 20000 --hp-step 0.20 --dmg-step 0.10
+"""
+from __future__ import annotations
+import argparse
+import os
+import time
+from collections import Counter
+from contextlib import contextmanager
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Optional
+
+from src.constants import *
+from src.game_state import GameState
+from src.sim.combat_runner import drive_combat, MAX_TURNS
+from src.sim.policy import ScriptedRunPolicy, POLICIES, make_policy
+
+MAX_STEPS = 1000  # Safety net against a policy that never makes progress
+
+
+@dataclass
+class RunResult:
+    won: bool
+    floor: int
+    gold: int
+    deck_size: int
+    hp: int
+    kills: int
+
+
+@dataclass
+class RunStats:
+    """Aggregated results. Chunks are reduced in the worker and merged in the parent."""
+    runs: int = 0
+    wins: int = 0
+    gold_total: int = 0
+    kills_total: int = 0
+    floors: Counter = field(default_factory=Counter)
+    deck_sizes: Counter = field(default_factory=Counter)
+
+    def add(self, result: RunResult):
+        self.runs += 1
+        self.wins += result.won
+        self.gold_total += result.gold
+        self.kills_total += result.kills
+        self.floors[result.floor] += 1
+        self.deck_sizes[result.deck_size] += 1
+
+    def merge(self, other: "RunStats"):
+        self.runs += other.runs
+        self.wins += other.wins
+        self.gold_total += other.gold_total
+        self.kills_total += other.kills_total
+        self.floors.update(other.floors)
+        self.deck_sizes.update(other.deck_sizes)
+
+    @property
+    def win_rate(self) -> float:
+        return self.wins / self.runs if self.runs else 0.0
+
+    @staticmethod
+    def _mean(counter: Counter) -> float:
+        n = sum(counter.values())
+        return sum(k * v for k, v in counter.items()) / n if n else 0.0
+
+    def format(self) -> str:
+        lines = [
+            f"runs        {self.runs}",
+            f"win rate    {self.win_rate:.1%}",
+            f"avg floor   {self._mean(self.floors):.2f}",
+            f"avg gold    {self.gold_total / max(1, self.runs):.1f}",
+            f"avg kills   {self.kills_total / max(1, self.runs):.2f}",
+            f"avg deck    {self._mean(self.deck_sizes):.2f}",
+            "floor reached:",
+        ]
+        lines += [f"  {f:>3}: {n:>7} {n / self.runs:6.1%}" for f, n in sorted(self.floors.items())]
+        lines.append("deck size:")
+        lines += [f"  {d:>3}: {n:>7} {n / self.runs:6.1%}" for d, n in sorted(self.deck_sizes.items())]
+        return "\n".join(lines)
+
+
+# ─────────────────────────────────────────────
+# Single run
+# ─────────────────────────────────────────────
+
+def play_run(seed: int, policy: ScriptedRunPolicy, max_turns: int = MAX_TURNS,
+             endless: bool = False) -> RunResult:
+    """Play one full run to victory or death (endless: death or MAX_STEPS).
+    The seed fixes every RNG stream."""
+    gs = GameState(seed)
+    gs.record_events = False
+    gs.new_game(endless=endless)
+    won = False
+
+    for _ in range(MAX_STEPS):
+        if gs.state == STATE_MAP:
+            reachable = gs.dungeon.reachable_nodes()
+            if not reachable:
+                won = True  # Final boss cleared
+                break
+            gs.select_node(policy.choose_node(gs, reachable))
+            gs.enter_node()
+
+        elif gs.state == STATE_COMBAT:
+            result = drive_combat(gs.combat_state, policy.combat_policy, max_turns)
+            if result.won:
+                gs.combat_won()
+            else:
+                gs.game_over()
+
+        elif gs.state == STATE_CARD_REWARD:
+            pick = policy.choose_card_reward(gs, gs.card_reward_pool)
+            if pick is None:
+                gs.skip_card_reward()
+            else:
+                gs.pick_card_reward(gs.card_reward_pool[pick])
+
+        elif gs.state == STATE_MERCHANT:
+            for i in policy.choose_purchases(gs):
+                gs.buy_merchant_card(i)
+            gs.complete_merchant()
+
+        elif gs.state == STATE_CHEST:
+            gs.complete_chest(take_relic=policy.take_chest_relic(gs))
+
+        elif gs.state == STATE_EVENT:
+            gs.choose_event_option(policy.choose_event_option(gs, gs.current_event))
+            gs.complete_event()
+
+        else:  # STATE_GAME_OVER
+            break
+
+    hero = gs.hero
+    node = gs.dungeon.current_node()  # Still set if the run ended inside a node
+    floor = node.floor if node else gs.dungeon.current_floor
+    return RunResult(won, floor, hero.gold, len(hero.deck),
+                     hero.current_hp, hero.kills)
+
+
+# ─────────────────────────────────────────────
+# Workers
+# ─────────────────────────────────────────────
+
+def _init_worker(hp_step: Optional[float], dmg_step: Optional[float]):
+    """Apply the scaling overrides for the life of a pool worker."""
+    import src.constants as constants
+    if hp_step is not None:
+        constants.ENEMY_HP_SCALE_PER_FLOOR = hp_step
+    if dmg_step is not None:
+        constants.ENEMY_DMG_SCALE_PER_FLOOR = dmg_step
+
+
+@contextmanager
+def _scaling_overrides(hp_step: Optional[float], dmg_step: Optional[float]):
+    """Apply the scaling overrides in this process and restore them afterwards."""
+    import src.constants as constants
+    saved = constants.ENEMY_HP_SCALE_PER_FLOOR, constants.ENEMY_DMG_SCALE_PER_FLOOR
+    _init_worker(hp_step, dmg_step)
+    try:
+        yield
+    finally:
+        constants.ENEMY_HP_SCALE_PER_FLOOR, constants.ENEMY_DMG_SCALE_PER_FLOOR = saved
+
+
+def simulate_chunk(first_seed: int, count: int, combat_policy: str,
+                   max_turns: int = MAX_TURNS, endless: bool = False) -> RunStats:
+    """Play `count` runs with consecutive seeds and reduce them to one RunStats."""
+    policy = ScriptedRunPolicy(make_policy(combat_policy))
+    stats = RunStats()
+    for seed in range(first_seed, first_seed + count):
+        stats.add(play_run(seed, policy, max_turns, endless))
+    return stats
+
+
+def simulate(runs: int, seed: int = 0, workers: Optional[int] = None,
+             chunk_size: Optional[int] = None, combat_policy: str = "greedy",
+             hp_step: Optional[float] = None, dmg_step: Optional[float] = None,
+             max_turns: int = MAX_TURNS, endless: bool = False) -> RunStats:
+    """Spread `runs` over a process pool (one worker per core) and merge the chunks."""
+    workers = workers or os.cpu_count() or 1
+    chunk_size = chunk_size or max(1, min(500, runs // (workers * 4)))
+    chunks = [(seed + start, min(chunk_size, runs - start))
+              for start in range(0, runs, chunk_size)]
+
+    total = RunStats()
+    if workers == 1:
+        with _scaling_overrides(hp_step, dmg_step):
+            for first, count in chunks:
+                total.merge(simulate_chunk(first, count, combat_policy, max_turns, endless))
+        return total
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(hp_step, dmg_step)) as pool:
+        futures = [pool.submit(simulate_chunk, first, count, combat_policy, max_turns, endless)
+                   for first, count in chunks]
+        for future in futures:
+            total.merge(future.result())
+    return total
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Monte Carlo full-run simulator.")
+    parser.add_argument("--runs", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=None, help="Default: one per core")
+    parser.add_argument("--chunk-size", type=int, default=None)
+    parser.add_argument("--policy", default="greedy", choices=sorted(POLICIES),
+                        help="Combat policy")
+    parser.add_argument("--hp-step", type=float, default=None,
+                        help=f"Enemy HP scaling per floor (default {ENEMY_HP_SCALE_PER_FLOOR})")
+    parser.add_argument("--dmg-step", type=float, default=None,
+                        help=f"Enemy damage scaling per floor (default {ENEMY_DMG_SCALE_PER_FLOOR})")
+    parser.add_argument("--max-turns", type=int, default=MAX_TURNS)
+    parser.add_argument("--endless", action="store_true", help="Endless dungeon (no final boss)")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    stats = simulate(args.runs, args.seed, args.workers, args.chunk_size, args.policy,
+                     args.hp_step, args.dmg_step, args.max_turns, args.endless)
+    elapsed = time.perf_counter() - start
+    print(stats.format())
+    print(f"{stats.runs} runs in {elapsed:.2f}s ({stats.runs / elapsed:,.1f} runs/s, "
+          f"{args.workers or os.cpu_count()} workers)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""
+Combat event bus — relics and powers subscribe to the hooks they implement.
+
+Each listener is registered once, under only the hooks its class overrides, so
+dispatching a hook walks a prebuilt list of bound methods and a listener costs
+nothing on hooks it does not implement. Handlers run in subscription order.
+"""
+from __future__ import annotations
+from types import MethodType
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from src.models.card import Card
+    from src.models.hero import Hero
+    from src.systems.modifiers import Modifiers
+
+HOOKS = ("on_combat_start", "on_turn_begin", "on_turn_start", "on_turn_end",
+         "on_card_played", "on_block_gained", "on_exhaust", "on_status_card",
+         "on_damage_taken", "on_combat_end")
+
+
+class Listener:
+    """Base for relics and powers: every hook is a no-op until overridden."""
+
+    def on_combat_start(self, hero: "Hero"):
+        pass
+
+    def on_turn_begin(self, hero: "Hero"):
+        """Start of the hero's turn, before statuses tick and the hand is drawn."""
+        pass
+
+    def on_turn_start(self, hero: "Hero"):
+        """Start of the hero's turn, after the hand is drawn."""
+        pass
+
+    def on_turn_end(self, hero: "Hero"):
+        pass
+
+    def on_card_played(self, hero: "Hero", card: "Card"):
+        pass
+
+    def on_block_gained(self, hero: "Hero", amount: int):
+        pass
+
+    def on_exhaust(self, hero: "Hero", card: "Card"):
+        pass
+
+    def on_status_card(self, hero: "Hero", card: "Card"):
+        pass
+
+    def on_damage_taken(self, hero: "Hero", amount: int) -> int:
+        """HP about to be lost after block; return the amount actually lost."""
+        return amount
+
+    def on_combat_end(self, hero: "Hero"):
+        pass
+
+    def modify(self, mods: "Modifiers"):
+        """Add terms to the hero's damage / block modifiers. Not a bus hook: it is
+        folded in when the hero recomposes them, so it must depend only on state
+        that add_relic / add_power change (see Combatant.modifiers)."""
+        pass
+
+    def clone(self) -> "Listener":
+        """Copy with its own counters and flags. Listener state is plain scalars;
+        one holding mutable containers must override this."""
+        new = object.__new__(type(self))
+        new.__dict__.update(self.__dict__)
+        return new
+
+    def overridden_hooks(self) -> list[str]:
+        """Hooks this listener's class actually implements."""
+        cls = type(self)
+        return [h for h in HOOKS if getattr(cls, h) is not getattr(Listener, h)]
+
+
+class EventBus:
+    """Hook name -> bound handlers, in subscription order."""
+    __slots__ = ("_handlers",)
+
+    def __init__(self):
+        self._handlers: dict[str, list] = {}
+
+    def subscribe(self, listener: Listener):
+        for hook in listener.overridden_hooks():
+            self._handlers.setdefault(hook, []).append(getattr(listener, hook))
+
+    def handlers(self, hook: str):
+        return self._handlers.get(hook, ())
+
+    def emit(self, hook: str, hero: "Hero", *args):
+        for handler in self._handlers.get(hook, ()):
+            handler(hero, *args)
+
+    def filter(self, hook: str, hero: "Hero", value):
+        """Thread `value` through every handler of `hook` and return the result."""
+        for handler in self._handlers.get(hook, ()):
+            value = handler(hero, value)
+        return value
+
+    def rebind(self, listeners: dict[int, Listener]) -> "EventBus":
+        """Copy whose handlers belong to the replacement listeners, keyed by id() of
+        the originals (see Hero.clone). Subscription order is kept."""
+        new = EventBus()
+        new._handlers = {hook: [MethodType(h.__func__, listeners[id(h.__self__)]) for h in hs]
+                         for hook, hs in self._handlers.items()}
+        return new
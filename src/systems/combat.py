@@ -2,13 +2,18 @@
 Combat system — manages the turn loop between hero and enemies.
 """
 from __future__ import annotations
+from dataclasses import dataclass
 from enum import Enum, auto
-from typing import Optional, TYPE_CHECKING
+from typing import Iterable, Optional, TYPE_CHECKING
+
+from src.systems.events import EventLog, CardPlayed
+from src.systems.zobrist import zkey, PHASE
 
 if TYPE_CHECKING:
     from src.models.hero import Hero
     from src.models.enemy import Enemy
     from src.models.card import Card
+    from src.systems.rng import GameRng
 
 
 class CombatPhase(Enum):
@@ -18,17 +23,58 @@ class CombatPhase(Enum):
     COMBAT_LOST = auto()
 
 
+@dataclass(slots=True)
+class PlayResult:
+    """Outcome of CombatState.play_actions."""
+    applied: int        # Actions played before the first rejected one (or all of them)
+    enemy_hp_lost: int
+    hero_hp_lost: int
+    phase: CombatPhase
+
+    @property
+    def is_over(self) -> bool:
+        return self.phase in (CombatPhase.COMBAT_WON, CombatPhase.COMBAT_LOST)
+
+
 class CombatState:
-    def __init__(self, hero: "Hero", enemies: list["Enemy"]):
+    def __init__(self, hero: "Hero", enemies: list["Enemy"], record_events: bool = True):
         self.hero = hero
         self.enemies = enemies
         self.phase = CombatPhase.PLAYER_TURN
         self.turn_number = 0
-        self.log: list[str] = []
+        self.events = EventLog(enabled=record_events)  # Off for headless simulation
+        for enemy in enemies:
+            enemy.events = self.events
         self.selected_card: Optional["Card"] = None
         self.gold_reward = 0
         self._started = False
 
+    def clone(self, rng: Optional["GameRng"] = None) -> "CombatState":
+        """Independent copy of the fight for search and rollouts. See Hero.clone for
+        what is shared; `rng` replaces the hero's streams in the copy."""
+        new = object.__new__(CombatState)
+        new.__dict__.update(self.__dict__)
+        new.hero = self.hero.clone(rng)
+        if self.hero.combat_state is self:
+            new.hero.combat_state = new
+        new.events = events = EventLog(self.events.capacity, self.events.enabled)
+        new.enemies = [e.clone() for e in self.enemies]
+        for enemy in new.enemies:
+            enemy.events = events
+        return new
+
+    def state_hash(self) -> int:
+        """64-bit Zobrist hash of the position: equal states hash equal, in O(1).
+
+        Covers the phase, the hero (HP, block, energy, statuses, pile multisets)
+        and every enemy slot (HP, block, action index, statuses). Turn number,
+        pile order and the event log are not part of the position.
+        """
+        h = zkey(PHASE, self.phase.value) ^ self.hero.zobrist_hash()
+        for slot, enemy in enumerate(self.enemies):
+            h ^= enemy.zobrist_hash(slot)
+        return h
+
     # ── Setup ────────────────────────────────────────────────────────────────
 
     def start_combat(self):
@@ -38,14 +84,13 @@ class CombatState:
         self.hero.combat_state = self
         self.hero.prepare_deck()
         # Relic: on_combat_start
-        self.hero.trigger_relics("on_combat_start")
+        self.hero.notify("on_combat_start")
         self._begin_player_turn()
 
     def _begin_player_turn(self):
         self.turn_number += 1
         self.phase = CombatPhase.PLAYER_TURN
-        msgs = self.hero.start_of_turn()
-        self._log(msgs)
+        self.hero.start_of_turn()
         self._check_death()
 
     # ── Player Actions ────────────────────────────────────────────────────────
@@ -62,14 +107,23 @@ class CombatState:
             cost = 0
         return self.hero.energy >= cost
 
-    def play_card(self, card: "Card", target: Optional["Enemy"] = None) -> list[str]:
-        """Play a card from the hero's hand. Returns log messages."""
+    def play_card(self, card: "Card", target: Optional["Enemy"] = None,
+                  hand_index: Optional[int] = None) -> bool:
+        """Play a card from the hero's hand. False if it cannot be played.
+
+        Cards are shared definitions, so pass `hand_index` to say which copy in
+        hand is played; without it the leftmost copy is used.
+        """
         if not self.can_play_card(card):
-            return []
-        if card not in self.hero.hand:
-            return []
+            return False
+        hand = self.hero.hand
+        if hand_index is None:
+            if card not in hand:
+                return False
+            hand_index = hand.index(card)
+        elif not 0 <= hand_index < len(hand) or hand[hand_index] is not card:
+            return False
 
-        msgs = []
         cost = card.cost
         if cost < 0:
             cost = 0  # Whirlwind handled inside effect
@@ -77,66 +131,111 @@ class CombatState:
             cost = 0
 
         self.hero.energy -= cost
-        self.hero.hand.remove(card)
+        del hand[hand_index]
 
         # Notify relics
-        for relic in self.hero.relics:
-            relic.on_card_played(self.hero, card)
+        self.hero.notify("on_card_played", card)
+        self.events.emit(CardPlayed, card)
 
         # Execute card effect
         living_enemies = [e for e in self.enemies if not e.is_dead()]
         card.play(self.hero, target, living_enemies)
+        self._settle_card(card)
+        self._check_death()
+        return True
 
-        msgs.append(f"Played: {card.name}")
-
+    def _settle_card(self, card: "Card"):
+        """Move a resolved card to the discard or, if it exhausts, the exhaust pile."""
         # Corruption: exhaust skills
-        if self.hero.corruption and card.card_type == "Skill":
-            self.hero.exhaust_pile.append(card)
-        elif card.exhausts:
-            self.hero.exhaust_pile.append(card)
+        if card.exhausts or (self.hero.corruption and card.card_type == "Skill"):
+            self.hero.exhaust_card(card)
         else:
             self.hero.discard_pile.append(card)
 
-        # Juggernaut: if hero gained block, deal damage to random enemy
-        if hasattr(self.hero, "_juggernaut_trigger") and self.hero._juggernaut_trigger > 0:
-            if living_enemies:
-                import random
-                e = random.choice(living_enemies)
-                e.take_damage(5, attacker=self.hero)
-                msgs.append(f"Juggernaut deals 5 damage to {e.name}!")
-            self.hero._juggernaut_trigger = 0
+    # ── Trusted fast path (simulators, search) ──────────────────────────────
 
+    def play_fast(self, hand_index: int, target_index: Optional[int] = None) -> bool:
+        """Play hand[hand_index] at enemies[target_index].
+
+        For callers that pick moves from the current hand themselves: there is no
+        search for the card, only index, target and energy checks. Same rules and
+        RNG use as play_card. False, with nothing changed, if the hand index is out
+        of range, a targeted card lacks a living target, the card cannot be paid
+        for or it is not our turn. Untargeted cards ignore `target_index`.
+        """
+        if self.phase != CombatPhase.PLAYER_TURN:
+            return False
+        hero = self.hero
+        if not 0 <= hand_index < len(hero.hand):
+            return False
+        card = hero.hand[hand_index]
+        target = None
+        if card.targeted:
+            if target_index is None or not 0 <= target_index < len(self.enemies):
+                return False
+            target = self.enemies[target_index]
+            if target.current_hp <= 0:
+                return False
+        cost = card.cost
+        if cost < 0:
+            if card.name != "Whirlwind" or hero.energy <= 0:
+                return False
+            cost = 0  # Whirlwind spends its energy inside the effect
+        elif hero.corruption and card.card_type == "Skill":
+            cost = 0
+        elif hero.energy < cost:
+            return False
+
+        hero.energy -= cost
+        del hero.hand[hand_index]
+        hero.notify("on_card_played", card)
+        self.events.emit(CardPlayed, card)
+        living_enemies = [e for e in self.enemies if e.current_hp > 0]
+        card.play(hero, target, living_enemies)
+        self._settle_card(card)
         self._check_death()
-        return msgs
+        return True
+
+    def play_actions(self, actions: Iterable[tuple[int, Optional[int]]]) -> PlayResult:
+        """Play (hand_index, target_index) actions in order, each index into the hand
+        as it stands when that action is reached. Stops at the first action that
+        cannot be played (see play_fast) or when the fight ends."""
+        hero, enemies = self.hero, self.enemies
+        hero_hp = hero.current_hp
+        enemy_hp = sum(e.current_hp for e in enemies)
+        applied = 0
+        for hand_index, target_index in actions:
+            if not self.play_fast(hand_index, target_index):
+                break
+            applied += 1
+            if self.phase is not CombatPhase.PLAYER_TURN:
+                break
+        return PlayResult(applied, enemy_hp - sum(e.current_hp for e in enemies),
+                          hero_hp - hero.current_hp, self.phase)
 
-    def end_player_turn(self) -> list[str]:
+    def end_player_turn(self):
         if self.phase != CombatPhase.PLAYER_TURN:
-            return []
-        msgs = self.hero.end_of_turn()
-        self._log(msgs)
+            return
+        self.hero.end_of_turn()
         self.phase = CombatPhase.ENEMY_TURN
-        return msgs
 
     # ── Enemy Turn ────────────────────────────────────────────────────────────
 
-    def execute_enemy_turn(self) -> list[str]:
+    def execute_enemy_turn(self):
         """Execute all enemy actions. Call after end_player_turn."""
         if self.phase != CombatPhase.ENEMY_TURN:
-            return []
-        msgs = []
+            return
         for enemy in self.enemies:
             if enemy.is_dead():
                 continue
-            msgs.extend(enemy.start_of_turn())
-            msgs.extend(enemy.execute_action(self.hero))
+            enemy.start_of_turn()
+            enemy.execute_action(self.hero)
             if self.hero.is_dead():
                 break
 
         self._check_death()
         if self.phase not in (CombatPhase.COMBAT_WON, CombatPhase.COMBAT_LOST):
             self._begin_player_turn()
-        self._log(msgs)
-        return msgs
 
     # ── End / Rewards ─────────────────────────────────────────────────────────
 
@@ -144,26 +243,20 @@ class CombatState:
         if self.hero.is_dead():
             self.phase = CombatPhase.COMBAT_LOST
             return
-        living = [e for e in self.enemies if not e.is_dead()]
-        if not living:
-            self.phase = CombatPhase.COMBAT_WON
-            self._on_combat_won()
+        for e in self.enemies:
+            if e.current_hp > 0:
+                return
+        self.phase = CombatPhase.COMBAT_WON
+        self._on_combat_won()
 
     def _on_combat_won(self):
-        import random
         is_boss = any(e.is_boss for e in self.enemies)
         base_gold = 20 if not is_boss else 80
-        self.gold_reward = random.randint(base_gold, base_gold + 20)
+        self.gold_reward = self.hero.rng.combat.randint(base_gold, base_gold + 20)
         self.hero.gold += self.gold_reward
         self.hero.kills += 1
         # Relic: on_combat_end
-        for relic in self.hero.relics:
-            relic.on_combat_end(self.hero)
-
-    def _log(self, msgs: list[str]):
-        self.log.extend(msgs)
-        if len(self.log) > 50:
-            self.log = self.log[-50:]
+        self.hero.notify("on_combat_end")
 
     @property
     def is_over(self) -> bool:
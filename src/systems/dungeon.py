@@ -3,9 +3,12 @@ Dungeon system — floor/node generation and progression.
 """
 from __future__ import annotations
 import random
+from collections import Counter
 from dataclasses import dataclass, field
 from typing import Optional
 
+from src.systems.sampling import AliasTable, TableCache
+
 
 NODE_ENEMY    = "enemy"
 NODE_ELITE    = "elite"
@@ -33,7 +36,16 @@ NODE_COLORS = {
 }
 
 
-@dataclass
+_NODE_TYPE_TABLES = TableCache()
+
+
+def _node_type_table(weights: dict[str, int]) -> AliasTable:
+    """Alias table for one floor's node weights. Floors with equal weights share it."""
+    key = tuple(weights.items())
+    return _NODE_TYPE_TABLES.get(key, lambda: AliasTable(list(weights), list(weights.values())))
+
+
+@dataclass(slots=True)
 class DungeonNode:
     id: str
     floor: int
@@ -43,82 +55,157 @@ class DungeonNode:
     completed: bool = False
     current: bool = False
     reachable: bool = False          # Can the player move here?
+    index: int = -1                  # Bit position in the dungeon's reachability index
 
 
 class Dungeon:
-    def __init__(self):
+    def __init__(self, rng=None, endless: bool = False,
+                 lookahead: int = None, keep_behind: int = None,
+                 width: int = 5, act_length: int = 15):
+        from src.constants import ENDLESS_LOOKAHEAD, ENDLESS_KEEP_BEHIND
+        self.rng = rng or random
         self.current_floor = 0
         self.nodes: dict[str, DungeonNode] = {} # id -> node
-        self.width = 5 # Number of parallel paths
-        self.act_length = 15
+        self.floors: dict[int, list[DungeonNode]] = {}  # floor -> nodes, left to right
+        self.reachable_ids: set[str] = set()
+        self._current_id: Optional[str] = None
+        self.width = width  # Number of parallel paths
+        self.act_length = act_length
+        self.max_floor = 0  # Highest floor generated so far
+        self.version = 0    # Bumped whenever progress changes the map (see route_planner)
+
+        # Endless mode: floors are generated `lookahead` ahead of the player and
+        # floors more than `keep_behind` below are folded into the counters below
+        self.endless = endless
+        self.lookahead = ENDLESS_LOOKAHEAD if lookahead is None else max(1, lookahead)
+        self.keep_behind = ENDLESS_KEEP_BEHIND if keep_behind is None else max(0, keep_behind)
+        self.compacted_floors = 0
+        self.compacted_nodes: Counter = Counter()   # node_type -> nodes dropped
+        self.compacted_cleared: Counter = Counter() # node_type -> completed nodes dropped
+
+        # Reachability index (see _build_reachability)
+        self._reach: list[int] = []
+        self._ancestors: list[int] = []
+        self._type_masks: dict[str, int] = {}
+        self._frontier = 0
+
         self._generate_act()
 
     def _generate_act(self):
-        """Generate a structured branching graph for the entire act."""
-        from src.constants import get_node_weights, BOSS_EVERY
-        
-        # 1. Create nodes by floor
-        floors: list[list[DungeonNode]] = []
-        for f in range(1, self.act_length):
-            floor_nodes = []
-            num_nodes = random.randint(3, self.width)
-            
-            # Distribute nodes horizontally
-            x_positions = sorted(random.sample(range(self.width), num_nodes))
-            
-            for x in x_positions:
-                node_id = f"f{f}_x{x}"
-                weights = get_node_weights(f)
-                
-                # Floor 1 is usually combat
-                if f == 1:
-                    node_type = NODE_ENEMY
-                else:
-                    node_type = random.choices(list(weights.keys()), weights=list(weights.values()))[0]
-                
-                node = DungeonNode(id=node_id, floor=f, node_type=node_type, x_pos=x)
-                floor_nodes.append(node)
-                self.nodes[node_id] = node
-            floors.append(floor_nodes)
-
-        # 2. Add Boss Node
-        boss_id = f"f{self.act_length}_x{self.width // 2}"
-        boss_node = DungeonNode(id=boss_id, floor=self.act_length, node_type=NODE_BOSS, x_pos=self.width // 2)
-        self.nodes[boss_id] = boss_node
-        floors.append([boss_node])
-
-        # 3. Create connections
-        for f in range(len(floors) - 1):
-            current_floor_nodes = floors[f]
-            next_floor_nodes = floors[f + 1]
-            
-            for node in current_floor_nodes:
-                # Find nodes in next floor that are "reachable" (x separation <= 1)
-                potentials = [n for n in next_floor_nodes if abs(n.x_pos - node.x_pos) <= 1]
-                
-                # If no direct neighbors, bridge to the closest
-                if not potentials:
-                    potentials = [min(next_floor_nodes, key=lambda n: abs(n.x_pos - node.x_pos))]
-                
-                for p in potentials:
-                    node.children_ids.append(p.id)
-
-            # Ensure every node in 'next_floor' has at least one parent (prevents dead ends)
-            for target in next_floor_nodes:
-                if not any(target.id in n.children_ids for n in current_floor_nodes):
-                    parent = min(current_floor_nodes, key=lambda n: abs(n.x_pos - target.x_pos))
-                    parent.children_ids.append(target.id)
+        """Generate a structured branching graph for the entire act (or the first floors)."""
+        if self.endless:
+            self._extend_to(1 + self.lookahead)
+        else:
+            self._extend_to(self.act_length - 1)
+            boss_id = f"f{self.act_length}_x{self.width // 2}"
+            boss_node = DungeonNode(id=boss_id, floor=self.act_length, node_type=NODE_BOSS, x_pos=self.width // 2)
+            self._add_floor(self.act_length, [boss_node])
 
         # Initial state: First floor nodes are current options? 
         # Actually, in STS you pick one to start. We'll mark Floor 1 as reachable.
-        for node in floors[0]:
+        for node in self.floors[1]:
             node.reachable = True
+            self.reachable_ids.add(node.id)
+        self._build_reachability()
+
+    def _extend_to(self, last_floor: int):
+        for f in range(self.max_floor + 1, last_floor + 1):
+            self._add_floor(f, self._generate_floor(f))
+
+    def _generate_floor(self, f: int) -> list[DungeonNode]:
+        from src.constants import get_node_weights
+        floor_nodes = []
+        num_nodes = self.rng.randint(min(3, self.width), self.width)
+        node_types = _node_type_table(get_node_weights(f))  # BOSS_EVERY floors are all boss
+
+        # Distribute nodes horizontally
+        x_positions = sorted(self.rng.sample(range(self.width), num_nodes))
+
+        for x in x_positions:
+            node_id = f"f{f}_x{x}"
+
+            # Floor 1 is usually combat
+            if f == 1:
+                node_type = NODE_ENEMY
+            else:
+                node_type = node_types.sample(self.rng)
+
+            floor_nodes.append(DungeonNode(id=node_id, floor=f, node_type=node_type, x_pos=x))
+        return floor_nodes
+
+    def _add_floor(self, f: int, floor_nodes: list[DungeonNode]):
+        for node in floor_nodes:
+            self.nodes[node.id] = node
+        self.floors[f] = floor_nodes
+        self.max_floor = f
+        if f - 1 in self.floors:
+            self._connect(self.floors[f - 1], floor_nodes)
+
+    @staticmethod
+    def _connect(upper: list[DungeonNode], lower: list[DungeonNode]):
+        """Link two adjacent floors (both sorted by x_pos) in one sweep.
+
+        Each upper node links to every lower node within one lane, or to the
+        closest one if there is none; lower nodes still without a parent then get
+        an edge from their closest upper node. Ties go to the smaller x_pos.
+        """
+        n_lower = len(lower)
+        has_parent = [False] * n_lower
+        j = 0  # First lower node with x_pos >= x - 1
+        for node in upper:
+            x = node.x_pos
+            while j < n_lower and lower[j].x_pos < x - 1:
+                j += 1
+            k = j
+            while k < n_lower and lower[k].x_pos <= x + 1:
+                node.children_ids.append(lower[k].id)
+                has_parent[k] = True
+                k += 1
+            if k == j:  # No direct neighbour: bridge to the closest
+                if j == n_lower or (j > 0 and x - lower[j - 1].x_pos <= lower[j].x_pos - x):
+                    k = j - 1
+                node.children_ids.append(lower[k].id)
+                has_parent[k] = True
+
+        # Ensure every lower node has at least one parent (prevents dead ends)
+        n_upper = len(upper)
+        i = 0  # Last upper node with x_pos <= target x, if any
+        for k, target in enumerate(lower):
+            if has_parent[k]:
+                continue
+            x = target.x_pos
+            while i + 1 < n_upper and upper[i + 1].x_pos <= x:
+                i += 1
+            parent = upper[i]
+            if i + 1 < n_upper and abs(upper[i + 1].x_pos - x) < abs(parent.x_pos - x):
+                parent = upper[i + 1]
+            parent.children_ids.append(target.id)
+
+    def _advance_window(self):
+        """Endless mode: generate ahead of current_floor and compact floors far behind."""
+        self._extend_to(self.current_floor + 1 + self.lookahead)
+        oldest = self.current_floor - self.keep_behind
+        while self.floors:
+            f = next(iter(self.floors))  # Floors are inserted in ascending order
+            if f >= oldest:
+                break
+            for node in self.floors.pop(f):
+                del self.nodes[node.id]
+                self.compacted_nodes[node.node_type] += 1
+                if node.completed:
+                    self.compacted_cleared[node.node_type] += 1
+            self.compacted_floors += 1
+
+    # Selection state is kept incrementally: every operation below touches only
+    # the current node, the old reachable set and the new node's children.
 
     def current_node(self) -> Optional[DungeonNode]:
-        for n in self.nodes.values():
-            if n.current:
-                return n
-        return None
+        return self.nodes.get(self._current_id) if self._current_id else None
+
+    def reachable_nodes(self) -> list[DungeonNode]:
+        """Nodes the player can move to next, in map order."""
+        return sorted((self.nodes[i] for i in self.reachable_ids),
+                      key=lambda n: (n.floor, n.x_pos))
 
     def select_node(self, node_id: str):
         """Player picks a reachable node."""
@@ -128,8 +215,9 @@ class Dungeon:
             curr = self.current_node()
             if curr:
                 curr.current = False
-            
+
             node.current = True
+            self._current_id = node_id
             return True
         return False
 
@@ -138,24 +226,91 @@ class Dungeon:
         if node:
             node.completed = True
             node.current = False
+            self._current_id = None
             self.current_floor = node.floor
-            
+            self.version += 1
             # Clear previous reachable
-            for n in self.nodes.values():
-                n.reachable = False
-                
+            for nid in self.reachable_ids:
+                self.nodes[nid].reachable = False
+            self.reachable_ids.clear()
+
+            if self.endless:
+                self._advance_window()
+                self._build_reachability()
+
             # Set next reachable
+            self._frontier = 0
             for cid in node.children_ids:
-                if cid in self.nodes:
-                    self.nodes[cid].reachable = True
+                child = self.nodes.get(cid)
+                if child:
+                    child.reachable = True
+                    self.reachable_ids.add(cid)
+                    self._frontier |= self._reach[child.index]
 
     def get_nodes_by_floor(self) -> dict[int, list[DungeonNode]]:
-        by_floor = {}
-        for n in self.nodes.values():
-            if n.floor not in by_floor:
-                by_floor[n.floor] = []
-            by_floor[n.floor].append(n)
-        return by_floor
+        """Persistent floor index. Callers must not modify it."""
+        return self.floors
+
+    # ── Reachability index ───────────────────────────────────────────────────
+    # Each node owns bit `node.index`. _reach[i] holds node i plus everything
+    # reachable from it, _ancestors[i] node i plus everything leading to it, and
+    # _frontier the union of _reach over the nodes the player can move to next.
+    # Queries are a couple of integer ANDs; "from" defaults to that frontier.
+
+    def _build_reachability(self):
+        """Recompute every bitset. Floors are ascending, so this order is topological."""
+        order = [n for floor_nodes in self.floors.values() for n in floor_nodes]
+        for i, n in enumerate(order):
+            n.index = i
+        nodes = self.nodes
+        reach = [0] * len(order)
+        ancestors = [0] * len(order)
+        type_masks: dict[str, int] = {}
+
+        for n in reversed(order):
+            mask = 1 << n.index
+            for cid in n.children_ids:
+                child = nodes.get(cid)
+                if child:
+                    mask |= reach[child.index]
+            reach[n.index] = mask
+        for n in order:
+            bit = 1 << n.index
+            ancestors[n.index] |= bit
+            type_masks[n.node_type] = type_masks.get(n.node_type, 0) | bit
+            for cid in n.children_ids:
+                child = nodes.get(cid)
+                if child:
+                    ancestors[child.index] |= ancestors[n.index]
+
+        self._reach, self._ancestors, self._type_masks = reach, ancestors, type_masks
+        self._frontier = 0
+        for nid in self.reachable_ids:
+            self._frontier |= reach[nodes[nid].index]
+
+    def reach_mask(self, from_id: Optional[str] = None) -> int:
+        """Bitset of the nodes still reachable from `from_id` (itself included)."""
+        if from_id is None:
+            return self._frontier
+        node = self.nodes.get(from_id)
+        return self._reach[node.index] if node else 0
+
+    def can_reach(self, node_id: str, from_id: Optional[str] = None) -> bool:
+        node = self.nodes.get(node_id)
+        return bool(node) and bool(self.reach_mask(from_id) >> node.index & 1)
+
+    def count_ahead(self, node_type: str, from_id: Optional[str] = None) -> int:
+        """How many nodes of `node_type` lie on some path from `from_id`."""
+        return (self.reach_mask(from_id) & self._type_masks.get(node_type, 0)).bit_count()
+
+    def path_mask(self, to_id: str, from_id: Optional[str] = None) -> int:
+        """Bitset of the nodes on at least one path from `from_id` to `to_id`."""
+        node = self.nodes.get(to_id)
+        return self.reach_mask(from_id) & self._ancestors[node.index] if node else 0
+
+    @staticmethod
+    def in_mask(node: DungeonNode, mask: int) -> bool:
+        return node.index >= 0 and bool(mask >> node.index & 1)
 
 
 # ─────────────────────────────────────────────
@@ -207,7 +362,7 @@ def _gain_strength(hero):
 
 def _gain_card(hero):
     from src.models.card import get_reward_cards
-    cards = get_reward_cards(n=1)
+    cards = get_reward_cards(n=1, rng=hero.rng.events)
     if cards:
         hero.add_card_to_deck(cards[0])
         return f"Added {cards[0].name} to your deck."
@@ -215,8 +370,7 @@ def _gain_card(hero):
 
 def _remove_card(hero):
     if len(hero.deck) > 1:
-        import random
-        card = random.choice(hero.deck)
+        card = hero.rng.events.choice(hero.deck)
         hero.remove_card_from_deck(card)
         return f"Removed {card.name} from your deck."
     return "Your deck is too small to remove a card."
@@ -296,5 +450,5 @@ EVENTS = [
 ]
 
 
-def get_random_event() -> Event:
-    return random.choice(EVENTS)
+def get_random_event(rng=None) -> Event:
+    return (rng or random).choice(EVENTS)
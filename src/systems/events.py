@@ -0,0 +1,145 @@
+"""
+Combat events — typed records of what happened in a fight, kept in a ring buffer.
+
+Game code emits events with `events.emit(EventType, *fields)`, which builds
+nothing while recording is off. Text is produced only by describe(), through
+t(), when something actually displays an event.
+"""
+from __future__ import annotations
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Iterator, Optional
+
+from src.localization import t
+
+DEFAULT_CAPACITY = 50
+
+
+# ─────────────────────────────────────────────
+# Event types
+# ─────────────────────────────────────────────
+# `source` / `target` are the Hero or Enemy involved (None when there is no
+# actor, e.g. Burn). `cause` picks the message: "" for the plain action, else
+# the status or power responsible.
+
+@dataclass(slots=True)
+class CardPlayed:
+    card: Any
+
+    @property
+    def key(self) -> str:
+        return "log.card_played"
+
+
+@dataclass(slots=True)
+class DamageDealt:
+    source: Any
+    target: Any
+    amount: int
+    cause: str = ""
+
+    @property
+    def key(self) -> str:
+        return "log.damage." + (self.cause or "attack")
+
+
+@dataclass(slots=True)
+class BlockGained:
+    target: Any
+    amount: int
+    cause: str = ""
+
+    @property
+    def key(self) -> str:
+        return "log.block." + (self.cause or "defend")
+
+
+@dataclass(slots=True)
+class StatusApplied:
+    source: Any
+    target: Any
+    status: str
+    stacks: int
+    cause: str = ""  # "buff" / "debuff" for enemy intents, else the status responsible
+
+    @property
+    def key(self) -> str:
+        return "log.status." + self.cause
+
+
+@dataclass(slots=True)
+class Healed:
+    target: Any
+    amount: int
+    cause: str = ""
+
+    @property
+    def key(self) -> str:
+        return "log.heal." + (self.cause or "heal")
+
+
+# ─────────────────────────────────────────────
+# Ring buffer
+# ─────────────────────────────────────────────
+
+class EventLog:
+    """The last `capacity` events of a fight, oldest dropped first."""
+    __slots__ = ("enabled", "emitted", "_buffer")
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY, enabled: bool = True):
+        self.enabled = enabled
+        self.emitted = 0  # Events recorded over the log's lifetime
+        self._buffer: deque = deque(maxlen=capacity)
+
+    @property
+    def capacity(self) -> int:
+        return self._buffer.maxlen
+
+    def emit(self, event_type: type, *fields):
+        if self.enabled:
+            self._buffer.append(event_type(*fields))
+            self.emitted += 1
+
+    def latest(self, n: int) -> list:
+        """Up to n most recent events, oldest first."""
+        buffer = self._buffer
+        return list(buffer)[-n:] if n < len(buffer) else list(buffer)
+
+    def clear(self):
+        self._buffer.clear()
+
+    def __iter__(self) -> Iterator:
+        return iter(self._buffer)
+
+    def __len__(self) -> int:
+        return len(self._buffer)
+
+
+NO_EVENTS = EventLog(capacity=0, enabled=False)  # Sink for combatants outside a fight
+
+
+# ─────────────────────────────────────────────
+# Formatting
+# ─────────────────────────────────────────────
+
+def _who(actor: Optional[Any]) -> str:
+    if actor is None:
+        return ""
+    if hasattr(actor, "action_pattern"):  # Enemy
+        return t("enemy.name." + actor.name)
+    return actor.name
+
+
+def describe(event) -> str:
+    """Localized one-line description of `event` in the current language."""
+    fields = {}
+    for name in event.__slots__:
+        value = getattr(event, name)
+        if name in ("source", "target"):
+            value = _who(value)
+        elif name == "card":
+            value = t("card.name." + value.name)
+        elif name == "status":
+            value = t("status." + value)
+        fields[name] = value
+    return t(event.key).format(**fields)
@@ -0,0 +1,320 @@
+"""
+Combat search — Monte Carlo tree search over the player's moves, for hints.
+
+Moves are labels rather than hand indices: (card name, target slot), with slot -1
+for untargeted cards, or END_TURN. A node therefore means the same thing however
+the hand happens to be ordered. Enemy intents follow fixed patterns, so the only
+hidden information is the order of the draw pile: every iteration plays on a
+clone whose draw pile is reshuffled with the search's own RNG (open-loop search
+over determinized states). The tree survives the player's moves via advance().
+"""
+from __future__ import annotations
+import math
+import multiprocessing
+import os
+import random
+import time
+from typing import Optional, TYPE_CHECKING
+
+from src.systems.combat import CombatPhase
+from src.systems.rng import GameRng
+
+if TYPE_CHECKING:
+    from src.systems.combat import CombatState
+
+Move = tuple[str, int]
+END_TURN: Move = ("", -1)
+
+
+# ─────────────────────────────────────────────
+# Moves
+# ─────────────────────────────────────────────
+
+def legal_moves(combat: "CombatState") -> list[Move]:
+    """Every distinct move available now. Copies of a card in hand are one move."""
+    moves = []
+    if combat.phase != CombatPhase.PLAYER_TURN:
+        return moves
+    targets = [i for i, e in enumerate(combat.enemies) if not e.is_dead()]
+    seen = set()
+    for card in combat.hero.hand:
+        if card.name in seen or not combat.can_play_card(card):
+            continue
+        seen.add(card.name)
+        if card.targeted:
+            moves.extend((card.name, slot) for slot in targets)
+        else:
+            moves.append((card.name, -1))
+    moves.append(END_TURN)
+    return moves
+
+
+def apply_move(combat: "CombatState", move: Move) -> bool:
+    """Play `move` on `combat`. END_TURN also runs the enemy turn. False if illegal."""
+    if move == END_TURN:
+        if combat.phase != CombatPhase.PLAYER_TURN:
+            return False
+        combat.end_player_turn()
+        combat.execute_enemy_turn()
+        return True
+    name, slot = move
+    for i, card in enumerate(combat.hero.hand):
+        if card.name == name and combat.can_play_card(card):
+            return combat.play_fast(i, slot if slot >= 0 else None)
+    return False
+
+
+def evaluate(combat: "CombatState") -> float:
+    """Outcome in [0, 1]: losses score 0, wins at least 0.6 plus remaining HP."""
+    hero = combat.hero
+    hp = hero.current_hp / hero.max_hp
+    if combat.phase == CombatPhase.COMBAT_LOST:
+        return 0.0
+    if combat.phase == CombatPhase.COMBAT_WON:
+        return 0.6 + 0.4 * hp
+    enemy_max = sum(e.max_hp for e in combat.enemies) or 1
+    enemy_left = sum(e.current_hp for e in combat.enemies) / enemy_max
+    return 0.3 * hp + 0.3 * (1.0 - enemy_left)
+
+
+# ─────────────────────────────────────────────
+# Search
+# ─────────────────────────────────────────────
+
+class Node:
+    __slots__ = ("children", "visits", "value")
+
+    def __init__(self):
+        self.children: dict[Move, Node] = {}
+        self.visits = 0
+        self.value = 0.0  # Sum of playout rewards
+
+    def mean(self) -> float:
+        return self.value / self.visits if self.visits else 0.0
+
+
+class CombatSearch:
+    """Open-loop UCT from a snapshot of a fight. See BackgroundSearch for off-thread use."""
+
+    def __init__(self, exploration: float = 1.0, rollout_turns: int = 6,
+                 rng: Optional[random.Random] = None):
+        self.exploration = exploration
+        self.rollout_turns = rollout_turns  # Turns played past the root before scoring
+        self.rng = rng or random.Random()
+        self.root = Node()
+        self.root_hash: Optional[int] = None
+        self._root_state: Optional["CombatState"] = None
+        self.playouts = 0
+        self.search_time = 0.0
+
+    def reset(self, combat: "CombatState"):
+        """Search from `combat` with a fresh tree."""
+        self.root = Node()
+        self.playouts = 0
+        self.search_time = 0.0
+        self.set_state(combat)
+
+    def set_state(self, combat: "CombatState"):
+        """Snapshot `combat` as the position the current root stands for."""
+        self._root_state = combat.clone()
+        self._root_state.events.enabled = False  # Clones made from it inherit the flag
+        self.root_hash = combat.state_hash()
+
+    def advance(self, move: Move):
+        """Re-root on `move` so its subtree is reused. Call set_state before searching."""
+        self.root = self.root.children.get(move) or Node()
+        self._root_state = None
+        self.root_hash = None
+
+    # ── Iterations ───────────────────────────────────────────────────────────
+
+    def iterate(self):
+        """One selection / expansion / rollout / backup pass."""
+        rng = self.rng
+        state = self._root_state.clone(GameRng(rng.getrandbits(63)))
+        state.hero.draw_pile.shuffle(state.hero.rng.combat)  # Sample the hidden draw order
+        horizon = state.turn_number + self.rollout_turns
+
+        node, path = self.root, [self.root]
+        while not state.is_over:
+            moves = legal_moves(state)
+            untried = [m for m in moves if m not in node.children]
+            if untried:
+                move = rng.choice(untried)
+                apply_move(state, move)
+                child = node.children[move] = Node()
+                path.append(child)
+                break
+            log_n = math.log(node.visits + 1)
+            c = self.exploration
+            move = max(moves, key=lambda m: node.children[m].mean()
+                       + c * math.sqrt(log_n / (node.children[m].visits + 1)))
+            apply_move(state, move)
+            node = node.children[move]
+            path.append(node)
+
+        reward = self._rollout(state, horizon)
+        for n in path:
+            n.visits += 1
+            n.value += reward
+        self.playouts += 1
+
+    def _rollout(self, state: "CombatState", horizon: int) -> float:
+        """Play random cards until none is playable, then end the turn; repeat."""
+        rng = self.rng
+        while not state.is_over and state.turn_number <= horizon:
+            moves = legal_moves(state)
+            if len(moves) > 1:
+                apply_move(state, rng.choice(moves[:-1]))
+            else:
+                apply_move(state, END_TURN)
+        return evaluate(state)
+
+    def run(self, seconds: float):
+        """Iterate for about `seconds`."""
+        start = time.perf_counter()
+        deadline = start + seconds
+        while time.perf_counter() < deadline:
+            self.iterate()
+        self.search_time += time.perf_counter() - start
+
+    # ── Results ──────────────────────────────────────────────────────────────
+
+    def best_move(self) -> Optional[Move]:
+        """Most visited move that is legal at the root, or None before any search."""
+        if self._root_state is None:
+            return None
+        legal = legal_moves(self._root_state)
+        visited = [m for m in legal if m in self.root.children]
+        if not visited:
+            return None
+        return max(visited, key=lambda m: self.root.children[m].visits)
+
+    @property
+    def playouts_per_second(self) -> float:
+        return self.playouts / self.search_time if self.search_time else 0.0
+
+
+# ─────────────────────────────────────────────
+# Background worker
+# ─────────────────────────────────────────────
+
+def _search_worker(conn, budget: float):
+    """Worker process loop: obeys messages from BackgroundSearch, streams results back."""
+    if hasattr(os, "nice"):
+        os.nice(10)  # On a single core the render loop still comes first
+    search = CombatSearch()
+    searching, deadline = False, 0.0
+    while True:
+        if conn.poll(0 if searching else None):
+            msg = conn.recv()
+            kind = msg[0]
+            if kind == "search":
+                _, combat, state_hash = msg
+                if search.root_hash is None and search.root.visits:
+                    search.set_state(combat)  # Re-rooted by advance(): reuse the subtree
+                elif search.root_hash != state_hash:
+                    search.reset(combat)
+                searching, deadline = True, time.perf_counter() + budget
+            elif kind == "advance":
+                search.advance(msg[1])
+                searching = False
+            elif kind == "stop":
+                searching = False
+            elif kind == "quit":
+                return
+            continue
+        search.run(0.05)
+        searching = time.perf_counter() < deadline
+        conn.send((search.root_hash, search.best_move(), search.playouts,
+                   search.playouts_per_second, searching))
+
+
+class BackgroundSearch:
+    """Runs a CombatSearch in a worker process, so the render loop never waits on
+    it or competes with it for the GIL. All calls are non-blocking; results are
+    picked up from the pipe whenever they are asked for.
+    """
+
+    def __init__(self, budget: float = 1.0):
+        self.budget = budget  # Seconds of search per position
+        self._conn = None
+        self._process = None
+        self._hash: Optional[int] = None  # Position the pending / latest search is for
+        self._best: Optional[Move] = None
+        self._playouts = 0
+        self._rate = 0.0
+        self._searching = False
+
+    def _worker(self):
+        if self._process is None or not self._process.is_alive():
+            ctx = multiprocessing.get_context("spawn")  # Never fork the SDL process
+            self._conn, child = ctx.Pipe()
+            self._process = ctx.Process(target=_search_worker, args=(child, self.budget),
+                                        name="combat-search", daemon=True)
+            self._process.start()
+        return self._conn
+
+    def _poll(self):
+        conn = self._conn
+        try:
+            while conn is not None and conn.poll():
+                state_hash, best, playouts, rate, searching = conn.recv()
+                if state_hash == self._hash:  # Drop results for positions already left
+                    self._best, self._playouts, self._rate = best, playouts, rate
+                    self._searching = searching
+        except (EOFError, OSError):  # Worker died: hints stop, the game goes on
+            self._process = self._conn = None
+            self._searching = False
+
+    # ── Control ──────────────────────────────────────────────────────────────
+
+    def start(self, combat: "CombatState"):
+        """Search `combat` for one budget. The worker keeps its tree if it still applies."""
+        state_hash = combat.state_hash()
+        self._worker().send(("search", combat.clone(), state_hash))
+        self._hash, self._best, self._searching = state_hash, None, True
+
+    def advance(self, move: Move):
+        """The player made `move`: the worker keeps its subtree for the next search."""
+        if self._conn is not None:
+            self._conn.send(("advance", move))
+        self._hash, self._best, self._searching = None, None, False
+
+    def stop(self):
+        if self._conn is not None and self._searching:
+            self._conn.send(("stop",))
+        self._searching = False
+
+    def close(self):
+        """Shut the worker down; a later start() spawns a fresh one."""
+        if self._process is not None:
+            try:
+                self._conn.send(("quit",))
+            except OSError:  # Already gone
+                pass
+            self._process.join(1.0)
+            if self._process.is_alive():
+                self._process.terminate()
+            self._conn.close()
+            self._process = self._conn = None
+        self._hash, self._best, self._searching = None, None, False
+
+    # ── Results ──────────────────────────────────────────────────────────────
+
+    @property
+    def running(self) -> bool:
+        self._poll()
+        return self._searching
+
+    def is_current(self, combat: "CombatState") -> bool:
+        return self._hash is not None and self._hash == combat.state_hash()
+
+    def best_move(self) -> Optional[Move]:
+        self._poll()
+        return self._best
+
+    def stats(self) -> tuple[int, float]:
+        """(playouts on the current tree, playouts per second)."""
+        self._poll()
+        return self._playouts, self._rate
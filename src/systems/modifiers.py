@@ -0,0 +1,49 @@
+"""
+Damage and block modifiers — one pipeline for the hero and enemies.
+
+Statuses (and, for the hero, relics and powers) each contribute additive and
+multiplicative terms to a Modifiers record. A combatant composes it once and
+keeps it until its StatusSet.version or its listeners change, so every hit
+after the first is a cached lookup. Rounding is the same everywhere:
+add first, multiply, then truncate toward zero.
+"""
+from __future__ import annotations
+from dataclasses import dataclass
+from typing import Iterable, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from src.models.status import StatusSet
+
+
+@dataclass(slots=True)
+class Modifiers:
+    attack_add: int = 0       # Strength
+    attack_mult: float = 1.0  # Weak
+    block_add: int = 0        # Dexterity
+    taken_mult: float = 1.0   # Vulnerable: damage received through block
+
+    def attack(self, base: int) -> int:
+        """Outgoing attack damage for a card or intent of `base` damage."""
+        return max(0, int((base + self.attack_add) * self.attack_mult))
+
+    def block(self, base: int) -> int:
+        """Block gained from a card of `base` block."""
+        return base + self.block_add
+
+    def taken(self, amount: int) -> int:
+        """Damage received from an attack of `amount`, before block."""
+        return int(amount * self.taken_mult)
+
+
+NO_MODIFIERS = Modifiers()  # Shared result for combatants with nothing to compose
+
+
+def compose(statuses: "StatusSet", listeners: Iterable = ()) -> Modifiers:
+    """Fold every status's and listener's contribution into one Modifiers."""
+    if not statuses and not listeners:
+        return NO_MODIFIERS
+    mods = Modifiers()
+    statuses.modify(mods)
+    for listener in listeners:
+        listener.modify(mods)
+    return mods
@@ -0,0 +1,57 @@
+"""
+Seedable RNG streams — one GameRng per run, split into independent named substreams.
+
+Every subsystem draws from its own stream, so e.g. picking a different card reward
+never changes the map, and many runs can execute side by side in threads or
+processes without touching the shared global `random` module.
+"""
+from __future__ import annotations
+import os
+import random
+from typing import Optional
+
+STREAMS = ("map", "combat", "rewards", "events")
+
+
+class GameRng:
+    """Root seed plus one `random.Random` per stream, each derived from the seed.
+
+    Streams are created on first use: seeding a Mersenne Twister is the expensive
+    part, and a headless fight only ever touches `combat`.
+    """
+    __slots__ = ("seed",) + STREAMS
+
+    def __init__(self, seed: Optional[int] = None):
+        if seed is None:
+            seed = int.from_bytes(os.urandom(8), "little") >> 1
+        self.seed = seed
+
+    def __getattr__(self, name: str) -> random.Random:
+        # Only reached while the stream's slot is still empty
+        if name not in STREAMS:
+            raise AttributeError(name)
+        stream = random.Random(f"{self.seed}:{name}")
+        setattr(self, name, stream)
+        return stream
+
+    def stream(self, name: str) -> random.Random:
+        if name not in STREAMS:
+            raise ValueError(f"Unknown RNG stream: {name}")
+        return getattr(self, name)
+
+    def clone(self) -> "GameRng":
+        """Independent copy: same seed, and every stream already in use resumes
+        from the same point. Streams not yet created stay lazy."""
+        new = GameRng(self.seed)
+        for name in STREAMS:
+            try:
+                stream = object.__getattribute__(self, name)  # Skips the lazy __getattr__
+            except AttributeError:
+                continue
+            copy = random.Random.__new__(random.Random)  # Skip seeding, state comes next
+            copy.setstate(stream.getstate())
+            setattr(new, name, copy)
+        return new
+
+    def __repr__(self):
+        return f"GameRng(seed={self.seed})"
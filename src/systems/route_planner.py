@@ -0,0 +1,102 @@
+"""
+Route planner — best path from the player's next choices to the end of the map.
+
+One dynamic-programming pass over the dungeon DAG, top floor first:
+best[n] = value(n) + max(best[child]). Node values depend on the node type and
+on the hero (HP for elite risk, gold for merchants). The result is cached until
+the dungeon changes or the hero's valuation does.
+"""
+from __future__ import annotations
+from dataclasses import dataclass
+from typing import Optional, TYPE_CHECKING
+
+from src.systems.dungeon import (NODE_ENEMY, NODE_ELITE, NODE_BOSS, NODE_CHEST,
+                                 NODE_MERCHANT, NODE_EVENT)
+
+if TYPE_CHECKING:
+    from src.models.hero import Hero
+    from src.systems.dungeon import Dungeon
+
+
+@dataclass(frozen=True)
+class RouteValues:
+    """Score of visiting each node type. Elites flip to a risk while the hero is hurt."""
+    enemy: float = 1.0
+    elite: float = 2.5
+    elite_hurt: float = -2.0
+    chest: float = 1.5
+    event: float = 1.2
+    merchant: float = 0.3            # Plus merchant_per_100_gold for every 100 gold held
+    merchant_per_100_gold: float = 1.0
+    boss: float = 0.0
+    hurt_threshold: float = 0.5      # HP fraction below which the hero counts as hurt
+    safe_bonus_hurt: float = 0.8     # Added to chests, events and merchants while hurt
+
+    def for_hero(self, hero: "Hero") -> dict[str, float]:
+        hurt = hero.current_hp < hero.max_hp * self.hurt_threshold
+        safe = self.safe_bonus_hurt if hurt else 0.0
+        return {
+            NODE_ENEMY:    self.enemy * (0.5 if hurt else 1.0),
+            NODE_ELITE:    self.elite_hurt if hurt else self.elite,
+            NODE_CHEST:    self.chest + safe,
+            NODE_EVENT:    self.event + safe,
+            NODE_MERCHANT: self.merchant + self.merchant_per_100_gold * hero.gold / 100 + safe,
+            NODE_BOSS:     self.boss,
+        }
+
+
+@dataclass
+class Route:
+    score: float
+    node_ids: list[str]  # First entry is one of the currently reachable nodes
+
+    @property
+    def next_id(self) -> Optional[str]:
+        return self.node_ids[0] if self.node_ids else None
+
+
+class RoutePlanner:
+    def __init__(self, values: Optional[RouteValues] = None):
+        self.values = values or RouteValues()
+        self._cache_dungeon: Optional["Dungeon"] = None  # Compared by identity, not id()
+        self._cache_key = None
+        self._cache_route: Optional[Route] = None
+
+    def plan(self, dungeon: "Dungeon", hero: "Hero") -> Route:
+        """Best route from the reachable nodes. Cached per (dungeon state, node values)."""
+        node_values = self.values.for_hero(hero)
+        key = (dungeon.version, tuple(node_values.values()))
+        if dungeon is not self._cache_dungeon or key != self._cache_key:
+            self._cache_route = self._solve(dungeon, node_values)
+            self._cache_dungeon, self._cache_key = dungeon, key
+        return self._cache_route
+
+    @staticmethod
+    def _solve(dungeon: "Dungeon", node_values: dict[str, float]) -> Route:
+        frontier = dungeon.reach_mask()
+        nodes = dungeon.nodes
+        best: dict[str, float] = {}
+        step: dict[str, Optional[str]] = {}  # Best child on the way up
+
+        for floor in reversed(list(dungeon.floors)):
+            for node in dungeon.floors[floor]:
+                if not dungeon.in_mask(node, frontier):
+                    continue
+                child_id, child_score = None, 0.0
+                for cid in node.children_ids:
+                    if cid in best and (child_id is None or best[cid] > child_score):
+                        child_id, child_score = cid, best[cid]
+                best[node.id] = node_values.get(node.node_type, 0.0) + child_score
+                step[node.id] = child_id
+
+        start = None
+        for node in dungeon.reachable_nodes():
+            if start is None or best[node.id] > best[start]:
+                start = node.id
+        if start is None:
+            return Route(0.0, [])
+
+        path = [start]
+        while step[path[-1]] is not None and step[path[-1]] in nodes:
+            path.append(step[path[-1]])
+        return Route(best[start], path)
@@ -0,0 +1,78 @@
+"""
+Weighted sampling — alias tables for O(1) draws from fixed or slowly changing pools.
+
+Build cost is O(n) (Vose's method), so tables are built once and cached; a cache
+entry carries the version of the pool it was built from and is rebuilt when the
+owner reports a different version.
+"""
+from __future__ import annotations
+from typing import Callable, Generic, Hashable, Sequence, TypeVar
+
+T = TypeVar("T")
+
+
+class AliasTable(Generic[T]):
+    """Immutable weighted distribution over `items`. Zero-weight items are never drawn."""
+    __slots__ = ("items", "_prob", "_alias", "_n", "support")
+
+    def __init__(self, items: Sequence[T], weights: Sequence[float]):
+        if len(items) != len(weights):
+            raise ValueError("items and weights differ in length")
+        total = float(sum(weights))
+        if not items or total <= 0:
+            raise ValueError("AliasTable needs at least one positive weight")
+        n = len(items)
+        self.items = tuple(items)
+        self._n = n
+        self.support = sum(1 for w in weights if w > 0)  # Items that can be drawn
+
+        prob = [w * n / total for w in weights]
+        alias = list(range(n))
+        small = [i for i, p in enumerate(prob) if p < 1.0]
+        large = [i for i, p in enumerate(prob) if p >= 1.0]
+        while small and large:
+            s, l = small.pop(), large.pop()
+            alias[s] = l
+            prob[l] -= 1.0 - prob[s]
+            (small if prob[l] < 1.0 else large).append(l)
+        for i in small + large:  # Only rounding error left
+            prob[i] = 1.0
+        self._prob = tuple(prob)
+        self._alias = tuple(alias)
+
+    def sample(self, rng) -> T:
+        u = rng.random() * self._n
+        i = int(u)
+        return self.items[i] if u - i < self._prob[i] else self.items[self._alias[i]]
+
+    def sample_distinct(self, rng, k: int) -> list[T]:
+        """Up to k different items, each drawn proportionally to the remaining weight."""
+        k = min(k, self.support)
+        chosen: list[T] = []
+        while len(chosen) < k:
+            item = self.sample(rng)
+            if item not in chosen:  # Rejection keeps the without-replacement odds
+                chosen.append(item)
+        return chosen
+
+    def __len__(self) -> int:
+        return self._n
+
+
+class TableCache:
+    """Alias tables by key, each tagged with the version of the pool it came from."""
+    __slots__ = ("_tables",)
+
+    def __init__(self):
+        self._tables: dict[Hashable, tuple[Hashable, AliasTable]] = {}
+
+    def get(self, key: Hashable, build: Callable[[], AliasTable], version: Hashable = None) -> AliasTable:
+        entry = self._tables.get(key)
+        if entry is None or entry[0] != version:
+            entry = (version, build())
+            self._tables[key] = entry
+        return entry[1]
+
+    def clear(self):
+        self._tables.clear()
+
@@ -0,0 +1,231 @@
+"""
+Turn solver — the best sequence of plays for the rest of the current turn.
+
+Depth-first over the moves of mcts.legal_moves (minus END_TURN), memoized on
+the position's Zobrist hash, so each distinct (hand, piles, energy, HP, block,
+statuses) is solved once however many play orders reach it. A position is
+pruned when another one with the same cards and statuses has been seen with at
+least as much energy, hero HP and block and no more enemy HP and block.
+
+Each candidate stopping point is scored like mcts.evaluate, after the enemies'
+telegraphed attacks are taken against the hero's block. Like mcts, the solver
+never sees the hidden state: the root is a clone with its own RNG streams whose
+draw pile is put in a fixed order and reshuffled, so cards that draw mid-turn and random effects play
+out on one sampled determinization rather than the real draw order.
+
+The plan is exact unless the position cap or time budget runs out first; past
+that, positions are scored without expanding and TurnPlan.truncated is set.
+BackgroundSolve runs the solver in a worker process for the combat screen.
+"""
+from __future__ import annotations
+import multiprocessing
+import os
+import random
+import time
+from dataclasses import dataclass, field
+from typing import Optional, TYPE_CHECKING
+
+from src.models.enemy import Action
+from src.systems.mcts import Move, END_TURN, legal_moves, apply_move, evaluate
+from src.systems.rng import GameRng
+from src.systems.zobrist import zkey, HERO_HP, HERO_BLOCK, HERO_ENERGY, ENEMY_HP, ENEMY_BLOCK
+
+if TYPE_CHECKING:
+    from src.systems.combat import CombatState
+
+
+@dataclass
+class TurnPlan:
+    score: float
+    moves: list[Move] = field(default_factory=list)  # Ends with END_TURN
+    positions: int = 0   # Distinct positions solved
+    pruned: int = 0      # Positions skipped as dominated
+    truncated: bool = False  # The position cap or time budget ran out: not necessarily optimal
+
+
+class TurnSolver:
+    def __init__(self, max_positions: int = 20_000, time_budget: Optional[float] = None,
+                 rng: Optional[random.Random] = None):
+        # Past either limit, positions are scored without expanding
+        self.max_positions = max_positions
+        self.time_budget = time_budget  # Seconds per solve, or None for no limit
+        self.rng = rng or random.Random()  # Samples the hidden draw order
+        self._memo: dict[int, tuple[float, list[Move]]] = {}
+        self._frontier: dict[int, list[tuple[int, ...]]] = {}
+        self._pruned = 0
+        self._deadline = float("inf")
+        self._truncated = False
+
+    def solve(self, combat: "CombatState") -> TurnPlan:
+        """Plan the rest of the player's turn. Does not modify `combat`."""
+        self._memo.clear()
+        self._frontier.clear()
+        self._pruned = 0
+        self._truncated = False
+        self._deadline = (time.perf_counter() + self.time_budget
+                          if self.time_budget is not None else float("inf"))
+        root = combat.clone(GameRng(self.rng.getrandbits(63)))
+        draw_pile = root.hero.draw_pile
+        draw_pile.reset(sorted(draw_pile, key=lambda card: card.id))  # Forget the real order,
+        draw_pile.shuffle(root.hero.rng.combat)                       # then sample one
+        root.events.enabled = False
+        score, moves = self._best(root)
+        return TurnPlan(score, moves + [END_TURN], len(self._memo), self._pruned, self._truncated)
+
+    def _out_of_budget(self) -> bool:
+        if len(self._memo) >= self.max_positions or time.perf_counter() >= self._deadline:
+            self._truncated = True
+        return self._truncated
+
+    def _best(self, state: "CombatState") -> tuple[float, list[Move]]:
+        state_hash = state.state_hash()
+        known = self._memo.get(state_hash)
+        if known is not None:
+            return known
+
+        best = (self._score_end_turn(state), [])
+        if not state.is_over and not self._out_of_budget() and not self._dominated(state, state_hash):
+            for move in legal_moves(state)[:-1]:
+                child = state.clone()
+                if not apply_move(child, move):
+                    continue
+                score, moves = self._best(child)
+                if score > best[0]:
+                    best = (score, [move] + moves)
+        self._memo[state_hash] = best
+        return best
+
+    def _dominated(self, state: "CombatState", state_hash: int) -> bool:
+        """Record `state` on its Pareto frontier; True if an earlier state dominates it."""
+        hero = state.hero
+        shape = (state_hash ^ zkey(HERO_HP, hero.current_hp) ^ zkey(HERO_BLOCK, hero.block)
+                 ^ zkey(HERO_ENERGY, hero.energy))
+        vector = [hero.energy, hero.current_hp, hero.block]
+        for slot, enemy in enumerate(state.enemies):
+            shape ^= zkey(ENEMY_HP, slot, enemy.current_hp) ^ zkey(ENEMY_BLOCK, slot, enemy.block)
+            vector += (-enemy.current_hp, -enemy.block)
+        vector = tuple(vector)
+
+        frontier = self._frontier.setdefault(shape, [])
+        for other in frontier:
+            if all(a >= b for a, b in zip(other, vector)):
+                self._pruned += 1
+                return True
+        frontier[:] = [o for o in frontier if not all(a >= b for a, b in zip(vector, o))]
+        frontier.append(vector)
+        return False
+
+    @staticmethod
+    def _score_end_turn(state: "CombatState") -> float:
+        """mcts.evaluate after the enemies' telegraphed attacks land on the hero's block."""
+        if state.is_over:
+            return evaluate(state)
+        hero = state.hero
+        taken = hero.modifiers().taken
+        incoming = 0
+        for enemy in state.enemies:
+            action = enemy.next_action
+            if not enemy.is_dead() and action is not None and action.type == Action.ATTACK:
+                incoming += taken(enemy.calc_damage(action.value))
+        hp = max(0, hero.current_hp - max(0, incoming - hero.block)) / hero.max_hp
+        if hp <= 0:
+            return 0.0
+        enemy_max = sum(e.max_hp for e in state.enemies) or 1
+        enemy_left = sum(e.current_hp for e in state.enemies) / enemy_max
+        return 0.3 * hp + 0.3 * (1.0 - enemy_left)
+
+
+# ─────────────────────────────────────────────
+# Background worker
+# ─────────────────────────────────────────────
+
+def _solve_worker(conn, max_positions: int, time_budget: Optional[float]):
+    """Worker process loop: solves each position BackgroundSolve sends it."""
+    if hasattr(os, "nice"):
+        os.nice(10)  # On a single core the render loop still comes first
+    solver = TurnSolver(max_positions, time_budget)
+    while True:
+        msg = conn.recv()
+        if msg[0] == "quit":
+            return
+        _, combat, state_hash = msg
+        conn.send((state_hash, solver.solve(combat)))
+
+
+class BackgroundSolve:
+    """Runs a TurnSolver in a worker process, so a long solve never stalls the
+    render loop. Like mcts.BackgroundSearch, every call is non-blocking."""
+
+    def __init__(self, max_positions: int = 20_000, time_budget: Optional[float] = None):
+        self.max_positions = max_positions
+        self.time_budget = time_budget
+        self._conn = None
+        self._process = None
+        self._hash: Optional[int] = None  # Position the pending / latest solve is for
+        self._plan: Optional[TurnPlan] = None
+        self._failed = False
+
+    def _worker(self):
+        if self._process is None or not self._process.is_alive():
+            ctx = multiprocessing.get_context("spawn")  # Never fork the SDL process
+            self._conn, child = ctx.Pipe()
+            self._process = ctx.Process(target=_solve_worker, name="turn-solver", daemon=True,
+                                        args=(child, self.max_positions, self.time_budget))
+            self._process.start()
+        return self._conn
+
+    def _poll(self):
+        conn = self._conn
+        try:
+            while conn is not None and conn.poll():
+                state_hash, plan = conn.recv()
+                if state_hash == self._hash:  # Drop plans for positions already left
+                    self._plan = plan
+        except (EOFError, OSError):  # Worker died: the pending solve is lost
+            self._process = self._conn = None
+            self._failed = self._plan is None
+
+    # ── Control ──────────────────────────────────────────────────────────────
+
+    def request(self, combat: "CombatState"):
+        """Solve `combat` in the background; collect the plan with result()."""
+        state_hash = combat.state_hash()
+        self._hash, self._plan, self._failed = state_hash, None, False
+        try:
+            self._worker().send(("solve", combat.clone(), state_hash))
+        except OSError:
+            self._process = self._conn = None
+            self._failed = True
+
+    def cancel(self):
+        """Forget the pending solve; its plan is dropped when it arrives."""
+        self._hash, self._plan, self._failed = None, None, False
+
+    def close(self):
+        """Shut the worker down; a later request() spawns a fresh one."""
+        if self._process is not None:
+            try:
+                self._conn.send(("quit",))
+            except OSError:  # Already gone
+                pass
+            self._process.join(1.0)
+            if self._process.is_alive():
+                self._process.terminate()  # Mid-solve: it only reads the pipe between solves
+            self._conn.close()
+            self._process = self._conn = None
+        self.cancel()
+
+    # ── Results ──────────────────────────────────────────────────────────────
+
+    @property
+    def pending(self) -> bool:
+        """A requested plan has neither arrived nor been lost."""
+        self._poll()
+        return self._hash is not None and self._plan is None and not self._failed
+
+    def result(self, combat: "CombatState") -> Optional[TurnPlan]:
+        """The plan for `combat` once it has arrived, else None."""
+        self._poll()
+        if self._hash is None or self._hash != combat.state_hash():
+            return None
+        return self._plan
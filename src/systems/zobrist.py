@@ -0,0 +1,159 @@
+"""
+Zobrist hashing — 64-bit keys for combat states, for transposition tables and result caches.
+
+Every (feature, value) pair gets a fixed pseudo-random key from splitmix64, so
+keys are identical across processes and runs. Card piles are multisets and keep
+their hash incrementally as cards move (see Pile); scalar fields and statuses
+are a fixed handful of keys and are folded in when the hash is asked for.
+"""
+from __future__ import annotations
+from typing import Iterable
+
+MASK64 = (1 << 64) - 1
+_SEED = 0x5EED_DEC4_0000_0001
+
+# Feature ids. Enemy features are further keyed by the enemy's slot in the fight.
+HERO_HP, HERO_BLOCK, HERO_ENERGY, HERO_STATUS = range(4)
+ENEMY_HP, ENEMY_BLOCK, ENEMY_ACTION, ENEMY_STATUS = range(4, 8)
+PILE_DRAW, PILE_HAND, PILE_DISCARD, PILE_EXHAUST = range(8, 12)
+PHASE = 12
+
+
+def splitmix64(x: int) -> int:
+    x = (x + 0x9E3779B97F4A7C15) & MASK64
+    x = ((x ^ (x >> 30)) * 0xBF58476D1CE4E5B9) & MASK64
+    x = ((x ^ (x >> 27)) * 0x94D049BB133111EB) & MASK64
+    return x ^ (x >> 31)
+
+
+_keys: dict[tuple[int, ...], int] = {}
+
+
+def zkey(*parts: int) -> int:
+    """Key for a feature tuple such as (ENEMY_HP, slot, hp). Cached after first use."""
+    key = _keys.get(parts)
+    if key is None:
+        key = _SEED
+        for p in parts:
+            key = splitmix64(key ^ (p & MASK64))
+        _keys[parts] = key
+    return key
+
+
+class _KeyRow(dict):
+    """card id -> zkey(kind, card id) for one pile kind, filled on first use."""
+    __slots__ = ("kind",)
+
+    def __init__(self, kind: int):
+        super().__init__()
+        self.kind = kind
+
+    def __missing__(self, card_id: int) -> int:
+        key = self[card_id] = zkey(self.kind, card_id)
+        return key
+
+
+_pile_rows: dict[int, _KeyRow] = {}
+
+
+class Pile(list):
+    """A card pile that keeps a multiset hash of its cards.
+
+    The hash is the sum of one key per card id (mod 2^64), so it ignores order
+    and counts duplicates. Every mutating list method updates it; order-only
+    changes (shuffle, sort, reverse) leave it as is.
+    """
+    __slots__ = ("kind", "_keys", "_sum_keys")  # Unreduced key sum; see zhash
+
+    def __init__(self, kind: int, cards: Iterable = ()):
+        super().__init__(cards)
+        self.kind = kind
+        self._keys = _pile_rows.get(kind) or _pile_rows.setdefault(kind, _KeyRow(kind))
+        self._sum_keys = self._sum(self)
+
+    def _sum(self, cards: Iterable) -> int:
+        keys = self._keys
+        return sum([keys[c.id] for c in cards])
+
+    @property
+    def zhash(self) -> int:
+        return self._sum_keys & MASK64
+
+    # ── Mutators ─────────────────────────────────────────────────────────────
+
+    def append(self, card):
+        list.append(self, card)
+        self._sum_keys += self._keys[card.id]
+
+    def insert(self, index, card):
+        list.insert(self, index, card)
+        self._sum_keys += self._keys[card.id]
+
+    def extend(self, cards):
+        cards = list(cards)
+        list.extend(self, cards)
+        self._sum_keys += self._sum(cards)
+
+    def __iadd__(self, cards):
+        self.extend(cards)
+        return self
+
+    def pop(self, index=-1):
+        card = list.pop(self, index)
+        self._sum_keys -= self._keys[card.id]
+        return card
+
+    def remove(self, card):
+        list.remove(self, card)
+        self._sum_keys -= self._keys[card.id]
+
+    def clear(self):
+        list.clear(self)
+        self._sum_keys = 0
+
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            value = list(value)
+            delta = self._sum(value) - self._sum(self[index])
+        else:
+            delta = self._keys[value.id] - self._keys[self[index].id]
+        list.__setitem__(self, index, value)
+        self._sum_keys += delta
+
+    def __delitem__(self, index):
+        if isinstance(index, slice):
+            delta = self._sum(self[index])
+        else:
+            delta = self._keys[self[index].id]
+        list.__delitem__(self, index)
+        self._sum_keys -= delta
+
+    # ── Helpers ──────────────────────────────────────────────────────────────
+
+    def shuffle(self, rng):
+        """Shuffle in place without going through the hashing __setitem__."""
+        cards = list(self)
+        rng.shuffle(cards)
+        list.__setitem__(self, slice(None), cards)
+
+    def reset(self, cards: Iterable = ()):
+        list.__setitem__(self, slice(None), cards)
+        self._sum_keys = self._sum(self)
+
+    def copy(self) -> "Pile":
+        new = Pile.__new__(Pile)
+        list.extend(new, self)
+        new.kind = self.kind
+        new._sum_keys = self._sum_keys
+        new._keys = self._keys
+        return new
+
+    def __reduce__(self):
+        return Pile, (self.kind, list(self))
+
+
+def fold_statuses(statuses, feature: int, slot: int = 0) -> int:
+    h = 0
+    for status_id, stacks in statuses.items():
+        h ^= zkey(feature, slot, status_id, stacks)
+    return h
@@ -0,0 +1,8 @@
+"""
+NumPy batch engine parity with the scalar combat engine.
+"""
+from src.sim.batch import VERIFY_CORPUS, verify
+
+
+def test_batch_matches_scalar_engine_on_corpus():
+    assert verify(VERIFY_CORPUS, fights=20) == 0
@@ -0,0 +1,102 @@
+"""
+Fast card play: CombatState.play_fast and the batched play_actions.
+"""
+from src.sim.combat_runner import make_enemy, make_hero
+from src.systems.combat import CombatPhase, CombatState
+
+
+def _combat(deck=None) -> CombatState:
+    combat = CombatState(make_hero(deck, seed=0), [make_enemy("Jaw Worm"), make_enemy("Louse")],
+                         record_events=False)
+    combat.start_combat()
+    return combat
+
+
+def _play_cards(combat: CombatState, actions) -> int:
+    """The same actions through play_card, with the same stopping rule."""
+    applied = 0
+    for hand_index, target_index in actions:
+        hand = combat.hero.hand
+        if not 0 <= hand_index < len(hand):
+            break
+        card = hand[hand_index]
+        target = combat.enemies[target_index] if card.targeted else None
+        if not combat.play_card(card, target, hand_index):
+            break
+        applied += 1
+        if combat.phase is not CombatPhase.PLAYER_TURN:
+            break
+    return applied
+
+
+def _check_against_play_card(combat: CombatState, actions):
+    reference = combat.clone()
+    hero_hp = reference.hero.current_hp
+    enemy_hp = sum(e.current_hp for e in reference.enemies)
+
+    result = combat.play_actions(actions)
+    applied = _play_cards(reference, actions)
+
+    assert result.applied == applied
+    assert result.hero_hp_lost == hero_hp - reference.hero.current_hp
+    assert result.enemy_hp_lost == enemy_hp - sum(e.current_hp for e in reference.enemies)
+    assert result.phase == reference.phase
+    assert combat.state_hash() == reference.state_hash()
+    return result
+
+
+def test_stops_at_first_unaffordable_card():
+    combat = _combat()  # Five 1-cost starter cards, 3 energy
+    result = _check_against_play_card(combat, [(0, 0), (0, 1), (0, 0), (0, 0), (0, 1)])
+    assert result.applied == 3
+    assert combat.hero.energy == 0
+
+
+def test_counts_hp_lost_and_stops_past_end_of_hand():
+    combat = _combat(["Bloodletting", "Strike", "Strike", "Strike", "Strike"])
+    bloodletting = [c.name for c in combat.hero.hand].index("Bloodletting")
+    actions = [(bloodletting, -1)] + [(0, 0)] * 4 + [(0, 0)]  # The last one is past the hand
+    result = _check_against_play_card(combat, actions)
+    assert result.applied == 5
+    assert result.hero_hp_lost == 3
+    assert result.enemy_hp_lost > 0
+    assert not combat.hero.hand
+
+
+def _unchanged(combat: CombatState, before: CombatState) -> bool:
+    return (combat.state_hash() == before.state_hash()
+            and combat.hero.energy == before.hero.energy
+            and len(combat.hero.hand) == len(before.hero.hand))
+
+
+def test_play_fast_rejects_bad_hand_index():
+    combat = _combat()
+    before = combat.clone()
+    assert not combat.play_fast(len(combat.hero.hand), 0)
+    assert not combat.play_fast(-1, 0)
+    assert _unchanged(combat, before)
+
+
+def test_play_fast_rejects_missing_or_bad_target():
+    combat = _combat(["Strike"] * 5)
+    before = combat.clone()
+    assert not combat.play_fast(0)
+    assert not combat.play_fast(0, None)
+    assert not combat.play_fast(0, len(combat.enemies))
+    assert not combat.play_fast(0, -1)
+    assert _unchanged(combat, before)
+
+
+def test_play_fast_rejects_dead_target():
+    combat = _combat(["Strike"] * 5)
+    combat.enemies[1].current_hp = 0
+    before = combat.clone()
+    assert not combat.play_fast(0, 1)
+    assert _unchanged(combat, before)
+    assert combat.play_fast(0, 0)
+
+
+def test_untargeted_card_needs_no_target():
+    combat = _combat(["Defend"] * 5)
+    assert combat.play_fast(0)
+    assert combat.hero.block > 0
@@ -0,0 +1,32 @@
+"""
+Enemy templates and floor scaling.
+"""
+import src.constants as constants
+from src.models.enemy import (SCALED_STATS_CACHE_SIZE, SLIME, TIER3_ENEMIES, _scaled,
+                              get_enemy_for_floor, scaled_stats)
+
+
+def test_floor_one_slime_shares_template_actions():
+    enemy = get_enemy_for_floor(1)
+    assert enemy.max_hp == SLIME.max_hp
+    assert enemy.action_pattern == SLIME.actions
+    assert all(a is b for a, b in zip(enemy.action_pattern, SLIME.actions))
+
+
+def test_scaled_stats_follow_scaling_constants(monkeypatch):
+    assert scaled_stats(SLIME, 5)[0] == 56
+    monkeypatch.setattr(constants, "ENEMY_HP_SCALE_PER_FLOOR", 1.0)
+    monkeypatch.setattr(constants, "ENEMY_DMG_SCALE_PER_FLOOR", 1.0)
+    max_hp, actions = scaled_stats(SLIME, 5)
+    assert max_hp == 175
+    assert [a.value for a in actions] == [25, 25, 8]
+    monkeypatch.undo()
+    assert scaled_stats(SLIME, 5)[0] == 56
+
+
+def test_scaled_stats_cache_is_bounded():
+    for floor in range(1, 2 * SCALED_STATS_CACHE_SIZE):  # Endless runs keep climbing
+        for template in TIER3_ENEMIES:
+            scaled_stats(template, floor, elite=floor % 2 == 0)
+    assert _scaled.cache_info().currsize <= SCALED_STATS_CACHE_SIZE
+    assert scaled_stats(SLIME, 5)[0] == 56  # Evicted entries are simply recomputed
@@ -0,0 +1,26 @@
+"""
+Route planner caching.
+"""
+import random
+
+from src.models.hero import Hero
+from src.systems.dungeon import Dungeon
+from src.systems.route_planner import RoutePlanner
+
+
+def test_plans_each_dungeon_in_turn():
+    planner, hero = RoutePlanner(), Hero()
+    first, second = Dungeon(rng=random.Random(1)), Dungeon(rng=random.Random(2))
+    for dungeon in (first, second, first, second):
+        route = planner.plan(dungeon, hero)
+        assert route.node_ids == RoutePlanner().plan(dungeon, hero).node_ids
+        assert all(node_id in dungeon.nodes for node_id in route.node_ids)
+
+
+def test_new_dungeon_never_gets_a_collected_dungeons_route():
+    # A fresh Dungeon often reuses the id() of the one just collected
+    planner, hero = RoutePlanner(), Hero()
+    for seed in range(50):
+        dungeon = Dungeon(rng=random.Random(seed))
+        assert planner.plan(dungeon, hero).node_ids == RoutePlanner().plan(dungeon, hero).node_ids
+        del dungeon
@@ -0,0 +1,17 @@
+"""
+Monte Carlo run simulator.
+"""
+import src.constants as constants
+from src.sim.runs import simulate
+
+
+def test_in_process_simulate_restores_scaling_constants():
+    before = constants.ENEMY_HP_SCALE_PER_FLOOR, constants.ENEMY_DMG_SCALE_PER_FLOOR
+    simulate(2, workers=1, hp_step=1.0, dmg_step=0.5)
+    assert (constants.ENEMY_HP_SCALE_PER_FLOOR, constants.ENEMY_DMG_SCALE_PER_FLOOR) == before
+
+
+def test_scaling_override_does_not_leak_into_later_simulations():
+    fresh = simulate(10, workers=1, hp_step=1.0)
+    simulate(10, workers=1, hp_step=0.15)
+    assert simulate(10, workers=1, hp_step=1.0).kills_total == fresh.kills_total
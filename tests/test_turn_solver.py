@@ -0,0 +1,47 @@
+"""
+Turn solver limits and hidden information.
+"""
+import random
+
+from src.models.card import make_card
+from src.sim.combat_runner import make_enemy, make_hero
+from src.systems.combat import CombatState
+from src.systems.mcts import END_TURN
+from src.systems.turn_solver import TurnSolver
+
+
+def _combat() -> CombatState:
+    combat = CombatState(make_hero(seed=0), [make_enemy("Jaw Worm"), make_enemy("Louse")],
+                         record_events=False)
+    combat.start_combat()
+    return combat
+
+
+def test_uncapped_plan_is_exact():
+    plan = TurnSolver().solve(_combat())
+    assert not plan.truncated
+    assert plan.moves[-1] == END_TURN
+
+
+def test_position_cap_marks_plan_truncated():
+    plan = TurnSolver(max_positions=3).solve(_combat())
+    assert plan.truncated
+    assert plan.positions < TurnSolver().solve(_combat()).positions
+    assert plan.moves[-1] == END_TURN
+
+
+def test_time_budget_marks_plan_truncated():
+    assert TurnSolver(time_budget=0.0).solve(_combat()).truncated
+
+
+def test_plan_does_not_depend_on_the_hidden_draw_order():
+    combat = _combat()
+    hero = combat.hero
+    hero.hand.reset([make_card(n) for n in ("Battle Trance", "Strike", "Defend")])
+    pile = [make_card(n) for n in ("Bash", "Defend", "Strike", "Twin Strike", "Defend", "Pommel Strike")]
+    hero.draw_pile.reset(pile)
+    other = combat.clone()
+    other.hero.draw_pile.reset(pile[::-1])  # Same cards, another order
+
+    plan = TurnSolver(rng=random.Random(7)).solve(combat)
+    assert TurnSolver(rng=random.Random(7)).solve(other).moves == plan.moves